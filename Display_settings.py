@@ -43,13 +43,23 @@ PERFORMANCE_SETTINGS = {
         "charge_up_particles": 150,
         "swirl_particle_regeneration": 0.1,
         "explosion_particles_per_hit": 3,
+        "physics_tick_rate": 50,  # Fixed simulation ticks per second
+        "max_catch_up_steps": 5,  # Ticks run at most per rendered frame
+        "render_fps": 50,  # Render rate cap; gameplay speed follows the tick rate
+        "dirty_rect_rendering": False,  # Flip the whole screen every frame
+        "dirty_rect_threshold": 0.4,  # Dirty screen fraction above which to flip
     },
     "QBOARD": {
         "collision_check_frequency": 2,  # Check collisions every 2 frames
-        "particle_glow_effects": False,  # Disable glow effects
+        "particle_glow_effects": True,  # Cached dot sprites make glow a single blit
         "charge_up_particles": 75,  # Reduce charge-up particles
         "swirl_particle_regeneration": 0.05,  # Reduce regeneration frequency
         "explosion_particles_per_hit": 2,  # Fewer explosion particles
+        "physics_tick_rate": 50,
+        "max_catch_up_steps": 5,
+        "render_fps": 50,  # Can be lowered on weak classroom PCs
+        "dirty_rect_rendering": True,  # Update only changed regions on software renderers
+        "dirty_rect_threshold": 0.6,  # Idle letter levels cover about half the screen
     },
 }
 
@@ -78,6 +78,14 @@ from utils.particle_system import ParticleManager
 
 # Import ResourceManager
 from utils.resource_manager import ResourceManager
+from unified_physics import UnifiedPhysicsSystem
+from utils.explosion_renderer import ExplosionRenderer
+
+# Shared physics index for explosion pushes
+explosion_physics = UnifiedPhysicsSystem(WIDTH, HEIGHT)
+
+# Pre-rendered expansion discs, warmed per flame color in init_resources()
+explosion_renderer = ExplosionRenderer()
 
 # Initialize global event tracking system early
 event_manager = get_event_manager()
@@ -146,6 +154,9 @@ def init_resources():
     # Initialize flamethrower manager
     flamethrower_manager = FlamethrowerManager()
 
+    # Render explosion discs now rather than on each color's first explosion
+    explosion_renderer.prewarm(FLAME_COLORS)
+
     # Initialize sound manager
     global sound_manager
     sound_manager = SoundManager()
@@ -565,19 +576,8 @@ def well_done_screen(score):
 
 def apply_explosion_effect(x, y, explosion_radius, letters):
     """Pushes nearby letters away from an explosion center."""
-    for letter in letters:
-        dx = letter["x"] - x
-        dy = letter["y"] - y
-        dist_sq = dx * dx + dy * dy
-        if dist_sq < explosion_radius * explosion_radius and dist_sq > 0:
-            dist = math.sqrt(dist_sq)
-            # Force is stronger closer to the center
-            force = (1 - (dist / explosion_radius)) * 15  # Adjust force multiplier as needed
-            # Apply force directly to velocity
-            letter["dx"] += (dx / dist) * force
-            letter["dy"] += (dy / dist) * force
-            # Ensure the item can bounce after being pushed
-            letter["can_bounce"] = True
+    # Force is stronger closer to the center; pushed items can bounce afterwards
+    explosion_physics.apply_explosion_force(x, y, explosion_radius, letters)
 
 
 def create_player_trail(x, y):
@@ -642,16 +642,6 @@ def start_charge_up_effect(player_x, player_y, target_x, target_y):
 
 
 # Legacy functions - now handled by CenterPieceManager
-def get_particle_from_pool():
-    """Legacy function that now uses the particle manager."""
-    return particle_manager.get_particle()
-
-
-def release_particle(particle):
-    """Legacy function that now uses the particle manager."""
-    particle_manager.release_particle(particle)
-
-
 def create_particle(x, y, color, size, dx, dy, duration):
     """Legacy function that now uses the particle manager."""
     return particle_manager.create_particle(x, y, color, size, dx, dy, duration)
@@ -699,23 +689,7 @@ def create_explosion(x, y, color=None, max_radius=270, duration=30):
 
 def draw_explosion(explosion, offset_x=0, offset_y=0):
     """Draws a single explosion frame, expanding and fading."""
-    # Expand radius towards max_radius
-    explosion["radius"] += (
-        explosion["max_radius"] - explosion["radius"]
-    ) * 0.1  # Smoother expansion
-    # Calculate alpha based on remaining duration
-    alpha = max(0, int(255 * (explosion["duration"] / explosion["start_duration"])))
-    color = (*explosion["color"][:3], alpha)  # Add alpha to color
-    radius = int(explosion["radius"])
-    # Apply shake offset
-    draw_x = int(explosion["x"] + offset_x)
-    draw_y = int(explosion["y"] + offset_y)
-
-    # Draw using SRCALPHA surface for transparency
-    if radius > 0:
-        explosion_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(explosion_surf, color, (radius, radius), radius)
-        screen.blit(explosion_surf, (draw_x - radius, draw_y - radius))
+    return explosion_renderer.draw(screen, explosion, offset_x, offset_y)
 
 
 def create_flame_effect(start_x, start_y, end_x, end_y):
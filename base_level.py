@@ -15,14 +15,66 @@ from settings import (
 )
 from universal_class import (
     GlassShatterManager, HUDManager, MultiTouchManager,
-    CheckpointManager, CenterPieceManager, FlamethrowerManager, SoundManager
+    CheckpointManager, CenterPieceManager, FlamethrowerManager, SoundManager,
+    StarFieldManager
 )
 
 
+class _BodyColumn:
+    """
+    Descriptor for a physics attribute of BaseGameObject.
+
+    Unbound objects keep the value on the instance. Once bound to a
+    PhysicsBodyStore the attribute reads and writes the object's row in the
+    matching NumPy column, so batched physics and per-object code agree.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.local_name = "_" + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is None:
+            return getattr(obj, self.local_name)
+        return getattr(store, self.name)[obj._row].item()
+
+    def __set__(self, obj, value):
+        store = obj._store
+        if store is None:
+            setattr(obj, self.local_name, value)
+        else:
+            getattr(store, self.name)[obj._row] = value
+
+
 class BaseGameObject:
     """Base class for all game objects (letters, numbers, emojis, etc.)"""
 
+    # Physics state, backed by a PhysicsBodyStore row when bound
+    PHYSICS_FIELDS = (
+        "x", "y", "dx", "dy", "mass", "size", "collision_scale", "can_bounce", "alive"
+    )
+
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("_store", "_row") + tuple("_" + name for name in PHYSICS_FIELDS) + (
+        "value", "type", "rect", "color", "surface"
+    )
+
+    x = _BodyColumn()
+    y = _BodyColumn()
+    dx = _BodyColumn()
+    dy = _BodyColumn()
+    mass = _BodyColumn()
+    size = _BodyColumn()
+    collision_scale = _BodyColumn()
+    can_bounce = _BodyColumn()
+    alive = _BodyColumn()
+
     def __init__(self, x: float, y: float, value: str, obj_type: str = "generic"):
+        self._store = None
+        self._row = -1
         self.x = x
         self.y = y
         self.value = value
@@ -30,6 +82,7 @@ class BaseGameObject:
         self.dx = 0.0
         self.dy = 0.0
         self.size = 240
+        self.collision_scale = 1 / 1.8  # Collision radius is size / 1.8
         self.mass = random.uniform(100, 160)
         self.can_bounce = False
         self.alive = True
@@ -37,6 +90,41 @@ class BaseGameObject:
         self.color = BLACK
         self.surface = None  # For emoji objects
 
+    @property
+    def store(self):
+        """The PhysicsBodyStore this object is a view into, if any."""
+        return self._store
+
+    @property
+    def row(self) -> int:
+        """Row index in the bound store, or -1 when unbound."""
+        return self._row
+
+    def bind(self, store) -> int:
+        """Move this object's physics state into a row of the given store."""
+        if self._store is not None:
+            self.unbind()
+        values = [getattr(self, name) for name in self.PHYSICS_FIELDS]
+        row = store.allocate(self)
+        self._store = store
+        self._row = row
+        for name, value in zip(self.PHYSICS_FIELDS, values):
+            setattr(self, name, value)
+        return row
+
+    def unbind(self):
+        """Copy state back onto the object and release the store row."""
+        store = self._store
+        if store is None:
+            return
+        values = [getattr(self, name) for name in self.PHYSICS_FIELDS]
+        row = self._row
+        self._store = None
+        self._row = -1
+        for name, value in zip(self.PHYSICS_FIELDS, values):
+            setattr(self, name, value)
+        store.release(row)
+
     def update_physics(self, width: int, height: int, bounce_damping: float = 0.8):
         """Update object physics including position and bouncing."""
         self.x += self.dx
@@ -70,13 +158,40 @@ class BaseGameObject:
                     self.dx -= random.uniform(0.1, 0.3)
 
     def get_rect(self) -> pygame.Rect:
-        """Get collision rectangle for the object."""
-        return pygame.Rect(
-            self.x - self.size / 2,
-            self.y - self.size / 2,
-            self.size,
-            self.size
-        )
+        """Get collision rectangle for the object, updated in place."""
+        size = self.size
+        self.rect.update(self.x - size / 2, self.y - size / 2, size, size)
+        return self.rect
+
+
+class EmojiObject(BaseGameObject):
+    """Falling emoji that belongs to a target letter."""
+
+    __slots__ = ("letter", "emoji_index", "emoji_type", "hit")
+
+    def __init__(self, x: float, y: float, value: str, letter: str, surface=None):
+        super().__init__(x, y, value, "emoji")
+        self.letter = letter
+        self.emoji_index = 0
+        self.emoji_type = None
+        self.hit = False
+        self.surface = surface
+
+
+class ColorDot(BaseGameObject):
+    """Bouncing dot in the colors level."""
+
+    __slots__ = ("target",)
+
+    def __init__(self, x: float, y: float, value: str, color, target: bool = False):
+        super().__init__(x, y, value, "color_dot")
+        self.color = color
+        self.target = target
+
+    @property
+    def radius(self) -> float:
+        """Collision radius; the physics pipeline collides bodies at size * collision_scale."""
+        return self.size * self.collision_scale
 
 
 class BaseLevel(ABC):
@@ -170,8 +285,8 @@ class BaseLevel(ABC):
         # Game state
         self.reset_game_state()
 
-        # Background stars
-        self.stars = self._create_background_stars()
+        # Background stars, pre-rendered into a scrolling tile
+        self.star_field = StarFieldManager(width, height)
 
     def reset_game_state(self):
         """Reset common game state variables."""
@@ -214,16 +329,6 @@ class BaseLevel(ABC):
         self.abilities = ["laser", "aoe", "charge_up"]
         self.current_ability = "laser"
 
-    def _create_background_stars(self) -> List[List]:
-        """Create background stars for the level."""
-        stars = []
-        for _ in range(100):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            radius = random.randint(2, 4)
-            stars.append([x, y, radius])
-        return stars
-
     def _handle_common_events(self) -> Optional[str]:
         """Handle common pygame events. Returns 'menu' if should exit to menu."""
         for event in pygame.event.get():
@@ -434,7 +539,7 @@ class BaseLevel(ABC):
             return False
         return False
 
-    def _draw_common_frame(self, stars: List[List]):
+    def _draw_common_frame(self):
         """Draw common frame elements."""
         # Update glass shatter manager
         self.glass_shatter_manager.update()
@@ -449,7 +554,7 @@ class BaseLevel(ABC):
         self.glass_shatter_manager.draw_cracks(self.screen)
 
         # Draw stars
-        self._draw_stars(stars, offset_x, offset_y)
+        self._draw_stars(offset_x, offset_y)
 
         # Draw center piece
         self.center_piece_manager.update_and_draw(
@@ -465,17 +570,9 @@ class BaseLevel(ABC):
         # Draw HUD
         self._draw_hud()
 
-    def _draw_stars(self, stars: List[List], offset_x: float, offset_y: float):
-        """Draw and update background stars."""
-        for star in stars:
-            x, y, radius = star
-            y += 1
-            pygame.draw.circle(self.screen, (200, 200, 200), (x + offset_x, y + offset_y), radius)
-            if y > self.height + radius:
-                y = random.randint(-50, -10)
-                x = random.randint(0, self.width)
-            star[1] = y
-            star[0] = x
+    def _draw_stars(self, offset_x: float, offset_y: float) -> List[pygame.Rect]:
+        """Scroll and draw background stars, returning the rect of each star."""
+        return self.star_field.draw(self.screen, offset_x, offset_y)
 
     def _draw_game_objects(self, offset_x: float, offset_y: float):
         """Draw all game objects. Override in subclasses for specific rendering."""
@@ -576,7 +673,7 @@ class BaseLevel(ABC):
                 return progression_result
 
             # Draw frame
-            self._draw_common_frame(self.stars)
+            self._draw_common_frame()
 
             # Update frame counter and display
             self.frame_count += 1
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Headless Physics Simulator for SS6 Super Student Game
+Runs level spawning and unified physics without a display for balancing and load tests.
+"""
+
+import argparse
+import itertools
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+from settings import LETTER_SPAWN_INTERVAL
+from unified_physics import UnifiedObjectFactory, UnifiedPhysicsSystem
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080
+
+# Object kinds spawned through UnifiedObjectFactory.spawn_next, the same step
+# the levels use: alphabet letters, numbers, shapes and C/L case letters.
+# Emoji companions (alphabet and C/L case) need ResourceManager surfaces and
+# are not simulated, so those levels carry about two more bodies in real play.
+SPAWN_MODES = ("letter", "number", "shape", "case_letter")
+
+DEFAULT_PARAMS = {
+    "mode": "letter",
+    "objects": 26,
+    "spawn_interval": LETTER_SPAWN_INTERVAL,
+    "size": 240,
+    "mass_scale": 1.0,
+    "collision_strategy": "sweep",
+    "collision_frequency": 2,
+    "ccd": True,
+    "max_ticks": 6000,
+    "settle_speed": 2.0,
+    "width": SCREEN_WIDTH,
+    "height": SCREEN_HEIGHT,
+    "seed": 1,
+}
+
+
+def _pileup_count(objects: List[Any], height: float) -> int:
+    """Bodies resting against the floor, one body height deep."""
+    return sum(1 for obj in objects if obj.y >= height - obj.size * 1.5)
+
+
+def _escaped_rows(physics: UnifiedPhysicsSystem, width: float, height: float) -> np.ndarray:
+    """Mask over active rows of bodies fully off screen and moving away from it."""
+    b = physics.bodies
+    rows = b.active_rows()
+    x, y, dx, dy = b.x[rows], b.y[rows], b.dx[rows], b.dy[rows]
+    half = b.size[rows] / 2
+    return (
+        ((x + half < 0) & (dx <= 0))
+        | ((x - half > width) & (dx >= 0))
+        | ((y + half < 0) & (dy <= 0))
+        | ((y - half > height) & (dy >= 0))
+    )
+
+
+def _max_speed(physics: UnifiedPhysicsSystem, width: float, height: float) -> float:
+    """Fastest speed in px/tick of the bodies still in play; sleeping bodies are still."""
+    b = physics.bodies
+    rows = b.active_rows()[~_escaped_rows(physics, width, height)]
+    if not len(rows):
+        return 0.0
+    return float(np.hypot(b.dx[rows], b.dy[rows]).max())
+
+
+def simulate(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run one headless level simulation until the pile settles or max_ticks.
+
+    Objects spawn through the levels' own spawn step, one every spawn_interval
+    ticks at a random x above the screen (see SPAWN_MODES for what is left
+    out). The pile counts as settled once everything has spawned and every
+    body still in play is asleep or slower than settle_speed. Bodies knocked
+    off screen and moving away never come back; they are counted as escaped.
+
+    Args:
+        params: Overrides for DEFAULT_PARAMS
+
+    Returns:
+        Dict with the parameters plus collision, pile-up and settle metrics
+    """
+    config = dict(DEFAULT_PARAMS, **(params or {}))
+    if config["mode"] not in SPAWN_MODES:
+        raise ValueError(f"unsupported mode '{config['mode']}', expected one of {SPAWN_MODES}")
+    random.seed(config["seed"])
+    width, height = config["width"], config["height"]
+
+    physics = UnifiedPhysicsSystem(
+        width, height, collision_strategy=config["collision_strategy"], seed=config["seed"]
+    )
+    physics.collision_frequency = config["collision_frequency"]
+    physics.ccd_enabled = config["ccd"]
+    factory = UnifiedObjectFactory()
+
+    objects = []
+    to_spawn = [str(index) for index in range(config["objects"])]
+    collisions = 0
+    swept_contacts = 0
+    peak_contacts = 0
+    peak_pileup = 0
+    last_spawn_tick = 0
+    settle_tick = None
+
+    start = time.perf_counter()
+    tick = 0
+    while tick < config["max_ticks"]:
+        obj = factory.spawn_next(
+            config["mode"], to_spawn, tick, physics, width, config["spawn_interval"]
+        )
+        if obj is not None:
+            obj.size = config["size"]
+            obj.mass *= config["mass_scale"]
+            objects.append(obj)
+            last_spawn_tick = tick
+
+        physics.step()
+        if tick % physics.collision_frequency == 0:
+            physics.handle_object_collisions(objects, tick)
+            stats = physics.collision_stats
+            collisions += stats["contacts"]
+            swept_contacts += stats["swept_contacts"]
+            peak_contacts = max(peak_contacts, stats["contacts"])
+            peak_pileup = max(peak_pileup, _pileup_count(objects, height))
+            if not to_spawn and _max_speed(physics, width, height) < config["settle_speed"]:
+                settle_tick = tick
+                tick += 1
+                break
+        tick += 1
+    elapsed = time.perf_counter() - start
+
+    result = dict(config)
+    result.update(
+        {
+            "ticks": tick,
+            "ticks_per_second": tick / elapsed if elapsed > 0 else float("inf"),
+            "collisions": collisions,
+            "swept_contacts": swept_contacts,
+            "peak_contacts": peak_contacts,
+            "peak_pileup": peak_pileup,
+            "sleeping": physics.collision_stats["sleeping"],
+            "escaped": int(np.count_nonzero(_escaped_rows(physics, width, height))),
+            "settled": settle_tick is not None,
+            "time_to_settle": None if settle_tick is None else settle_tick - last_spawn_tick,
+        }
+    )
+    return result
+
+
+def parameter_grid(**axes: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Expand axes such as spawn_interval=[30, 60] into every combination."""
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+def run_sweep(grid: List[Dict[str, Any]], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Simulate every parameter set, spread over worker processes.
+
+    Args:
+        grid: Parameter overrides, one simulation each
+        workers: Process count; None uses every core, 1 runs in-process
+    """
+    if workers == 1:
+        return [simulate(params) for params in grid]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(simulate, grid))
+
+
+def print_results(results: List[Dict[str, Any]], axes: List[str]):
+    """Print one row per simulation with the swept parameters first."""
+    header = "".join(f"{name:>20}" for name in axes)
+    print(f"{header}{'ticks/s':>10}{'collisions':>11}{'peak pile':>10}{'settle':>8}")
+    for r in results:
+        values = "".join(f"{str(r[name]):>20}" for name in axes)
+        settle = r["time_to_settle"] if r["settled"] else "-"
+        print(
+            f"{values}{r['ticks_per_second']:>10.0f}{r['collisions']:>11}"
+            f"{r['peak_pileup']:>10}{str(settle):>8}"
+        )
+    print(f"mean ticks/s: {statistics.mean(r['ticks_per_second'] for r in results):.0f}")
+
+
+def _parse_axis(text: str):
+    """Parse NAME=V1,V2,... into a name and typed values."""
+    name, _, values = text.partition("=")
+    if name not in DEFAULT_PARAMS:
+        raise argparse.ArgumentTypeError(f"unknown parameter '{name}'")
+    kind = type(DEFAULT_PARAMS[name])
+    if kind is bool:
+        return name, [value.lower() in ("1", "true", "yes") for value in values.split(",")]
+    return name, [kind(value) for value in values.split(",")]
+
+
+def main():
+    """Main simulator entry point."""
+    parser = argparse.ArgumentParser(description="SS6 headless physics simulator")
+    parser.add_argument(
+        "--sweep",
+        type=_parse_axis,
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2",
+        help="parameter axis to sweep, e.g. spawn_interval=30,60 (repeatable)",
+    )
+    parser.add_argument("--mode", choices=SPAWN_MODES, default="letter")
+    parser.add_argument("--objects", type=int, default=DEFAULT_PARAMS["objects"])
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_PARAMS["max_ticks"])
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+
+    base = {"mode": args.mode, "objects": args.objects, "max_ticks": args.max_ticks}
+    axes = dict(args.sweep) or {"seed": [DEFAULT_PARAMS["seed"]]}
+    grid = [dict(base, **params) for params in parameter_grid(**axes)]
+
+    print(f"🧪 Simulating {len(grid)} parameter set(s) headless")
+    print_results(run_sweep(grid, args.workers), list(axes))
+
+
+if __name__ == "__main__":
+    main()
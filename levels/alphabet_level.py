@@ -1,13 +1,12 @@
-import math
 import random
 import pygame
 from typing import List, Dict, Any
 
+from Display_settings import PERFORMANCE_SETTINGS
 from settings import (
     BLACK,
     FLAME_COLORS,
     GROUP_SIZE,
-    LETTER_SPAWN_INTERVAL,
     LEVEL_PROGRESS_PATH,
     SEQUENCES,
     WHITE,
@@ -17,11 +16,13 @@ from unified_physics import UnifiedObjectFactory, UnifiedTargetSystem, UnifiedPh
 from universal_class import (
     CenterPieceManager,
     CheckpointManager,
+    DirtyRectManager,
     FlamethrowerManager,
     GlassShatterManager,
     HUDManager,
     MultiTouchManager,
 )
+from utils.texture_atlas import get_sprite_batcher
 
 
 class AlphabetLevel(BaseLevel):
@@ -106,7 +107,16 @@ class AlphabetLevel(BaseLevel):
         # Initialize unified systems
         self.object_factory = UnifiedObjectFactory(resource_manager)
         self.target_system = UnifiedTargetSystem()
-        self.physics_system = UnifiedPhysicsSystem(width, height)
+        self.physics_system = UnifiedPhysicsSystem(width, height, collision_strategy="sweep")
+
+        # Fixed-timestep simulation, rendered at the display mode's frame rate
+        timing = PERFORMANCE_SETTINGS.get(
+            center_piece_manager.display_mode, PERFORMANCE_SETTINGS["DEFAULT"]
+        )
+        self.physics_system.configure_timestep(timing)
+        self.render_fps = timing["render_fps"]
+        self.dirty_rects = DirtyRectManager.from_settings(width, height, timing)
+        self.sprite_batcher = get_sprite_batcher()
 
         # Alphabet-specific configuration
         self.sequence = SEQUENCES["alphabet"]
@@ -141,6 +151,7 @@ class AlphabetLevel(BaseLevel):
         # Game state
         self.running = True
         self.game_started = False
+        self.physics_system.clear()
         self.letters = []
         self.letters_to_spawn = self.current_group.copy()
         self.frame_count = 0
@@ -183,28 +194,22 @@ class AlphabetLevel(BaseLevel):
         """
         self.reset_level_state()
 
-        # Initialize background stars
-        stars = []
-        for _ in range(100):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            radius = random.randint(2, 4)
-            stars.append([x, y, radius])
+        # Fresh background stars for this run
+        self.star_field.reset()
 
         # Main game loop
         clock = pygame.time.Clock()
+        self.physics_system.timestep.reset()
+        frame_seconds = self.physics_system.timestep.tick_seconds
+        self.dirty_rects.invalidate()
 
         while self.running:
             # Handle events
             if not self._handle_events():
                 return False
 
-            # Spawn letters
-            if self.game_started:
-                self._spawn_letters()
-
-            # Update physics and collisions
-            self._update_letters()
+            # Spawn letters and update physics in fixed ticks
+            self.physics_system.advance(frame_seconds, self._simulation_tick)
 
             # Handle checkpoint logic
             self._handle_checkpoint_logic()
@@ -215,19 +220,28 @@ class AlphabetLevel(BaseLevel):
                 return progression_result
 
             # Draw frame
-            self._draw_frame(stars)
+            self._draw_frame()
 
-            # Update frame counter and display
-            self.frame_count += 1
-            pygame.display.flip()
-            fps = clock.tick(50)
+            # Update display
+            self.sprite_batcher.end_frame()
+            self.dirty_rects.present()
+            fps = clock.tick(self.render_fps)
+            frame_seconds = fps / 1000.0
 
             # Track performance metrics
-            if self.event_manager and self.frame_count % 30 == 0:  # Track every 30 frames
+            if self.event_manager and self.frame_count % 30 == 0:  # Track every 30 ticks
                 self.event_manager.get_tracker("performance").track_frame(fps)
 
         return False
 
+    def _simulation_tick(self):
+        """Advance spawning, physics and collisions by one fixed tick."""
+        self.physics_system.apply_queued_explosions({"letter": self.letters})
+        if self.game_started:
+            self._spawn_letters()
+        self._update_letters()
+        self.frame_count += 1
+
     def _handle_events(self):
         """Handle all pygame events."""
         for event in pygame.event.get():
@@ -268,13 +282,16 @@ class AlphabetLevel(BaseLevel):
                         # Flag to track if click hit a target
                         hit_target = False
 
+                        # Wake resting items around the click
+                        self.physics_system.wake_bodies(click_x, click_y, 150, self.letters)
+
                         # Process Click on Target (letters and emojis)
                         for obj in self.letters[:]:
-                            if obj["rect"].collidepoint(click_x, click_y):
+                            if obj.rect.collidepoint(click_x, click_y):
                                 hit_target = True
 
                                 # Check if this object is part of current target
-                                obj_id = obj["value"]
+                                obj_id = obj.value
                                 if (
                                     obj_id in self.targets_needed
                                     and obj_id not in self.current_target_hits
@@ -284,26 +301,24 @@ class AlphabetLevel(BaseLevel):
                                     self.score += 10
 
                                     # Play voice sound for letters
-                                    if obj.get("type") == "letter" and self.sound_manager:
-                                        self.sound_manager.play_voice(obj["value"])
+                                    if obj.type == "letter" and self.sound_manager:
+                                        self.sound_manager.play_voice(obj.value)
 
                                     # Common destruction effects
-                                    self.create_explosion(obj["x"], obj["y"])
+                                    self.create_explosion(obj.x, obj.y)
                                     self.create_flame_effect(
-                                        self.player_x, self.player_y - 80, obj["x"], obj["y"]
+                                        self.player_x, self.player_y - 80, obj.x, obj.y
                                     )
                                     self.center_piece_manager.trigger_convergence(
-                                        obj["x"], obj["y"]
-                                    )
-                                    self.apply_explosion_effect(
-                                        obj["x"], obj["y"], 150, self.letters
+                                        obj.x, obj.y
                                     )
+                                    self.physics_system.queue_explosion(obj.x, obj.y, 150)
 
                                     # Add visual feedback particles
                                     for i in range(20):
                                         self.create_particle(
-                                            obj["x"],
-                                            obj["y"],
+                                            obj.x,
+                                            obj.y,
                                             random.choice(FLAME_COLORS),
                                             random.randint(40, 80),
                                             random.uniform(-2, 2),
@@ -313,12 +328,13 @@ class AlphabetLevel(BaseLevel):
 
                                     # Remove object and update counts
                                     self.letters.remove(obj)
+                                    self.physics_system.remove_object(obj)
                                     self.letters_destroyed += 1
 
                                     # Track target hit event
                                     if self.event_manager:
                                         self.event_manager.get_tracker("gameplay").track_target_hit(
-                                            obj.get("type", "unknown"), obj_id, 10
+                                            obj.type, obj_id, 10
                                         )
 
                                     # Check if target is complete (letter + both emojis hit)
@@ -348,13 +364,16 @@ class AlphabetLevel(BaseLevel):
                     # Flag to track if touch hit a target
                     hit_target = False
 
+                    # Wake resting items around the touch
+                    self.physics_system.wake_bodies(touch_x, touch_y, 150, self.letters)
+
                     # Process Touch on Target (letters and emojis)
                     for obj in self.letters[:]:
-                        if obj["rect"].collidepoint(touch_x, touch_y):
+                        if obj.rect.collidepoint(touch_x, touch_y):
                             hit_target = True
 
                             # Check if this object is part of current target
-                            obj_id = obj["value"]
+                            obj_id = obj.value
                             if (
                                 obj_id in self.targets_needed
                                 and obj_id not in self.current_target_hits
@@ -364,22 +383,22 @@ class AlphabetLevel(BaseLevel):
                                 self.score += 10
 
                                 # Play voice sound for letters
-                                if obj.get("type") == "letter" and self.sound_manager:
-                                    self.sound_manager.play_voice(obj["value"])
+                                if obj.type == "letter" and self.sound_manager:
+                                    self.sound_manager.play_voice(obj.value)
 
                                 # Common destruction effects
-                                self.create_explosion(obj["x"], obj["y"])
+                                self.create_explosion(obj.x, obj.y)
                                 self.create_flame_effect(
-                                    self.player_x, self.player_y - 80, obj["x"], obj["y"]
+                                    self.player_x, self.player_y - 80, obj.x, obj.y
                                 )
-                                self.center_piece_manager.trigger_convergence(obj["x"], obj["y"])
-                                self.apply_explosion_effect(obj["x"], obj["y"], 150, self.letters)
+                                self.center_piece_manager.trigger_convergence(obj.x, obj.y)
+                                self.physics_system.queue_explosion(obj.x, obj.y, 150)
 
                                 # Add visual feedback particles
                                 for i in range(20):
                                     self.create_particle(
-                                        obj["x"],
-                                        obj["y"],
+                                        obj.x,
+                                        obj.y,
                                         random.choice(FLAME_COLORS),
                                         random.randint(40, 80),
                                         random.uniform(-2, 2),
@@ -389,6 +408,7 @@ class AlphabetLevel(BaseLevel):
 
                                 # Remove object and update counts
                                 self.letters.remove(obj)
+                                self.physics_system.remove_object(obj)
                                 self.letters_destroyed += 1
 
                                 # Check if target is complete (letter + both emojis hit)
@@ -411,27 +431,12 @@ class AlphabetLevel(BaseLevel):
     def _spawn_letters(self):
         """Handle spawning of falling letters and associated emojis."""
         # Spawn letters from the list
-        if self.letters_to_spawn:
-            if self.frame_count % LETTER_SPAWN_INTERVAL == 0:
-                # Use a generic key "value" for letters
-                item_value = self.letters_to_spawn.pop(0)
-
-                # Spawn the letter
-                letter_obj = {
-                    "value": item_value,
-                    "x": random.randint(50, self.width - 50),
-                    "y": -50,
-                    "rect": pygame.Rect(0, 0, 0, 0),  # Will be updated when drawn
-                    "size": 240,  # Fixed size (doubled from 120 to 240 for 100% increase)
-                    "dx": random.choice([-1, -0.5, 0.5, 1])
-                    * 1.5,  # Slightly faster horizontal drift
-                    "dy": random.choice([10, 5.5]) * 1.5 * 1.2,  # 20% faster fall speed
-                    "can_bounce": False,  # Start without bouncing
-                    "mass": random.uniform(140, 160),  # Give items mass for collisions
-                    "type": "letter",  # Mark as letter type
-                }
-                self.letters.append(letter_obj)
-                self.letters_spawned += 1
+        letter_obj = self.object_factory.spawn_next(
+            "letter", self.letters_to_spawn, self.frame_count, self.physics_system, self.width
+        )
+        if letter_obj is not None:
+            self.letters.append(letter_obj)
+            self.letters_spawned += 1
 
         # Always ensure emojis are available for the current target
         self._ensure_target_emojis_available()
@@ -442,24 +447,17 @@ class AlphabetLevel(BaseLevel):
 
         for i, emoji_surface in enumerate(emojis):
             if emoji_surface is not None:
-                # Create independent emoji object
-                emoji_obj = {
-                    "value": f"{letter}_emoji_{i+1}",
-                    "letter": letter,  # Associated letter
-                    "emoji_index": i + 1,
-                    "x": random.randint(100, self.width - 100),
-                    "y": random.randint(-300, -100),  # Spawn higher up
-                    "rect": pygame.Rect(0, 0, 0, 0),
-                    "size": 96,  # Emoji size
-                    "dx": random.choice([-1, -0.5, 0.5, 1]) * 1.2,
-                    "dy": random.choice([8, 6]) * 1.2,  # Slightly slower than letters
-                    "can_bounce": False,
-                    "mass": random.uniform(100, 120),
-                    "type": "emoji",
-                    "surface": emoji_surface,
-                    "hit": False,  # Track if this emoji has been hit
-                }
-                self.letters.append(emoji_obj)  # Add to same list for physics
+                # Create independent emoji object, spawned higher up than letters
+                emoji_obj = self.object_factory.create_emoji_object(
+                    f"{letter}_emoji_{i+1}",
+                    letter,
+                    i + 1,
+                    random.randint(100, self.width - 100),
+                    random.randint(-300, -100),
+                    emoji_surface,
+                )
+                # Add to same list for physics
+                self.letters.append(self.physics_system.add_object(emoji_obj))
 
     def _ensure_target_emojis_available(self):
         """Ensure emojis are continuously available for the current target letter."""
@@ -471,7 +469,7 @@ class AlphabetLevel(BaseLevel):
             return
 
         # Get current objects on screen
-        current_objects = {obj["value"] for obj in self.letters}
+        current_objects = {obj.value for obj in self.letters}
 
         # Ensure the target letter exists on screen (if not hit yet)
         if (
@@ -479,19 +477,10 @@ class AlphabetLevel(BaseLevel):
             and self.target_letter not in current_objects
         ):
             # Spawn target letter
-            letter_obj = {
-                "value": self.target_letter,
-                "x": random.randint(50, self.width - 50),
-                "y": -50,
-                "rect": pygame.Rect(0, 0, 0, 0),
-                "size": 240,
-                "dx": random.choice([-1, -0.5, 0.5, 1]) * 1.5,
-                "dy": random.choice([10, 5.5]) * 1.5 * 1.2,
-                "can_bounce": False,
-                "mass": random.uniform(140, 160),
-                "type": "letter",
-            }
-            self.letters.append(letter_obj)
+            letter_obj = self.object_factory.create_letter_object(
+                self.target_letter, random.randint(50, self.width - 50), -50
+            )
+            self.letters.append(self.physics_system.add_object(letter_obj))
 
         # Ensure both emojis exist on screen (if not hit yet)
         for target_id in self.targets_needed:
@@ -507,23 +496,15 @@ class AlphabetLevel(BaseLevel):
                     if emoji_index <= len(emojis):
                         emoji_surface = emojis[emoji_index - 1]  # Convert to 0-based index
                         if emoji_surface is not None:
-                            emoji_obj = {
-                                "value": target_id,
-                                "letter": self.target_letter,
-                                "emoji_index": emoji_index,
-                                "x": random.randint(100, self.width - 100),
-                                "y": random.randint(-300, -100),
-                                "rect": pygame.Rect(0, 0, 0, 0),
-                                "size": 96,
-                                "dx": random.choice([-1, -0.5, 0.5, 1]) * 1.2,
-                                "dy": random.choice([8, 6]) * 1.2,
-                                "can_bounce": False,
-                                "mass": random.uniform(100, 120),
-                                "type": "emoji",
-                                "surface": emoji_surface,
-                                "hit": False,
-                            }
-                            self.letters.append(emoji_obj)
+                            emoji_obj = self.object_factory.create_emoji_object(
+                                target_id,
+                                self.target_letter,
+                                emoji_index,
+                                random.randint(100, self.width - 100),
+                                random.randint(-300, -100),
+                                emoji_surface,
+                            )
+                            self.letters.append(self.physics_system.add_object(emoji_obj))
 
     def _reset_target_tracking(self, target_letter):
         """Reset tracking for a new target letter."""
@@ -557,92 +538,11 @@ class AlphabetLevel(BaseLevel):
 
     def _update_letters(self):
         """Update letter positions and handle collisions."""
-        # Update letter positions and bouncing
-        for letter_obj in self.letters[:]:
-            letter_obj["x"] += letter_obj["dx"]
-            letter_obj["y"] += letter_obj["dy"]
-
-            # Bouncing Logic - Allow bouncing only after falling a certain distance
-            if not letter_obj["can_bounce"] and letter_obj["y"] > self.height // 5:
-                letter_obj["can_bounce"] = True
-
-            # If bouncing is enabled, check screen edges
-            if letter_obj["can_bounce"]:
-                bounce_dampening = 0.8  # Reduce speed slightly on bounce
-
-                # Left/Right Walls
-                if letter_obj["x"] <= 0 + letter_obj.get("size", 50) / 2:  # Approx radius check
-                    letter_obj["x"] = 0 + letter_obj.get("size", 50) / 2
-                    letter_obj["dx"] = abs(letter_obj["dx"]) * bounce_dampening
-                elif letter_obj["x"] >= self.width - letter_obj.get("size", 50) / 2:
-                    letter_obj["x"] = self.width - letter_obj.get("size", 50) / 2
-                    letter_obj["dx"] = -abs(letter_obj["dx"]) * bounce_dampening
-
-                # Top/Bottom Walls (less likely to hit top unless pushed)
-                if letter_obj["y"] <= 0 + letter_obj.get("size", 50) / 2:
-                    letter_obj["y"] = 0 + letter_obj.get("size", 50) / 2
-                    letter_obj["dy"] = abs(letter_obj["dy"]) * bounce_dampening
-                elif letter_obj["y"] >= self.height - letter_obj.get("size", 50) / 2:
-                    letter_obj["y"] = self.height - letter_obj.get("size", 50) / 2
-                    letter_obj["dy"] = -abs(letter_obj["dy"]) * bounce_dampening
-                    # Also slightly push horizontally away from edge on bottom bounce
-                    letter_obj["dx"] *= bounce_dampening
-                    if letter_obj["x"] < self.width / 2:
-                        letter_obj["dx"] += random.uniform(0.1, 0.3)
-                    else:
-                        letter_obj["dx"] -= random.uniform(0.1, 0.3)
-
-        # Simple Collision Detection Between Items
-        # Reduce collision check frequency for performance
-        collision_frequency = 2  # Check every 2 frames for performance
-        if self.frame_count % collision_frequency == 0:
-            for i, letter_obj1 in enumerate(self.letters):
-                for j in range(i + 1, len(self.letters)):
-                    letter_obj2 = self.letters[j]
-                    dx = letter_obj2["x"] - letter_obj1["x"]
-                    dy = letter_obj2["y"] - letter_obj1["y"]
-                    distance_sq = dx * dx + dy * dy  # Use squared distance for efficiency
-
-                    # Approximate collision radius based on font/shape size
-                    # Use a slightly larger radius for text to account for varying widths
-                    radius1 = (
-                        letter_obj1.get("size", self.target_font.get_height()) / 1.8
-                    )  # Approx radius
-                    radius2 = letter_obj2.get("size", self.target_font.get_height()) / 1.8
-                    min_distance = radius1 + radius2
-                    min_distance_sq = min_distance * min_distance
-
-                    if distance_sq < min_distance_sq and distance_sq > 0:  # Check for overlap
-                        distance = math.sqrt(distance_sq)
-                        # Normalize collision vector
-                        nx = dx / distance
-                        ny = dy / distance
-
-                        # Resolve interpenetration (push apart)
-                        overlap = min_distance - distance
-                        total_mass = letter_obj1["mass"] + letter_obj2["mass"]
-                        # Push apart proportional to the *other* object's mass
-                        push_factor = overlap / total_mass
-                        letter_obj1["x"] -= nx * push_factor * letter_obj2["mass"]
-                        letter_obj1["y"] -= ny * push_factor * letter_obj2["mass"]
-                        letter_obj2["x"] += nx * push_factor * letter_obj1["mass"]
-                        letter_obj2["y"] += ny * push_factor * letter_obj1["mass"]
-
-                        # Calculate collision response (bounce) - Elastic collision formula component
-                        # Relative velocity
-                        dvx = letter_obj1["dx"] - letter_obj2["dx"]
-                        dvy = letter_obj1["dy"] - letter_obj2["dy"]
-                        # Dot product of relative velocity and collision normal
-                        dot_product = dvx * nx + dvy * ny
-                        # Impulse magnitude
-                        impulse = (2 * dot_product) / total_mass
-                        bounce_factor = 0.85  # Slightly less than perfectly elastic
-
-                        # Apply impulse scaled by mass and bounce factor
-                        letter_obj1["dx"] -= impulse * letter_obj2["mass"] * nx * bounce_factor
-                        letter_obj1["dy"] -= impulse * letter_obj2["mass"] * ny * bounce_factor
-                        letter_obj2["dx"] += impulse * letter_obj1["mass"] * nx * bounce_factor
-                        letter_obj2["dy"] += impulse * letter_obj1["mass"] * ny * bounce_factor
+        # Move and bounce every letter and emoji in one batched pass
+        self.physics_system.step()
+
+        # Collisions between items (checked every collision_frequency frames)
+        self.physics_system.handle_layered_collisions({"letter": self.letters}, self.frame_count)
 
     def _handle_checkpoint_logic(self):
         """Handle checkpoint screen display logic."""
@@ -726,13 +626,25 @@ class AlphabetLevel(BaseLevel):
 
         return None  # Continue the level
 
-    def _draw_frame(self, stars):
+    def _draw_frame(self):
         """Draw a single frame of the alphabet level."""
         # Update glass shatter manager
         self.glass_shatter_manager.update()
 
         # Apply screen shake if active
         offset_x, offset_y = self.glass_shatter_manager.get_screen_shake_offset()
+        dirty = self.dirty_rects
+        # Background, cracks, shake or a checkpoint screen change the whole screen
+        dirty.watch(
+            "scene",
+            (
+                self.glass_shatter_manager.get_background_color(),
+                self.glass_shatter_manager.get_crack_count(),
+                offset_x,
+                offset_y,
+                self.checkpoint_manager.screens_shown,
+            ),
+        )
 
         # Fill background based on shatter state
         self.screen.fill(self.glass_shatter_manager.get_background_color())
@@ -741,93 +653,35 @@ class AlphabetLevel(BaseLevel):
         self.glass_shatter_manager.draw_cracks(self.screen)
 
         # Draw Background Elements (Stars)
-        for star in stars:
-            x, y, radius = star
-            y += 1  # Slower star movement speed
-            pygame.draw.circle(self.screen, (200, 200, 200), (x + offset_x, y + offset_y), radius)
-            if y > self.height + radius:  # Reset when fully off screen
-                y = random.randint(-50, -10)
-                x = random.randint(0, self.width)
-            star[1] = y
-            star[0] = x
+        dirty.mark(self._draw_stars(offset_x, offset_y))
 
         # Draw Center Piece (Swirl Particles + Target Display)
-        self.center_piece_manager.update_and_draw(
-            self.screen, self.target_letter, "alphabet", offset_x, offset_y
+        dirty.mark(
+            self.center_piece_manager.update_and_draw(
+                self.screen, self.target_letter, "alphabet", offset_x, offset_y
+            )
         )
 
         # Update and Draw Falling Objects (Letters and Emojis)
-        for obj in self.letters[:]:
-            draw_pos_x = int(obj["x"] + offset_x)
-            draw_pos_y = int(obj["y"] + offset_y)
-
-            if obj.get("type") == "letter":
-                # Draw Letter
-                display_value = obj["value"]
-
-                # Greek alpha special case for alphabet mode
-                if obj["value"] == "a":
-                    display_value = "α"
-
-                # Highlight if this is part of current target
-                is_target = obj["value"] in self.targets_needed
-                text_color = BLACK if is_target else (150, 150, 150)
-
-                # PERFORMANCE OPTIMIZATION: Use cached font surface if available
-                try:
-                    cached_surface = self.resource_manager.get_falling_object_surface(
-                        "alphabet", obj["value"], text_color
-                    )
-                    text_rect = cached_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                    # Inflate rect by 50% for easier interaction (25 pixels on each side)
-                    interaction_rect = text_rect.inflate(50, 50)
-                    obj["rect"] = interaction_rect
-                    self.screen.blit(cached_surface, text_rect)
-                except:
-                    # Fallback: Original rendering method
-                    text_surface = self.target_font.render(display_value, True, text_color)
-                    text_rect = text_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                    # Inflate rect by 50% for easier interaction (25 pixels on each side)
-                    interaction_rect = text_rect.inflate(50, 50)
-                    obj["rect"] = interaction_rect
-                    self.screen.blit(text_surface, text_rect)
-
-            elif obj.get("type") == "emoji":
-                # Draw Emoji
-                emoji_surface = obj.get("surface")
-                if emoji_surface:
-                    # Highlight if this is part of current target
-                    is_target = obj["value"] in self.targets_needed
-
-                    if is_target:
-                        # Full opacity for target emojis
-                        emoji_rect = emoji_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                        self.screen.blit(emoji_surface, emoji_rect)
-                    else:
-                        # Reduced opacity for non-target emojis
-                        emoji_copy = emoji_surface.copy()
-                        emoji_copy.set_alpha(128)  # 50% transparency
-                        emoji_rect = emoji_copy.get_rect(center=(draw_pos_x, draw_pos_y))
-                        self.screen.blit(emoji_copy, emoji_rect)
-
-                    # Set collision rect (larger for easier clicking)
-                    obj["rect"] = emoji_rect.inflate(20, 20)
+        self._draw_game_objects(offset_x, offset_y)
 
         # Process Flamethrower Effects
         self.flamethrower_manager.update()
-        self.flamethrower_manager.draw(self.screen, offset_x, offset_y)
+        dirty.mark(self.flamethrower_manager.draw(self.screen, offset_x, offset_y))
 
         # Process Legacy Lasers (if any remain)
         for laser in self.lasers[:]:
             if laser["duration"] > 0:
                 # Legacy laser handling (non-flamethrower effects)
                 if laser["type"] != "flamethrower":
-                    pygame.draw.line(
-                        self.screen,
-                        random.choice(laser.get("colors", FLAME_COLORS)),
-                        (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
-                        (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
-                        random.choice(laser.get("widths", [5, 10, 15])),
+                    dirty.mark(
+                        pygame.draw.line(
+                            self.screen,
+                            random.choice(laser.get("colors", FLAME_COLORS)),
+                            (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
+                            (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
+                            random.choice(laser.get("widths", [5, 10, 15])),
+                        )
                     )
                 laser["duration"] -= 1
             else:
@@ -836,20 +690,22 @@ class AlphabetLevel(BaseLevel):
         # Process Explosions
         for explosion in self.explosions[:]:
             if explosion["duration"] > 0:
-                self.draw_explosion(explosion, offset_x, offset_y)  # Pass shake offset
+                dirty.mark(self.draw_explosion(explosion, offset_x, offset_y))  # Pass shake offset
                 explosion["duration"] -= 1
             else:
                 self.explosions.remove(explosion)
 
         # Display HUD
-        self.hud_manager.display_info(
-            self.screen,
-            self.score,
-            self.current_ability,
-            self.target_letter,
-            self.overall_destroyed + self.letters_destroyed,
-            self.TOTAL_LETTERS,
-            "alphabet",
+        dirty.mark(
+            self.hud_manager.display_info(
+                self.screen,
+                self.score,
+                self.current_ability,
+                self.target_letter,
+                self.overall_destroyed + self.letters_destroyed,
+                self.TOTAL_LETTERS,
+                "alphabet",
+            )
         )
 
     # Implement abstract methods from BaseLevel
@@ -886,46 +742,49 @@ class AlphabetLevel(BaseLevel):
         return self.object_factory.create_letter_object(value, x, y)
 
     def _draw_game_objects(self, offset_x: float, offset_y: float):
-        """Draw alphabet-specific game objects."""
-        for obj in self.letters[:]:
-            draw_pos_x = int(obj["x"] + offset_x)
-            draw_pos_y = int(obj["y"] + offset_y)
-
-            if obj.get("type") == "letter":
-                # Draw Letter
-                display_value = obj["value"]
-                if obj["value"] == "a":
-                    display_value = "α"
-
-                is_target = obj["value"] in self.targets_needed
+        """Draw letters and emojis through the sprite batcher and mark their rects."""
+        dirty = self.dirty_rects
+        for obj, (render_x, render_y) in zip(
+            self.letters[:], self.physics_system.render_positions(self.letters)
+        ):
+            draw_pos_x = int(render_x + offset_x)
+            draw_pos_y = int(render_y + offset_y)
+
+            if obj.type == "letter":
+                # Highlight if this is part of current target
+                is_target = obj.value in self.targets_needed
                 text_color = BLACK if is_target else (150, 150, 150)
 
-                try:
-                    cached_surface = self.resource_manager.get_falling_object_surface(
-                        "alphabet", obj["value"], text_color
-                    )
-                    text_rect = cached_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                    interaction_rect = text_rect.inflate(50, 50)
-                    obj["rect"] = interaction_rect
-                    self.screen.blit(cached_surface, text_rect)
-                except:
-                    text_surface = self.target_font.render(display_value, True, text_color)
-                    text_rect = text_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                    interaction_rect = text_rect.inflate(50, 50)
-                    obj["rect"] = interaction_rect
-                    self.screen.blit(text_surface, text_rect)
-
-            elif obj.get("type") == "emoji":
-                emoji_surface = obj.get("surface")
+                # Draw Letter from the shared glyph atlas (lowercase a shows as alpha)
+                glyph = self.resource_manager.get_falling_glyph(obj.value, text_color)
+                text_rect = self.sprite_batcher.draw_surface(
+                    "glyphs", glyph, center=(draw_pos_x, draw_pos_y)
+                )
+                # Inflate rect by 50% for easier interaction (25 pixels on each side)
+                obj.rect.update(text_rect)
+                obj.rect.inflate_ip(50, 50)
+
+            elif obj.type == "emoji":
+                # Draw Emoji
+                emoji_surface = obj.surface
                 if emoji_surface:
-                    is_target = obj["value"] in self.targets_needed
-                    if is_target:
-                        emoji_rect = emoji_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                        self.screen.blit(emoji_surface, emoji_rect)
-                    else:
-                        emoji_copy = emoji_surface.copy()
-                        emoji_copy.set_alpha(128)
-                        emoji_rect = emoji_copy.get_rect(center=(draw_pos_x, draw_pos_y))
-                        self.screen.blit(emoji_copy, emoji_rect)
+                    # Highlight if this is part of current target
+                    is_target = obj.value in self.targets_needed
+
+                    # Full opacity for target emojis, 50% for the rest (baked into the atlas)
+                    emoji_rect = self.sprite_batcher.draw_surface(
+                        "emojis",
+                        emoji_surface,
+                        center=(draw_pos_x, draw_pos_y),
+                        alpha=255 if is_target else 128,
+                    )
+
+                    # Set collision rect (larger for easier clicking)
+                    obj.rect.update(emoji_rect)
+                    obj.rect.inflate_ip(20, 20)
+
+            # The inflated collision rect covers everything drawn for the object
+            dirty.mark(obj.rect)
 
-                    obj["rect"] = emoji_rect.inflate(20, 20)
+        # Glyphs and emojis go out as one blits() call per atlas
+        self.sprite_batcher.flush(self.screen)
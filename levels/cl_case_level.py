@@ -1,27 +1,29 @@
-import math
 import random
 import pygame
 from typing import List, Dict, Any
 
+from Display_settings import PERFORMANCE_SETTINGS
 from settings import (
     BLACK,
     FLAME_COLORS,
     GROUP_SIZE,
-    LETTER_SPAWN_INTERVAL,
     LEVEL_PROGRESS_PATH,
     SEQUENCES,
     WHITE,
 )
-from base_level import BaseLevel
+from base_level import BaseLevel, EmojiObject
 from unified_physics import UnifiedObjectFactory, UnifiedTargetSystem, UnifiedPhysicsSystem
 from universal_class import (
     CenterPieceManager,
     CheckpointManager,
+    DirtyRectManager,
     FlamethrowerManager,
     GlassShatterManager,
     HUDManager,
     MultiTouchManager,
+    StarFieldManager,
 )
+from utils.texture_atlas import get_sprite_batcher
 
 
 class CLCaseLevel(BaseLevel):
@@ -108,6 +110,21 @@ class CLCaseLevel(BaseLevel):
         self.game_over_screen = game_over_screen_func
         self.sound_manager = sound_manager
 
+        # Letters and emojis share one collision pipeline on separate layers
+        self.object_factory = UnifiedObjectFactory(resource_manager)
+        self.physics_system = UnifiedPhysicsSystem(width, height, collision_strategy="sweep")
+        self.physics_system.collision_frequency = 3  # Check every 3 ticks for performance
+
+        # Fixed-timestep simulation, rendered at the display mode's frame rate
+        timing = PERFORMANCE_SETTINGS.get(
+            center_piece_manager.display_mode, PERFORMANCE_SETTINGS["DEFAULT"]
+        )
+        self.physics_system.configure_timestep(timing)
+        self.render_fps = timing["render_fps"]
+        self.dirty_rects = DirtyRectManager.from_settings(width, height, timing)
+        self.sprite_batcher = get_sprite_batcher()
+        self.star_field = StarFieldManager(width, height)
+
         # C/L Case configuration
         self.sequence = SEQUENCES["clcase"]
         self.groups = [
@@ -146,6 +163,7 @@ class CLCaseLevel(BaseLevel):
         self.just_completed_level = False
 
         # Game state
+        self.physics_system.clear()
         self.letters = []  # items on screen
         self.letters_to_spawn = self.current_group.copy()
         self.emoji_objects = []  # emoji targets on screen
@@ -219,8 +237,8 @@ class CLCaseLevel(BaseLevel):
         # Check what emoji targets are missing from screen
         emoji_types_on_screen = set()
         for emoji_obj in self.emoji_objects:
-            if emoji_obj["letter"] == self.target_letter:
-                emoji_types_on_screen.add(emoji_obj["emoji_type"])
+            if emoji_obj.letter == self.target_letter:
+                emoji_types_on_screen.add(emoji_obj.emoji_type)
 
         # Spawn missing emoji targets
         for emoji_type in ["emoji1", "emoji2"]:
@@ -242,56 +260,20 @@ class CLCaseLevel(BaseLevel):
             return
 
         emoji_surface = emojis[emoji_index]
-        emoji_obj = {
-            "letter": letter,
-            "emoji_type": emoji_type,
-            "surface": emoji_surface,
-            "x": random.randint(50, self.width - 50),
-            "y": -50,
-            "rect": pygame.Rect(0, 0, 0, 0),  # Will be updated when drawn
-            "dx": random.choice([-1, -0.5, 0.5, 1]) * 1.5,
-            "dy": random.choice([5, 10.5]) * 1.5 * 1.2,  # Same speed as letters
-            "can_bounce": False,
-            "mass": random.uniform(40, 60),
-        }
-        self.emoji_objects.append(emoji_obj)
-
-    def _update_emojis(self):
-        """Update emoji positions and physics."""
-        for emoji_obj in self.emoji_objects[:]:
-            emoji_obj["x"] += emoji_obj["dx"]
-            emoji_obj["y"] += emoji_obj["dy"]
-
-            # Bouncing logic (same as letters)
-            if not emoji_obj["can_bounce"] and emoji_obj["y"] > self.height // 5:
-                emoji_obj["can_bounce"] = True
-
-            if emoji_obj["can_bounce"]:
-                bounce_dampening = 0.8
-
-                # Get emoji size for bounds checking
-                emoji_size = emoji_obj["surface"].get_width()
-
-                # Left/Right Walls
-                if emoji_obj["x"] <= 0 + emoji_size / 2:
-                    emoji_obj["x"] = 0 + emoji_size / 2
-                    emoji_obj["dx"] = abs(emoji_obj["dx"]) * bounce_dampening
-                elif emoji_obj["x"] >= self.width - emoji_size / 2:
-                    emoji_obj["x"] = self.width - emoji_size / 2
-                    emoji_obj["dx"] = -abs(emoji_obj["dx"]) * bounce_dampening
-
-                # Top/Bottom Walls
-                if emoji_obj["y"] <= 0 + emoji_size / 2:
-                    emoji_obj["y"] = 0 + emoji_size / 2
-                    emoji_obj["dy"] = abs(emoji_obj["dy"]) * bounce_dampening
-                elif emoji_obj["y"] >= self.height - emoji_size / 2:
-                    emoji_obj["y"] = self.height - emoji_size / 2
-                    emoji_obj["dy"] = -abs(emoji_obj["dy"]) * bounce_dampening
-                    emoji_obj["dx"] *= bounce_dampening
-                    if emoji_obj["x"] < self.width / 2:
-                        emoji_obj["dx"] += random.uniform(0.1, 0.3)
-                    else:
-                        emoji_obj["dx"] -= random.uniform(0.1, 0.3)
+        emoji_obj = EmojiObject(
+            random.randint(50, self.width - 50),
+            -50,
+            f"{letter}_{emoji_type}",
+            letter,
+            emoji_surface,
+        )
+        emoji_obj.emoji_type = emoji_type
+        emoji_obj.size = emoji_surface.get_width()  # Bounce off walls at the emoji's edge
+        emoji_obj.collision_scale = 0.5  # Collide at half the emoji's width, too
+        emoji_obj.dx = random.choice([-1, -0.5, 0.5, 1]) * 1.5
+        emoji_obj.dy = random.choice([5, 10.5]) * 1.5 * 1.2  # Same speed as letters
+        emoji_obj.mass = random.uniform(40, 60)
+        self.emoji_objects.append(self.physics_system.add_object(emoji_obj))
 
     def run(self):
         """
@@ -302,17 +284,15 @@ class CLCaseLevel(BaseLevel):
         """
         print("Starting C/L Case level...")
 
-        # Initialize background stars
-        stars = []
-        for _ in range(100):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            radius = random.randint(2, 4)
-            stars.append([x, y, radius])
+        # Fresh background stars for this run
+        self.star_field.reset()
 
         # Main game loop
         running = True
         clock = pygame.time.Clock()
+        self.physics_system.timestep.reset()
+        frame_seconds = self.physics_system.timestep.tick_seconds
+        self.dirty_rects.invalidate()
 
         while running:
             # Handle events
@@ -324,17 +304,11 @@ class CLCaseLevel(BaseLevel):
             if not running:
                 break
 
-            # Spawn letters and emojis
-            if self.game_started:
-                self._spawn_letters()
-                self._ensure_target_emojis_available()
-
-            # Update letters, emojis and collisions
-            self._update_letters()
-            self._update_emojis()
+            # Spawn and update letters, emojis and collisions in fixed ticks
+            self.physics_system.advance(frame_seconds, self._simulation_tick)
 
             # Draw frame
-            self._draw_frame(stars)
+            self._draw_frame()
 
             # Handle checkpoint logic
             if self._handle_checkpoint_logic():
@@ -347,12 +321,23 @@ class CLCaseLevel(BaseLevel):
                 return progression_result
 
             # Update display
-            pygame.display.flip()
-            clock.tick(50)  # 50 FPS for performance
-            self.frame_count += 1
+            self.sprite_batcher.end_frame()
+            self.dirty_rects.present()
+            frame_seconds = clock.tick(self.render_fps) / 1000.0
 
         return True  # Return to menu by default
 
+    def _simulation_tick(self):
+        """Advance spawning, physics and collisions by one fixed tick."""
+        self.physics_system.apply_queued_explosions(
+            {"letter": self.letters, "emoji": self.emoji_objects}
+        )
+        if self.game_started:
+            self._spawn_letters()
+            self._ensure_target_emojis_available()
+        self._update_letters()
+        self.frame_count += 1
+
     def _handle_events(self, event):
         """
         Handle pygame events for the C/L Case level.
@@ -424,28 +409,34 @@ class CLCaseLevel(BaseLevel):
         # Flag to track if click hit a target
         hit_target = False
 
+        # Wake resting letters and emojis around the click
+        self.physics_system.wake_bodies(click_x, click_y, 150, self.letters)
+        self.physics_system.wake_bodies(click_x, click_y, 150, self.emoji_objects)
+
         # Process click on letter targets
         for letter_obj in self.letters[:]:
-            if letter_obj["rect"].collidepoint(click_x, click_y):
+            if letter_obj.rect.collidepoint(click_x, click_y):
                 hit_target = True
-                if letter_obj["value"] == self.target_letter:
+                if letter_obj.value == self.target_letter:
                     self.score += 10
                     # Play voice sound for destroyed target
                     if self.sound_manager:
-                        self.sound_manager.play_voice(letter_obj["value"])
+                        self.sound_manager.play_voice(letter_obj.value)
                     # Common destruction effects
-                    self.create_explosion(letter_obj["x"], letter_obj["y"])
+                    self.create_explosion(letter_obj.x, letter_obj.y)
                     self.create_flame_effect(
-                        self.player_x, self.player_y - 80, letter_obj["x"], letter_obj["y"]
+                        self.player_x, self.player_y - 80, letter_obj.x, letter_obj.y
+                    )
+                    self.center_piece_manager.trigger_convergence(letter_obj.x, letter_obj.y)
+                    self.physics_system.queue_explosion(
+                        letter_obj.x, letter_obj.y, 150, layer="letter"
                     )
-                    self.center_piece_manager.trigger_convergence(letter_obj["x"], letter_obj["y"])
-                    self.apply_explosion_effect(letter_obj["x"], letter_obj["y"], 150, self.letters)
 
                     # Add visual feedback particles
                     for i in range(20):
                         self.create_particle(
-                            letter_obj["x"],
-                            letter_obj["y"],
+                            letter_obj.x,
+                            letter_obj.y,
                             random.choice(FLAME_COLORS),
                             random.randint(40, 80),
                             random.uniform(-2, 2),
@@ -455,6 +446,7 @@ class CLCaseLevel(BaseLevel):
 
                     # Remove letter and update target tracking
                     self.letters.remove(letter_obj)
+                    self.physics_system.remove_object(letter_obj)
                     self.letters_destroyed += 1
 
                     # Mark letter target as completed
@@ -472,33 +464,33 @@ class CLCaseLevel(BaseLevel):
         # Process click on emoji targets
         if not hit_target:
             for emoji_obj in self.emoji_objects[:]:
-                if emoji_obj["rect"].collidepoint(click_x, click_y):
+                if emoji_obj.rect.collidepoint(click_x, click_y):
                     # Check if this emoji belongs to the current target letter
-                    if emoji_obj["letter"] == self.target_letter:
+                    if emoji_obj.letter == self.target_letter:
                         hit_target = True
                         self.score += 5  # Emojis worth 5 points
 
                         # Play voice sound for the letter this emoji represents
                         if self.sound_manager:
-                            self.sound_manager.play_voice(emoji_obj["letter"])
+                            self.sound_manager.play_voice(emoji_obj.letter)
 
                         # Common destruction effects
-                        self.create_explosion(emoji_obj["x"], emoji_obj["y"])
+                        self.create_explosion(emoji_obj.x, emoji_obj.y)
                         self.create_flame_effect(
-                            self.player_x, self.player_y - 80, emoji_obj["x"], emoji_obj["y"]
+                            self.player_x, self.player_y - 80, emoji_obj.x, emoji_obj.y
                         )
                         self.center_piece_manager.trigger_convergence(
-                            emoji_obj["x"], emoji_obj["y"]
+                            emoji_obj.x, emoji_obj.y
                         )
-                        self.apply_explosion_effect(
-                            emoji_obj["x"], emoji_obj["y"], 150, self.emoji_objects
+                        self.physics_system.queue_explosion(
+                            emoji_obj.x, emoji_obj.y, 150, layer="emoji"
                         )
 
                         # Add visual feedback particles
                         for i in range(15):
                             self.create_particle(
-                                emoji_obj["x"],
-                                emoji_obj["y"],
+                                emoji_obj.x,
+                                emoji_obj.y,
                                 random.choice(FLAME_COLORS),
                                 random.randint(30, 60),
                                 random.uniform(-1.5, 1.5),
@@ -508,9 +500,10 @@ class CLCaseLevel(BaseLevel):
 
                         # Remove emoji and update target tracking
                         self.emoji_objects.remove(emoji_obj)
+                        self.physics_system.remove_object(emoji_obj)
 
                         # Mark emoji target as completed
-                        target_key = f"{emoji_obj['letter']}_{emoji_obj['emoji_type']}"
+                        target_key = f"{emoji_obj.letter}_{emoji_obj.emoji_type}"
                         if target_key in self.targets_needed:
                             self.targets_needed[target_key] = 0
 
@@ -525,193 +518,22 @@ class CLCaseLevel(BaseLevel):
 
     def _spawn_letters(self):
         """Spawn letters at regular intervals."""
-        if self.letters_to_spawn:
-            if self.frame_count % LETTER_SPAWN_INTERVAL == 0:
-                item_value = self.letters_to_spawn.pop(0)
-                letter_obj = {
-                    "value": item_value,
-                    "x": random.randint(50, self.width - 50),
-                    "y": -50,
-                    "rect": pygame.Rect(0, 0, 0, 0),  # Will be updated when drawn
-                    "size": 240,  # Fixed size
-                    "dx": random.choice([-1, -0.5, 0.5, 1]) * 1.5,
-                    "dy": random.choice([5, 10.5]) * 1.5 * 1.2,  # 20% faster fall speed
-                    "can_bounce": False,  # Start without bouncing
-                    "mass": random.uniform(40, 60),  # Give items mass for collisions 40/60
-                }
-                self.letters.append(letter_obj)
-                self.letters_spawned += 1
+        letter_obj = self.object_factory.spawn_next(
+            "case_letter", self.letters_to_spawn, self.frame_count, self.physics_system, self.width
+        )
+        if letter_obj is not None:
+            self.letters.append(letter_obj)
+            self.letters_spawned += 1
 
     def _update_letters(self):
-        """Update letter positions, bouncing, and collisions."""
-        # Update letter positions
-        for letter_obj in self.letters[:]:
-            letter_obj["x"] += letter_obj["dx"]
-            letter_obj["y"] += letter_obj["dy"]
-
-            # Bouncing logic
-            if not letter_obj["can_bounce"] and letter_obj["y"] > self.height // 5:
-                letter_obj["can_bounce"] = True
-
-            if letter_obj["can_bounce"]:
-                bounce_dampening = 0.8
-
-                # Left/Right Walls
-                if letter_obj["x"] <= 0 + letter_obj.get("size", 50) / 2:
-                    letter_obj["x"] = 0 + letter_obj.get("size", 50) / 2
-                    letter_obj["dx"] = abs(letter_obj["dx"]) * bounce_dampening
-                elif letter_obj["x"] >= self.width - letter_obj.get("size", 50) / 2:
-                    letter_obj["x"] = self.width - letter_obj.get("size", 50) / 2
-                    letter_obj["dx"] = -abs(letter_obj["dx"]) * bounce_dampening
-
-                # Top/Bottom Walls
-                if letter_obj["y"] <= 0 + letter_obj.get("size", 50) / 2:
-                    letter_obj["y"] = 0 + letter_obj.get("size", 50) / 2
-                    letter_obj["dy"] = abs(letter_obj["dy"]) * bounce_dampening
-                elif letter_obj["y"] >= self.height - letter_obj.get("size", 50) / 2:
-                    letter_obj["y"] = self.height - letter_obj.get("size", 50) / 2
-                    letter_obj["dy"] = -abs(letter_obj["dy"]) * bounce_dampening
-                    letter_obj["dx"] *= bounce_dampening
-                    if letter_obj["x"] < self.width / 2:
-                        letter_obj["dx"] += random.uniform(0.1, 0.3)
-                    else:
-                        letter_obj["dx"] -= random.uniform(0.1, 0.3)
-
-        # Handle collisions
-        self._handle_letter_collisions()
-        self._handle_emoji_collisions()
-        self._handle_letter_emoji_collisions()
-
-    def _handle_letter_collisions(self):
-        """Handle collisions between letters with physics."""
-        collision_frequency = 3  # Check every 3 frames for performance
-        if self.frame_count % collision_frequency == 0:
-            for i, letter_obj1 in enumerate(self.letters):
-                for j in range(i + 1, len(self.letters)):
-                    letter_obj2 = self.letters[j]
-                    dx = letter_obj2["x"] - letter_obj1["x"]
-                    dy = letter_obj2["y"] - letter_obj1["y"]
-                    distance_sq = dx * dx + dy * dy
-
-                    # Collision radius calculation
-                    radius1 = letter_obj1.get("size", self.target_font.get_height()) / 1.8
-                    radius2 = letter_obj2.get("size", self.target_font.get_height()) / 1.8
-                    min_distance = radius1 + radius2
-                    min_distance_sq = min_distance * min_distance
-
-                    if distance_sq < min_distance_sq and distance_sq > 0:
-                        distance = math.sqrt(distance_sq)
-                        # Normalize collision vector
-                        nx = dx / distance
-                        ny = dy / distance
-
-                        # Resolve interpenetration
-                        overlap = min_distance - distance
-                        total_mass = letter_obj1["mass"] + letter_obj2["mass"]
-                        push_factor = overlap / total_mass
-                        letter_obj1["x"] -= nx * push_factor * letter_obj2["mass"]
-                        letter_obj1["y"] -= ny * push_factor * letter_obj2["mass"]
-                        letter_obj2["x"] += nx * push_factor * letter_obj1["mass"]
-                        letter_obj2["y"] += ny * push_factor * letter_obj1["mass"]
-
-                        # Calculate collision response
-                        dvx = letter_obj1["dx"] - letter_obj2["dx"]
-                        dvy = letter_obj1["dy"] - letter_obj2["dy"]
-                        dot_product = dvx * nx + dvy * ny
-                        impulse = (2 * dot_product) / total_mass
-                        bounce_factor = 0.85
-
-                        letter_obj1["dx"] -= impulse * letter_obj2["mass"] * nx * bounce_factor
-                        letter_obj1["dy"] -= impulse * letter_obj2["mass"] * ny * bounce_factor
-                        letter_obj2["dx"] += impulse * letter_obj1["mass"] * nx * bounce_factor
-                        letter_obj2["dy"] += impulse * letter_obj1["mass"] * ny * bounce_factor
-
-    def _handle_emoji_collisions(self):
-        """Handle collisions between emoji objects."""
-        collision_frequency = 3  # Check every 3 frames for performance
-        if self.frame_count % collision_frequency == 0:
-            for i, emoji1 in enumerate(self.emoji_objects):
-                for j in range(i + 1, len(self.emoji_objects)):
-                    emoji2 = self.emoji_objects[j]
-                    dx = emoji2["x"] - emoji1["x"]
-                    dy = emoji2["y"] - emoji1["y"]
-                    distance_sq = dx * dx + dy * dy
-
-                    # Collision radius calculation
-                    radius1 = emoji1["surface"].get_width() / 2
-                    radius2 = emoji2["surface"].get_width() / 2
-                    min_distance = radius1 + radius2
-                    min_distance_sq = min_distance * min_distance
-
-                    if distance_sq < min_distance_sq and distance_sq > 0:
-                        distance = math.sqrt(distance_sq)
-                        # Normalize collision vector
-                        nx = dx / distance
-                        ny = dy / distance
-
-                        # Resolve interpenetration
-                        overlap = min_distance - distance
-                        total_mass = emoji1["mass"] + emoji2["mass"]
-                        push_factor = overlap / total_mass
-                        emoji1["x"] -= nx * push_factor * emoji2["mass"]
-                        emoji1["y"] -= ny * push_factor * emoji2["mass"]
-                        emoji2["x"] += nx * push_factor * emoji1["mass"]
-                        emoji2["y"] += ny * push_factor * emoji1["mass"]
-
-                        # Calculate collision response
-                        dvx = emoji1["dx"] - emoji2["dx"]
-                        dvy = emoji1["dy"] - emoji2["dy"]
-                        dot_product = dvx * nx + dvy * ny
-                        impulse = (2 * dot_product) / total_mass
-                        bounce_factor = 0.85
-
-                        emoji1["dx"] -= impulse * emoji2["mass"] * nx * bounce_factor
-                        emoji1["dy"] -= impulse * emoji2["mass"] * ny * bounce_factor
-                        emoji2["dx"] += impulse * emoji1["mass"] * nx * bounce_factor
-                        emoji2["dy"] += impulse * emoji1["mass"] * ny * bounce_factor
-
-    def _handle_letter_emoji_collisions(self):
-        """Handle collisions between letters and emojis."""
-        collision_frequency = 3  # Check every 3 frames for performance
-        if self.frame_count % collision_frequency == 0:
-            for letter_obj in self.letters:
-                for emoji_obj in self.emoji_objects:
-                    dx = emoji_obj["x"] - letter_obj["x"]
-                    dy = emoji_obj["y"] - letter_obj["y"]
-                    distance_sq = dx * dx + dy * dy
-
-                    # Collision radius calculation
-                    letter_radius = letter_obj.get("size", self.target_font.get_height()) / 1.8
-                    emoji_radius = emoji_obj["surface"].get_width() / 2
-                    min_distance = letter_radius + emoji_radius
-                    min_distance_sq = min_distance * min_distance
-
-                    if distance_sq < min_distance_sq and distance_sq > 0:
-                        distance = math.sqrt(distance_sq)
-                        # Normalize collision vector
-                        nx = dx / distance
-                        ny = dy / distance
-
-                        # Resolve interpenetration
-                        overlap = min_distance - distance
-                        total_mass = letter_obj["mass"] + emoji_obj["mass"]
-                        push_factor = overlap / total_mass
-                        letter_obj["x"] -= nx * push_factor * emoji_obj["mass"]
-                        letter_obj["y"] -= ny * push_factor * emoji_obj["mass"]
-                        emoji_obj["x"] += nx * push_factor * letter_obj["mass"]
-                        emoji_obj["y"] += ny * push_factor * letter_obj["mass"]
-
-                        # Calculate collision response
-                        dvx = letter_obj["dx"] - emoji_obj["dx"]
-                        dvy = letter_obj["dy"] - emoji_obj["dy"]
-                        dot_product = dvx * nx + dvy * ny
-                        impulse = (2 * dot_product) / total_mass
-                        bounce_factor = 0.85
-
-                        letter_obj["dx"] -= impulse * emoji_obj["mass"] * nx * bounce_factor
-                        letter_obj["dy"] -= impulse * emoji_obj["mass"] * ny * bounce_factor
-                        emoji_obj["dx"] += impulse * letter_obj["mass"] * nx * bounce_factor
-                        emoji_obj["dy"] += impulse * letter_obj["mass"] * ny * bounce_factor
+        """Update letter and emoji positions, bouncing, and collisions."""
+        # Move and bounce letters and emojis in one batched pass
+        self.physics_system.step()
+
+        # Handle letter, emoji and letter-vs-emoji collisions in one pass
+        self.physics_system.handle_layered_collisions(
+            {"letter": self.letters, "emoji": self.emoji_objects}, self.frame_count
+        )
 
     def _handle_checkpoint_logic(self):
         """
@@ -800,7 +622,7 @@ class CLCaseLevel(BaseLevel):
 
         return None
 
-    def _draw_frame(self, stars):
+    def _draw_frame(self):
         """Draw a complete frame of the C/L Case level."""
         # Apply screen shake if active
         offset_x, offset_y = self.glass_shatter_manager.get_screen_shake_offset()
@@ -808,6 +630,18 @@ class CLCaseLevel(BaseLevel):
         # Update glass shatter manager
         self.glass_shatter_manager.update()
 
+        # Background, cracks, shake or a checkpoint screen change the whole screen
+        self.dirty_rects.watch(
+            "scene",
+            (
+                self.glass_shatter_manager.get_background_color(),
+                self.glass_shatter_manager.get_crack_count(),
+                offset_x,
+                offset_y,
+                self.checkpoint_manager.screens_shown,
+            ),
+        )
+
         # Fill background based on shatter state
         self.screen.fill(self.glass_shatter_manager.get_background_color())
 
@@ -815,11 +649,13 @@ class CLCaseLevel(BaseLevel):
         self.glass_shatter_manager.draw_cracks(self.screen)
 
         # Draw background elements (stars)
-        self._draw_stars(stars, offset_x, offset_y)
+        self.dirty_rects.mark(self._draw_stars(offset_x, offset_y))
 
         # Draw center piece (swirl particles + target display)
-        self.center_piece_manager.update_and_draw(
-            self.screen, self.target_letter, "clcase", offset_x, offset_y
+        self.dirty_rects.mark(
+            self.center_piece_manager.update_and_draw(
+                self.screen, self.target_letter, "clcase", offset_x, offset_y
+            )
         )
 
         # Update and draw falling letters and emojis
@@ -828,7 +664,7 @@ class CLCaseLevel(BaseLevel):
 
         # Process flamethrower effects
         self.flamethrower_manager.update()
-        self.flamethrower_manager.draw(self.screen, offset_x, offset_y)
+        self.dirty_rects.mark(self.flamethrower_manager.draw(self.screen, offset_x, offset_y))
 
         # Process legacy lasers
         self._process_lasers(offset_x, offset_y)
@@ -838,107 +674,101 @@ class CLCaseLevel(BaseLevel):
 
         # Draw general particles
         self.particle_manager.update()
-        self.particle_manager.draw(self.screen, offset_x, offset_y)
+        self.dirty_rects.mark(self.particle_manager.draw(self.screen, offset_x, offset_y))
 
         # Display HUD info
-        self.hud_manager.display_info(
-            self.screen,
-            self.score,
-            self.current_ability,
-            self.target_letter,
-            self.overall_destroyed,
-            self.TOTAL_LETTERS,
-            "clcase",
+        self.dirty_rects.mark(
+            self.hud_manager.display_info(
+                self.screen,
+                self.score,
+                self.current_ability,
+                self.target_letter,
+                self.overall_destroyed,
+                self.TOTAL_LETTERS,
+                "clcase",
+            )
         )
 
-    def _draw_stars(self, stars, offset_x, offset_y):
-        """Draw and update background stars."""
-        for star in stars:
-            x, y, radius = star
-            y += 1  # Slower star movement speed
-            pygame.draw.circle(self.screen, (200, 200, 200), (x + offset_x, y + offset_y), radius)
-            if y > self.height + radius:
-                y = random.randint(-50, -10)
-                x = random.randint(0, self.width)
-            star[1] = y
-            star[0] = x
-
     def _update_and_draw_letters(self, offset_x, offset_y):
         """Update and draw falling letters with special clcase handling."""
-        for letter_obj in self.letters:
+        for letter_obj, (render_x, render_y) in zip(
+            self.letters, self.physics_system.render_positions(self.letters)
+        ):
             # Draw the letter
-            draw_pos_x = int(letter_obj["x"] + offset_x)
-            draw_pos_y = int(letter_obj["y"] + offset_y)
-
-            # Special handling for clcase mode - 'a' becomes 'α'
-            display_value = letter_obj["value"]
-            if letter_obj["value"] == "a":
-                display_value = "α"
+            draw_pos_x = int(render_x + offset_x)
+            draw_pos_y = int(render_y + offset_y)
 
             # Use gray for non-target letters, black for the target letter
-            text_color = BLACK if letter_obj["value"] == self.target_letter else (150, 150, 150)
+            text_color = BLACK if letter_obj.value == self.target_letter else (150, 150, 150)
 
-            # Use cached font surface if available
-            try:
-                cached_surface = self.resource_manager.get_falling_object_surface(
-                    "clcase", letter_obj["value"], text_color
-                )
-                text_rect = cached_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                # Inflate rect by 50% for easier interaction (25 pixels on each side)
-                interaction_rect = text_rect.inflate(50, 50)
-                letter_obj["rect"] = interaction_rect
-                self.screen.blit(cached_surface, text_rect)
-            except:
-                # Fallback: Original rendering method
-                text_surface = self.target_font.render(display_value, True, text_color)
-                text_rect = text_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                # Inflate rect by 50% for easier interaction (25 pixels on each side)
-                interaction_rect = text_rect.inflate(50, 50)
-                letter_obj["rect"] = interaction_rect
-                self.screen.blit(text_surface, text_rect)
+            # Draw from the shared glyph atlas; 'a' is drawn as 'α'
+            glyph = self.resource_manager.get_falling_glyph(letter_obj.value, text_color)
+            text_rect = self.sprite_batcher.draw_surface(
+                "glyphs", glyph, center=(draw_pos_x, draw_pos_y)
+            )
+            # Inflate rect by 50% for easier interaction (25 pixels on each side)
+            letter_obj.rect.update(text_rect)
+            letter_obj.rect.inflate_ip(50, 50)
+
+            # The inflated collision rect covers the drawn letter
+            self.dirty_rects.mark(letter_obj.rect)
+
+        self.sprite_batcher.flush(self.screen)
 
     def _update_and_draw_emojis(self, offset_x, offset_y):
         """Update and draw falling emoji targets."""
-        for emoji_obj in self.emoji_objects:
+        for emoji_obj, (render_x, render_y) in zip(
+            self.emoji_objects, self.physics_system.render_positions(self.emoji_objects)
+        ):
             # Draw the emoji
-            draw_pos_x = int(emoji_obj["x"] + offset_x)
-            draw_pos_y = int(emoji_obj["y"] + offset_y)
+            draw_pos_x = int(render_x + offset_x)
+            draw_pos_y = int(render_y + offset_y)
 
             # Get emoji surface
-            emoji_surface = emoji_obj["surface"]
+            emoji_surface = emoji_obj.surface
             emoji_rect = emoji_surface.get_rect(center=(draw_pos_x, draw_pos_y))
 
             # Create interaction rect (slightly larger for easier clicking)
-            interaction_rect = emoji_rect.inflate(20, 20)
-            emoji_obj["rect"] = interaction_rect
+            emoji_obj.rect.update(emoji_rect)
+            emoji_obj.rect.inflate_ip(20, 20)
 
             # Apply visual feedback for current target
-            if emoji_obj["letter"] == self.target_letter:
+            if emoji_obj.letter == self.target_letter:
                 # Add subtle glow effect for current target emojis
-                glow_surface = pygame.Surface(
-                    (emoji_rect.width + 10, emoji_rect.height + 10), pygame.SRCALPHA
+                glow_size = (emoji_rect.width + 10, emoji_rect.height + 10)
+                glow_color = random.choice(FLAME_COLORS)
+                self.sprite_batcher.draw(
+                    "emojis",
+                    ("emoji_glow", glow_size, glow_color),
+                    lambda: self._render_emoji_glow(glow_size, glow_color),
+                    center=(draw_pos_x, draw_pos_y),
                 )
-                glow_color = (*random.choice(FLAME_COLORS), 60)  # Semi-transparent glow
-                pygame.draw.rect(
-                    glow_surface, glow_color, glow_surface.get_rect(), border_radius=15
-                )
-                glow_rect = glow_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                self.screen.blit(glow_surface, glow_rect)
 
-            # Draw the emoji
-            self.screen.blit(emoji_surface, emoji_rect)
+            # Draw the emoji; the inflated rect also covers the target glow
+            self.sprite_batcher.draw_surface("emojis", emoji_surface, emoji_rect.topleft)
+            self.dirty_rects.mark(emoji_obj.rect)
+
+        self.sprite_batcher.flush(self.screen)
+
+    def _render_emoji_glow(self, size, color):
+        """Render the semi-transparent rounded glow drawn behind target emojis."""
+        glow_surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(glow_surface, (*color, 60), glow_surface.get_rect(), border_radius=15)
+        return glow_surface
 
     def _process_lasers(self, offset_x, offset_y):
         """Process legacy laser effects."""
         for laser in self.lasers[:]:
             if laser["duration"] > 0:
                 if laser["type"] != "flamethrower":
-                    pygame.draw.line(
-                        self.screen,
-                        random.choice(laser.get("colors", FLAME_COLORS)),
-                        (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
-                        (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
-                        random.choice(laser.get("widths", [5, 10, 15])),
+                    self.dirty_rects.mark(
+                        pygame.draw.line(
+                            self.screen,
+                            random.choice(laser.get("colors", FLAME_COLORS)),
+                            (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
+                            (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
+                            random.choice(laser.get("widths", [5, 10, 15])),
+                        )
                     )
                 laser["duration"] -= 1
             else:
@@ -948,7 +778,7 @@ class CLCaseLevel(BaseLevel):
         """Process explosion effects."""
         for explosion in self.explosions[:]:
             if explosion["duration"] > 0:
-                self.draw_explosion(explosion, offset_x, offset_y)
+                self.dirty_rects.mark(self.draw_explosion(explosion, offset_x, offset_y))
                 explosion["duration"] -= 1
             else:
                 self.explosions.remove(explosion)
@@ -5,7 +5,20 @@ import pygame
 
 from Display_settings import PERFORMANCE_SETTINGS, load_display_mode
 from settings import BLACK, COLORS_COLLISION_DELAY, FLAME_COLORS, LEVEL_PROGRESS_PATH, WHITE
-from universal_class import GlassShatterManager, HUDManager, MultiTouchManager
+from base_level import ColorDot
+from unified_physics import UnifiedPhysicsSystem
+from universal_class import (
+    DirtyRectManager,
+    GlassShatterManager,
+    HUDManager,
+    MultiTouchManager,
+    StarFieldManager,
+)
+from utils.dot_renderer import DotSpriteCache
+from utils.texture_atlas import get_sprite_batcher
+
+DOT_RADIUS = 48
+DOT_SIZE = DOT_RADIUS * 1.8  # Physics collides bodies at size / 1.8
 
 
 class ColorsLevel:
@@ -83,13 +96,35 @@ class ColorsLevel:
         ]
         self.color_names = ["Blue", "Red", "Green", "Yellow", "Purple"]
 
-        # PERFORMANCE OPTIMIZATION: Spatial grid for collision detection
+        # Dot collisions run through the shared physics pipeline
+        self.physics_system = UnifiedPhysicsSystem(width, height, collision_strategy="grid")
+        self.physics_system.collision_frequency = self.performance_settings.get(
+            "collision_check_frequency", 1
+        )
+        self.physics_system.restitution = 0.9  # Head-on hits keep 80% of the speed
+        self.physics_system.contact_callback = self._create_collision_particles
+
+        # Dots bounce off every edge at full speed from the first tick, and
+        # the walls stop their drawn radius rather than half their size
+        self.physics_system.bounce_damping = 1.0
+        self.physics_system.wall_extent = DOT_RADIUS / DOT_SIZE
+        self.physics_system.floor_push = None
+
+        # Fixed-timestep simulation, rendered at the display mode's frame rate
+        self.physics_system.configure_timestep(self.performance_settings)
+        self.render_fps = self.performance_settings.get("render_fps", 50)
+        self.dirty_rects = DirtyRectManager.from_settings(width, height, self.performance_settings)
+        self.sprite_batcher = get_sprite_batcher()
+        self.star_field = StarFieldManager(width, height)
+
+        # Spatial grid used for spawn placement
         self.grid_size = 120  # Grid cell size for spatial partitioning
         self.grid_cols = (width // self.grid_size) + 1
         self.grid_rows = (height // self.grid_size) + 1
         # VISUAL ENHANCEMENT: Shimmer and depth effects
         self.frame_counter = 0
         self.shimmer_seeds = {}  # Per-dot shimmer seed for consistency
+        self.dot_sprites = DotSpriteCache()  # Shaded dots rendered once, then blitted
 
         # Game state variables
         self.reset_level_state()
@@ -105,6 +140,7 @@ class ColorsLevel:
         self.total_dots_destroyed = 0
         self.checkpoint_trigger = 10
         self.target_dots_left = 10
+        self.physics_system.clear()
         self.dots = []
         self.dots_active = False
         self.overall_destroyed = 0
@@ -117,18 +153,6 @@ class ColorsLevel:
         self.frame_counter = 0
         self.shimmer_seeds = {}
 
-    def _create_spatial_grid(self):
-        """Create spatial grid for optimized collision detection."""
-        grid = [[[] for _ in range(self.grid_cols)] for _ in range(self.grid_rows)]
-
-        for i, dot in enumerate(self.dots):
-            if dot["alive"]:
-                grid_x = min(int(dot["x"] // self.grid_size), self.grid_cols - 1)
-                grid_y = min(int(dot["y"] // self.grid_size), self.grid_rows - 1)
-                grid[grid_y][grid_x].append(i)
-
-        return grid
-
     def _get_grid_neighbors(self, x, y):
         """Get neighboring grid cells for collision detection."""
         grid_x = min(int(x // self.grid_size), self.grid_cols - 1)
@@ -142,19 +166,6 @@ class ColorsLevel:
                     neighbors.append((nx, ny))
         return neighbors
 
-    def _calculate_dot_shading(self, base_color, radius, is_target=False):
-        """Calculate depth shading for dots with gradient effect."""
-        # Create gradient from lighter center to darker edge
-        center_color = tuple(min(255, int(c * 1.3)) for c in base_color)
-        edge_color = tuple(max(0, int(c * 0.7)) for c in base_color)
-
-        # Add glow effect for target dots
-        if is_target:
-            glow_intensity = 0.2 + 0.1 * math.sin(self.frame_counter * 0.1)
-            center_color = tuple(min(255, int(c * (1.0 + glow_intensity))) for c in center_color)
-
-        return center_color, edge_color
-
     def _get_shimmer_effect(self, dot_id):
         """Get shimmer effect values for a specific dot."""
         if dot_id not in self.shimmer_seeds:
@@ -314,22 +325,8 @@ class ColorsLevel:
 
         # Create dots with positions
         for i, (x, y) in enumerate(initial_positions):
-            dx = random.uniform(-6, 6)
-            dy = random.uniform(-6, 6)
             color = disperse_particles[i]["color"]
-
-            self.dots.append(
-                {
-                    "x": x,
-                    "y": y,
-                    "dx": dx,
-                    "dy": dy,
-                    "color": color,
-                    "radius": 48,
-                    "target": True if color == self.mother_color else False,
-                    "alive": True,
-                }
-            )
+            self.dots.append(self._create_dot(x, y, color, color == self.mother_color))
 
         self.dots_active = True
 
@@ -349,49 +346,54 @@ class ColorsLevel:
         """Main game loop for the colors level."""
         clock = pygame.time.Clock()
 
-        # Background stars
-        stars = []
-        for _ in range(100):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            radius = random.randint(2, 4)
-            stars.append([x, y, radius])
+        # Fresh background stars for this run
+        self.star_field.reset()
+
+        self.physics_system.timestep.reset()
+        frame_seconds = self.physics_system.timestep.tick_seconds
+        self.dirty_rects.invalidate()
 
         while self.running:
             # Handle events
             if not self._handle_events():
                 return False
 
-            # Update dots physics
-            self._update_dots()
-
-            # Update collision delay counter
-            if not self.collision_enabled:
-                self.collision_delay_counter += 1
-                if self.collision_delay_counter >= self.collision_delay_frames:
-                    self.collision_enabled = True
-                    self.collision_delay_counter = 0
-                    self._create_collision_enabled_effect()
-
-            # Check for collisions between dots (with performance optimization)
-            if self.collision_enabled:
-                # Use collision frequency from performance settings
-                collision_frequency = self.performance_settings.get("collision_check_frequency", 1)
-                if self.frame_counter % collision_frequency == 0:
-                    self._handle_dot_collisions()
+            # Update dots physics in fixed ticks
+            self.physics_system.advance(frame_seconds, self._simulation_tick)
 
             # Draw everything
-            self._draw_frame(stars)
+            self._draw_frame()
 
             # Handle end condition (target_dots_left <= 0)
             if self.target_dots_left <= 0:
                 self._generate_new_dots()
 
-            pygame.display.flip()
-            clock.tick(50)
+            self.sprite_batcher.end_frame()
+
+            self.dirty_rects.present()
+            frame_seconds = clock.tick(self.render_fps) / 1000.0
 
         return False
 
+    def _simulation_tick(self):
+        """Advance dot physics and collisions by one fixed tick."""
+        # Move and bounce every dot in one batched pass
+        self.physics_system.step()
+
+        # Update collision delay counter
+        if not self.collision_enabled:
+            self.collision_delay_counter += 1
+            if self.collision_delay_counter >= self.collision_delay_frames:
+                self.collision_enabled = True
+                self.collision_delay_counter = 0
+                self._create_collision_enabled_effect()
+
+        # Check for collisions between dots (frequency set from performance settings)
+        if self.collision_enabled:
+            self.physics_system.handle_layered_collisions(
+                {"dot": self.dots}, self.physics_system.tick_count
+            )
+
     def _handle_events(self):
         """Handle pygame events for the colors level."""
         for event in pygame.event.get():
@@ -431,14 +433,17 @@ class ColorsLevel:
         """
         hit_target = False
 
-        for dot in self.dots:
-            if dot["alive"]:
-                dist = math.hypot(x - dot["x"], y - dot["y"])
+        # Wake resting dots around the click
+        self.physics_system.wake_bodies(x, y, 150, self.dots)
+
+        for dot, (dot_x, dot_y) in zip(self.dots, self.physics_system.positions(self.dots)):
+            if dot.alive:
+                dist = math.hypot(x - dot_x, y - dot_y)
                 # Increase interaction radius by 25 pixels for easier targeting
-                interaction_radius = dot["radius"] + 25
+                interaction_radius = DOT_RADIUS + 25
                 if dist <= interaction_radius:
                     hit_target = True
-                    if dot["target"]:
+                    if dot.target:
                         self._destroy_target_dot(dot)
                     break
 
@@ -446,7 +451,8 @@ class ColorsLevel:
 
     def _destroy_target_dot(self, dot):
         """Handle destruction of a target dot."""
-        dot["alive"] = False
+        dot.alive = False
+        self.physics_system.remove_object(dot)
         self.target_dots_left -= 1
         self.score += 10
         self.overall_destroyed += 1
@@ -458,7 +464,7 @@ class ColorsLevel:
             self.sound_manager.play_voice(self.mother_color_name.lower())
 
         # Create explosion effect
-        self.create_explosion(dot["x"], dot["y"], color=dot["color"], max_radius=60, duration=15)
+        self.create_explosion(dot.x, dot.y, color=dot.color, max_radius=60, duration=15)
         # Check if we need to switch the target color
         if self.current_color_dots_destroyed >= 2:
             self._switch_target_color()
@@ -489,9 +495,9 @@ class ColorsLevel:
         # PERFORMANCE OPTIMIZATION: Batch update target status and count in single loop
         target_count = 0
         for d in self.dots:
-            if d["alive"]:
-                is_target = d["color"] == self.mother_color
-                d["target"] = is_target
+            if d.alive:
+                is_target = d.color == self.mother_color
+                d.target = is_target
                 if is_target:
                     target_count += 1
 
@@ -504,6 +510,7 @@ class ColorsLevel:
 
         # Show checkpoint screen
         checkpoint_result = self.checkpoint_screen(self.screen, "colors")
+        self.dirty_rects.invalidate()
 
         if not checkpoint_result:
             self.running = False
@@ -511,139 +518,43 @@ class ColorsLevel:
             # If Continue was selected, restore the saved dot count
         self.target_dots_left = self.dots_before_checkpoint
 
-    def _update_dots(self):
-        """Update dot positions and handle bouncing."""
-        for dot in self.dots:
-            if not dot["alive"]:
-                continue
-
-            dot["x"] += dot["dx"]
-            dot["y"] += dot["dy"]
-
-            # Bounce off walls
-            if dot["x"] - dot["radius"] < 0:
-                dot["x"] = dot["radius"]
-                dot["dx"] *= -1
-            if dot["x"] + dot["radius"] > self.width:
-                dot["x"] = self.width - dot["radius"]
-                dot["dx"] *= -1
-            if dot["y"] - dot["radius"] < 0:
-                dot["y"] = dot["radius"]
-                dot["dy"] *= -1
-            if dot["y"] + dot["radius"] > self.height:
-                dot["y"] = self.height - dot["radius"]
-                dot["dy"] *= -1
-
-    def _handle_dot_collisions(self):
-        """Handle collisions between dots with spatial optimization."""
-        if len(self.dots) < 2:
-            return
-
-        # PERFORMANCE OPTIMIZATION: Use spatial grid to reduce collision checks
-        grid = self._create_spatial_grid()
-        checked_pairs = set()
-
-        for grid_y in range(self.grid_rows):
-            for grid_x in range(self.grid_cols):
-                cell_dots = grid[grid_y][grid_x]
-                if len(cell_dots) < 2:
-                    continue
-
-                # Check collisions within cell and adjacent cells
-                for neighbor_x, neighbor_y in [(grid_x, grid_y)] + [
-                    (grid_x + dx, grid_y + dy)
-                    for dx in [-1, 0, 1]
-                    for dy in [-1, 0, 1]
-                    if 0 <= grid_x + dx < self.grid_cols and 0 <= grid_y + dy < self.grid_rows
-                ]:
-                    if neighbor_x == grid_x and neighbor_y == grid_y:
-                        continue
-                    neighbor_dots = grid[neighbor_y][neighbor_x]
-
-                    for i in cell_dots:
-                        for j in neighbor_dots:
-                            if i >= j:  # Avoid duplicate checks
-                                continue
-                            pair = (min(i, j), max(i, j))
-                            if pair in checked_pairs:
-                                continue
-                            checked_pairs.add(pair)
-
-                            dot1, dot2 = self.dots[i], self.dots[j]
-                            if not (dot1["alive"] and dot2["alive"]):
-                                continue
-
-                            # Calculate distance between centers
-                            dx = dot1["x"] - dot2["x"]
-                            dy = dot1["y"] - dot2["y"]
-                            distance_sq = dx * dx + dy * dy
-                            collision_dist_sq = (dot1["radius"] + dot2["radius"]) ** 2
-
-                            # Check for collision (using squared distance for performance)
-                            if distance_sq < collision_dist_sq and distance_sq > 0:
-                                distance = math.sqrt(distance_sq)
-                                self._resolve_collision(dot1, dot2, dx, dy, distance)
-
-    def _resolve_collision(self, dot1, dot2, dx, dy, distance):
-        """Resolve collision between two dots."""
-        # Normalize direction vector
-        if distance > 0:
-            nx = dx / distance
-            ny = dy / distance
-        else:
-            nx, ny = 1, 0
-
-        # Calculate relative velocity
-        dvx = dot1["dx"] - dot2["dx"]
-        dvy = dot1["dy"] - dot2["dy"]
-
-        # Calculate velocity component along the normal
-        velocity_along_normal = dvx * nx + dvy * ny
-
-        # Only separate if moving toward each other
-        if velocity_along_normal < 0:
-            # Separate dots to prevent sticking
-            overlap = (dot1["radius"] + dot2["radius"]) - distance
-            dot1["x"] += overlap / 2 * nx
-            dot1["y"] += overlap / 2 * ny
-            dot2["x"] -= overlap / 2 * nx
-            dot2["y"] -= overlap / 2 * ny
-
-            # Swap velocities and reduce speed by 20%
-            temp_dx = dot1["dx"]
-            temp_dy = dot1["dy"]
-
-            dot1["dx"] = dot2["dx"] * 0.8
-            dot1["dy"] = dot2["dy"] * 0.8
-
-            dot2["dx"] = temp_dx * 0.8
-            dot2["dy"] = temp_dy * 0.8
-
-            # Create small particle effect at collision point
-            collision_x = (dot1["x"] + dot2["x"]) / 2
-            collision_y = (dot1["y"] + dot2["y"]) / 2
-            for _ in range(3):
-                self.particle_manager.create_particle(
-                    collision_x,
-                    collision_y,
-                    random.choice([dot1["color"], dot2["color"]]),
-                    random.randint(5, 10),
-                    random.uniform(-2, 2),
-                    random.uniform(-2, 2),
-                    10,
-                )
+    def _create_dot(self, x, y, color, target):
+        """Create a dot with a random velocity and bind it to the physics store."""
+        dot = ColorDot(x, y, f"dot_{color}", color, target)
+        dot.size = DOT_SIZE
+        dot.mass = 1.0  # Equal masses, so collisions depend on velocity alone
+        dot.dx = random.uniform(-6, 6)
+        dot.dy = random.uniform(-6, 6)
+        dot.can_bounce = True
+        return self.physics_system.add_object(dot)
+
+    def _create_collision_particles(self, dot1, dot2):
+        """Create small particle effect at a collision point."""
+        collision_x = (dot1.x + dot2.x) / 2
+        collision_y = (dot1.y + dot2.y) / 2
+        for _ in range(3):
+            self.particle_manager.create_particle(
+                collision_x,
+                collision_y,
+                random.choice([dot1.color, dot2.color]),
+                random.randint(5, 10),
+                random.uniform(-2, 2),
+                random.uniform(-2, 2),
+                10,
+            )
 
     def _create_collision_enabled_effect(self):
         """Create visual effect when collisions are enabled."""
         for dot in self.dots:
-            if dot["alive"]:
+            if dot.alive:
                 self.particle_manager.create_particle(
-                    dot["x"], dot["y"], dot["color"], dot["radius"] * 1.5, 0, 0, 15
+                    dot.x, dot.y, dot.color, DOT_RADIUS * 1.5, 0, 0, 15
                 )
 
-    def _draw_frame(self, stars):
+    def _draw_frame(self):
         """Draw a single frame of the colors level with visual enhancements."""
         self.frame_counter += 1
+        self.dot_sprites.begin_frame()
 
         # Update glass shatter manager
         self.glass_shatter_manager.update()
@@ -651,6 +562,17 @@ class ColorsLevel:
         # Apply screen shake if active
         offset_x, offset_y = self.glass_shatter_manager.get_screen_shake_offset()
 
+        # Background, cracks or shake change the whole screen
+        self.dirty_rects.watch(
+            "scene",
+            (
+                self.glass_shatter_manager.get_background_color(),
+                self.glass_shatter_manager.get_crack_count(),
+                offset_x,
+                offset_y,
+            ),
+        )
+
         # Fill background based on shatter state
         self.screen.fill(self.glass_shatter_manager.get_background_color())
 
@@ -658,97 +580,39 @@ class ColorsLevel:
         self.glass_shatter_manager.draw_cracks(self.screen)
 
         # Draw background stars
-        for star in stars:
-            x, y, radius = star
-            y += 1
-            pygame.draw.circle(self.screen, (200, 200, 200), (x + offset_x, y + offset_y), radius)
-            if y > self.height + radius:
-                y = random.randint(-50, -10)
-                x = random.randint(0, self.width)
-            star[1] = y
-            star[0] = x
+        self.dirty_rects.mark(self.star_field.draw(self.screen, offset_x, offset_y))
 
         # VISUAL ENHANCEMENT: Draw dots with display-mode optimized effects
-        for dot in self.dots:
-            if dot["alive"]:
-                draw_x = int(dot["x"] + offset_x)
-                draw_y = int(dot["y"] + offset_y)
+        for dot, (render_x, render_y) in zip(
+            self.dots, self.physics_system.render_positions(self.dots)
+        ):
+            if dot.alive:
+                draw_x = int(render_x + offset_x)
+                draw_y = int(render_y + offset_y)
 
                 # Check if glow effects are enabled for this display mode
                 glow_effects_enabled = self.performance_settings.get("particle_glow_effects", True)
 
                 if glow_effects_enabled:
-                    # Complex rendering with shimmer and gradient effects
-                    dot_id = dot.get("id", id(dot))  # Use ID or fallback to object ID
-
-                    # Get shimmer effect
-                    shimmer_scale, shimmer_alpha = self._get_shimmer_effect(dot_id)
-
-                    # Calculate shaded colors
-                    center_color, edge_color = self._calculate_dot_shading(
-                        dot["color"], dot["radius"], dot["target"]
+                    # Shaded, shimmering dot from the sprite cache
+                    shimmer_scale, shimmer_alpha = self._get_shimmer_effect(id(dot))
+                    sprite, half = self.dot_sprites.get(
+                        dot.color,
+                        DOT_RADIUS * shimmer_scale,
+                        shimmer_alpha,
+                        dot.target,
+                        self.frame_counter,
                     )
-
-                    # Apply shimmer to radius
-                    shimmer_radius = int(dot["radius"] * shimmer_scale)
-
-                    # Draw depth gradient (multiple circles for smooth gradient)
-                    for i in range(3):
-                        gradient_radius = shimmer_radius - (i * shimmer_radius // 4)
-                        if gradient_radius > 0:
-                            # Interpolate between center and edge color
-                            blend_factor = i / 3.0
-                            blended_color = tuple(
-                                int(
-                                    center_color[j] * (1 - blend_factor)
-                                    + edge_color[j] * blend_factor
-                                )
-                                for j in range(3)
-                            )
-
-                            # Create surface with alpha for shimmer effect
-                            if i == 0:  # Outermost circle gets shimmer alpha
-                                dot_surface = pygame.Surface(
-                                    (gradient_radius * 2, gradient_radius * 2), pygame.SRCALPHA
-                                )
-                                pygame.draw.circle(
-                                    dot_surface,
-                                    (*blended_color, shimmer_alpha),
-                                    (gradient_radius, gradient_radius),
-                                    gradient_radius,
-                                )
-                                self.screen.blit(
-                                    dot_surface,
-                                    (draw_x - gradient_radius, draw_y - gradient_radius),
-                                )
-                            else:
-                                pygame.draw.circle(
-                                    self.screen, blended_color, (draw_x, draw_y), gradient_radius
-                                )
-
-                    # Add extra glow for target dots
-                    if dot["target"]:
-                        glow_radius = shimmer_radius + 8
-                        glow_intensity = int(50 + 30 * math.sin(self.frame_counter * 0.15))
-                        glow_surface = pygame.Surface(
-                            (glow_radius * 2, glow_radius * 2), pygame.SRCALPHA
-                        )
-                        pygame.draw.circle(
-                            glow_surface,
-                            (*dot["color"], glow_intensity),
-                            (glow_radius, glow_radius),
-                            glow_radius,
-                        )
-                        self.screen.blit(glow_surface, (draw_x - glow_radius, draw_y - glow_radius))
+                    self.screen.blit(sprite, (draw_x - half, draw_y - half))
                 else:
                     # Simplified rendering for better performance (QBoard mode)
-                    radius = dot["radius"]
+                    radius = DOT_RADIUS
 
                     # Simple solid circles with optional target highlighting
-                    pygame.draw.circle(self.screen, dot["color"], (draw_x, draw_y), radius)
+                    pygame.draw.circle(self.screen, dot.color, (draw_x, draw_y), radius)
 
                     # Add simple border for target dots
-                    if dot["target"]:
+                    if dot.target:
                         border_width = 3
                         pygame.draw.circle(
                             self.screen,
@@ -758,16 +622,20 @@ class ColorsLevel:
                             border_width,
                         )
 
+                # Shimmer grows dots by up to 10%; glow and borders add a few pixels
+                extent = int(DOT_RADIUS * 1.1) + 9
+                self.dirty_rects.mark((draw_x - extent, draw_y - extent, extent * 2, extent * 2))
+
         # Draw explosions with offsets
         for explosion in self.explosions[:]:
             if explosion["duration"] > 0:
-                self.draw_explosion(explosion, offset_x, offset_y)
+                self.dirty_rects.mark(self.draw_explosion(explosion, offset_x, offset_y))
                 explosion["duration"] -= 1
             else:
                 self.explosions.remove(explosion)
 
         # Display HUD info
-        self.hud_manager.display_info(
+        hud_rect = self.hud_manager.display_info(
             self.screen,
             self.score,
             "color",
@@ -780,14 +648,15 @@ class ColorsLevel:
         )
 
         # Show sample target dot reference at top right
-        self.hud_manager.display_sample_target(self.screen, self.mother_color, 48)
+        sample_rect = self.hud_manager.display_sample_target(self.screen, self.mother_color, 48)
         # Display collision status
-        self.hud_manager.display_collision_status(
+        status_rect = self.hud_manager.display_collision_status(
             self.screen,
             self.collision_enabled,
             self.collision_delay_counter,
             self.collision_delay_frames,
         )
+        self.dirty_rects.mark([rect for rect in (hud_rect, sample_rect, status_rect) if rect])
 
     def _generate_new_dots(self):
         """Generate new dots when target_dots_left reaches 0 with optimized placement."""
@@ -813,11 +682,11 @@ class ColorsLevel:
         self.collision_delay_counter = 0
 
         # Remove dead dots
-        self.dots = [d for d in self.dots if d["alive"]]
+        self.dots = [d for d in self.dots if d.alive]
 
         # PERFORMANCE OPTIMIZATION: Use grid-based placement algorithm
         new_dots_needed = min(85 - len(self.dots), 42)  # Reduced from 100 to 85, and from 50 to 42
-        existing_target_dots = sum(1 for d in self.dots if d["color"] == self.mother_color)
+        existing_target_dots = sum(1 for d in self.dots if d.color == self.mother_color)
         target_dots_needed = max(0, new_dots_count - existing_target_dots)
 
         # Create occupancy grid for faster collision detection during placement
@@ -835,8 +704,6 @@ class ColorsLevel:
                 continue
 
             x, y = position
-            dx = random.uniform(-6, 6)
-            dy = random.uniform(-6, 6)
 
             # Determine if this dot is a target or distractor
             is_target = False
@@ -849,20 +716,7 @@ class ColorsLevel:
                 ]
                 color = random.choice(distractor_colors)
 
-            dot_id = len(self.dots)
-            self.dots.append(
-                {
-                    "x": x,
-                    "y": y,
-                    "dx": dx,
-                    "dy": dy,
-                    "color": color,
-                    "radius": 48,
-                    "target": is_target,
-                    "alive": True,
-                    "id": dot_id,  # Add unique ID for shimmer tracking
-                }
-            )
+            self.dots.append(self._create_dot(x, y, color, is_target))
 
             # Mark position as occupied in grid
             grid_x = min(int(x // self.grid_size), self.grid_cols - 1)
@@ -873,9 +727,9 @@ class ColorsLevel:
         # PERFORMANCE OPTIMIZATION: Single pass target update
         target_count = 0
         for d in self.dots:
-            is_target = d["color"] == self.mother_color
-            d["target"] = is_target
-            if is_target and d["alive"]:
+            is_target = d.color == self.mother_color
+            d.target = is_target
+            if is_target and d.alive:
                 target_count += 1
 
         self.target_dots_left = target_count
@@ -885,9 +739,9 @@ class ColorsLevel:
         occupancy_grid = [[False for _ in range(self.grid_cols)] for _ in range(self.grid_rows)]
 
         for dot in self.dots:
-            if dot["alive"]:
-                grid_x = min(int(dot["x"] // self.grid_size), self.grid_cols - 1)
-                grid_y = min(int(dot["y"] // self.grid_size), self.grid_rows - 1)
+            if dot.alive:
+                grid_x = min(int(dot.x // self.grid_size), self.grid_cols - 1)
+                grid_y = min(int(dot.y // self.grid_size), self.grid_rows - 1)
                 occupancy_grid[grid_y][grid_x] = True
 
         return occupancy_grid
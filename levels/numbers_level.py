@@ -3,11 +3,11 @@ import random
 import pygame
 from typing import List, Dict, Any
 
+from Display_settings import PERFORMANCE_SETTINGS
 from settings import (
     BLACK,
     FLAME_COLORS,
     GROUP_SIZE,
-    LETTER_SPAWN_INTERVAL,
     LEVEL_PROGRESS_PATH,
     SEQUENCES,
     WHITE,
@@ -17,11 +17,13 @@ from unified_physics import UnifiedObjectFactory, UnifiedTargetSystem, UnifiedPh
 from universal_class import (
     CenterPieceManager,
     CheckpointManager,
+    DirtyRectManager,
     FlamethrowerManager,
     GlassShatterManager,
     HUDManager,
     MultiTouchManager,
 )
+from utils.texture_atlas import get_sprite_batcher
 
 
 class NumbersLevel(BaseLevel):
@@ -97,7 +99,16 @@ class NumbersLevel(BaseLevel):
         # Initialize unified systems
         self.object_factory = UnifiedObjectFactory(resource_manager)
         self.target_system = UnifiedTargetSystem()
-        self.physics_system = UnifiedPhysicsSystem(width, height)
+        self.physics_system = UnifiedPhysicsSystem(width, height, collision_strategy="sweep")
+
+        # Fixed-timestep simulation, rendered at the display mode's frame rate
+        timing = PERFORMANCE_SETTINGS.get(
+            center_piece_manager.display_mode, PERFORMANCE_SETTINGS["DEFAULT"]
+        )
+        self.physics_system.configure_timestep(timing)
+        self.render_fps = timing["render_fps"]
+        self.dirty_rects = DirtyRectManager.from_settings(width, height, timing)
+        self.sprite_batcher = get_sprite_batcher()
 
         # Numbers configuration
         self.sequence = SEQUENCES["numbers"]
@@ -133,6 +144,7 @@ class NumbersLevel(BaseLevel):
         # Game state
         self.running = True
         self.game_started = False
+        self.physics_system.clear()
         self.numbers = []
         self.numbers_to_spawn = self.current_group.copy()
         print(f"🎯 DEBUG: Numbers to spawn initialized: {self.numbers_to_spawn}")
@@ -166,28 +178,22 @@ class NumbersLevel(BaseLevel):
         """
         self.reset_level_state()
 
-        # Initialize background stars
-        stars = []
-        for _ in range(100):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            radius = random.randint(2, 4)
-            stars.append([x, y, radius])
+        # Fresh background stars for this run
+        self.star_field.reset()
 
         # Main game loop
         clock = pygame.time.Clock()
+        self.physics_system.timestep.reset()
+        frame_seconds = self.physics_system.timestep.tick_seconds
+        self.dirty_rects.invalidate()
 
         while self.running:
             # Handle events
             if not self._handle_events():
                 return False
 
-            # Spawn numbers
-            if self.game_started:
-                self._spawn_numbers()
-
-            # Update physics and collisions
-            self._update_numbers()
+            # Spawn numbers and update physics in fixed ticks
+            self.physics_system.advance(frame_seconds, self._simulation_tick)
 
             # Handle checkpoint logic
             self._handle_checkpoint_logic()
@@ -198,15 +204,23 @@ class NumbersLevel(BaseLevel):
                 return progression_result
 
             # Draw frame
-            self._draw_frame(stars)
+            self._draw_frame()
 
-            # Update frame counter and display
-            self.frame_count += 1
-            pygame.display.flip()
-            clock.tick(50)
+            # Update display
+            self.sprite_batcher.end_frame()
+            self.dirty_rects.present()
+            frame_seconds = clock.tick(self.render_fps) / 1000.0
 
         return False
 
+    def _simulation_tick(self):
+        """Advance spawning, physics and collisions by one fixed tick."""
+        self.physics_system.apply_queued_explosions({"number": self.numbers})
+        if self.game_started:
+            self._spawn_numbers()
+        self._update_numbers()
+        self.frame_count += 1
+
     def _handle_events(self):
         """Handle all pygame events."""
         for event in pygame.event.get():
@@ -264,28 +278,31 @@ class NumbersLevel(BaseLevel):
         # Flag to track if click hit a target
         hit_target = False
 
+        # Wake resting numbers around the click
+        self.physics_system.wake_bodies(click_x, click_y, 150, self.numbers)
+
         # Process Click on Target
         for number_obj in self.numbers[:]:
-            if number_obj["rect"].collidepoint(click_x, click_y):
+            if number_obj.rect.collidepoint(click_x, click_y):
                 hit_target = True  # Marked as hit
-                if number_obj["value"] == self.target_number:
+                if number_obj.value == self.target_number:
                     self.score += 10
                     # Play voice sound for destroyed target
                     if self.sound_manager:
-                        self.sound_manager.play_voice(str(number_obj["value"]))
+                        self.sound_manager.play_voice(str(number_obj.value))
                     # Common destruction effects
-                    self.create_explosion(number_obj["x"], number_obj["y"])
+                    self.create_explosion(number_obj.x, number_obj.y)
                     self.create_flame_effect(
-                        self.player_x, self.player_y - 80, number_obj["x"], number_obj["y"]
+                        self.player_x, self.player_y - 80, number_obj.x, number_obj.y
                     )
-                    self.center_piece_manager.trigger_convergence(number_obj["x"], number_obj["y"])
-                    self.apply_explosion_effect(number_obj["x"], number_obj["y"], 150, self.numbers)
+                    self.center_piece_manager.trigger_convergence(number_obj.x, number_obj.y)
+                    self.physics_system.queue_explosion(number_obj.x, number_obj.y, 150)
 
                     # Add visual feedback particles
                     for i in range(20):
                         self.create_particle(
-                            number_obj["x"],
-                            number_obj["y"],
+                            number_obj.x,
+                            number_obj.y,
                             random.choice(FLAME_COLORS),
                             random.randint(40, 80),
                             random.uniform(-2, 2),
@@ -295,6 +312,7 @@ class NumbersLevel(BaseLevel):
 
                     # Remove number and update counts
                     self.numbers.remove(number_obj)
+                    self.physics_system.remove_object(number_obj)
                     self.numbers_destroyed += 1
 
                     # Update target
@@ -314,83 +332,22 @@ class NumbersLevel(BaseLevel):
 
     def _spawn_numbers(self):
         """Spawn numbers at regular intervals."""
-        if self.numbers_to_spawn:
-            if self.frame_count % LETTER_SPAWN_INTERVAL == 0:
-                number_value = self.numbers_to_spawn.pop(0)
-                print(f"🎯 DEBUG: Spawning number '{number_value}' (frame {self.frame_count})")
-                print(f"🎯 DEBUG: numbers_to_spawn remaining: {self.numbers_to_spawn}")
-                number_obj = {
-                    "value": number_value,
-                    "x": random.randint(50, self.width - 50),
-                    "y": -50,
-                    "rect": pygame.Rect(0, 0, 0, 0),  # Will be updated when drawn
-                    "size": 240,  # Fixed size
-                    "dx": random.choice([-1, -0.5, 0.5, 1]) * 1.5,  # Horizontal drift
-                    "dy": random.choice([6, 11.5]) * 1.5 * 3.2,  # 20% faster fall speed
-                    "can_bounce": False,  # Start without bouncing
-                    "mass": random.uniform(40, 60),  # Mass for collisions
-                }
-                self.numbers.append(number_obj)
-                self.numbers_spawned += 1
+        number_obj = self.object_factory.spawn_next(
+            "number", self.numbers_to_spawn, self.frame_count, self.physics_system, self.width
+        )
+        if number_obj is not None:
+            print(f"🎯 DEBUG: Spawning number '{number_obj.value}' (frame {self.frame_count})")
+            print(f"🎯 DEBUG: numbers_to_spawn remaining: {self.numbers_to_spawn}")
+            self.numbers.append(number_obj)
+            self.numbers_spawned += 1
 
     def _update_numbers(self):
         """Update physics and collisions for all numbers."""
-        # Update positions and bouncing
-        for number_obj in self.numbers[:]:
-            number_obj["x"] += number_obj["dx"]
-            number_obj["y"] += number_obj["dy"]
-
-            # Bouncing Logic
-            if not number_obj["can_bounce"] and number_obj["y"] > self.height // 5:
-                number_obj["can_bounce"] = True
-
-            if number_obj["can_bounce"]:
-                bounce_dampening = 0.8
-
-                # Left/Right Walls
-                if number_obj["x"] <= 0 + number_obj.get("size", 50) / 2:
-                    number_obj["x"] = 0 + number_obj.get("size", 50) / 2
-                    number_obj["dx"] = abs(number_obj["dx"]) * bounce_dampening
-                elif number_obj["x"] >= self.width - number_obj.get("size", 50) / 2:
-                    number_obj["x"] = self.width - number_obj.get("size", 50) / 2
-                    number_obj["dx"] = -abs(number_obj["dx"]) * bounce_dampening
-
-                # Top/Bottom Walls
-                if number_obj["y"] <= 0 + number_obj.get("size", 50) / 2:
-                    number_obj["y"] = 0 + number_obj.get("size", 50) / 2
-                    number_obj["dy"] = abs(number_obj["dy"]) * bounce_dampening
-                elif number_obj["y"] >= self.height - number_obj.get("size", 50) / 2:
-                    number_obj["y"] = self.height - number_obj.get("size", 50) / 2
-                    number_obj["dy"] = -abs(number_obj["dy"]) * bounce_dampening
-                    # Push horizontally away from edge on bottom bounce
-                    number_obj["dx"] *= bounce_dampening
-                    if number_obj["x"] < self.width / 2:
-                        number_obj["dx"] += random.uniform(0.1, 0.3)
-                    else:
-                        number_obj["dx"] -= random.uniform(0.1, 0.3)
+        # Move and bounce every number in one batched pass
+        self.physics_system.step()
 
         # Handle collisions using unified physics system
-        # Convert old dict objects to BaseGameObject for compatibility
-        game_objects = []
-        for num_obj in self.numbers:
-            obj = self.object_factory.create_number_object(
-                num_obj["value"], num_obj["x"], num_obj["y"]
-            )
-            obj.dx = num_obj["dx"]
-            obj.dy = num_obj["dy"] 
-            obj.mass = num_obj["mass"]
-            game_objects.append(obj)
-        
-        # Use unified collision system
-        self.physics_system.handle_object_collisions(game_objects, self.frame_count)
-        
-        # Copy updated physics back to original objects
-        for i, obj in enumerate(game_objects):
-            if i < len(self.numbers):
-                self.numbers[i]["x"] = obj.x
-                self.numbers[i]["y"] = obj.y
-                self.numbers[i]["dx"] = obj.dx
-                self.numbers[i]["dy"] = obj.dy
+        self.physics_system.handle_layered_collisions({"number": self.numbers}, self.frame_count)
 
     def _handle_checkpoint_logic(self):
         """Handle checkpoint display logic."""
@@ -465,7 +422,7 @@ class NumbersLevel(BaseLevel):
 
         return None
 
-    def _draw_frame(self, stars):
+    def _draw_frame(self):
         """Draw the complete game frame."""
         # Apply screen shake if active
         offset_x, offset_y = self.glass_shatter_manager.get_screen_shake_offset()
@@ -473,6 +430,18 @@ class NumbersLevel(BaseLevel):
         # Update glass shatter manager
         self.glass_shatter_manager.update()
 
+        # Background, cracks, shake or a checkpoint screen change the whole screen
+        self.dirty_rects.watch(
+            "scene",
+            (
+                self.glass_shatter_manager.get_background_color(),
+                self.glass_shatter_manager.get_crack_count(),
+                offset_x,
+                offset_y,
+                self.checkpoint_manager.screens_shown,
+            ),
+        )
+
         # Fill background based on shatter state
         self.screen.fill(self.glass_shatter_manager.get_background_color())
 
@@ -480,11 +449,13 @@ class NumbersLevel(BaseLevel):
         self.glass_shatter_manager.draw_cracks(self.screen)
 
         # Draw background elements (stars)
-        self._draw_stars(stars, offset_x, offset_y)
+        self.dirty_rects.mark(self._draw_stars(offset_x, offset_y))
 
         # Draw center piece (swirl particles + target display)
-        self.center_piece_manager.update_and_draw(
-            self.screen, self.target_number, "numbers", offset_x, offset_y
+        self.dirty_rects.mark(
+            self.center_piece_manager.update_and_draw(
+                self.screen, self.target_number, "numbers", offset_x, offset_y
+            )
         )
 
         # Update and draw falling numbers
@@ -492,7 +463,7 @@ class NumbersLevel(BaseLevel):
 
         # Process flamethrower effects
         self.flamethrower_manager.update()
-        self.flamethrower_manager.draw(self.screen, offset_x, offset_y)
+        self.dirty_rects.mark(self.flamethrower_manager.draw(self.screen, offset_x, offset_y))
 
         # Process legacy lasers
         self._process_lasers(offset_x, offset_y)
@@ -502,71 +473,60 @@ class NumbersLevel(BaseLevel):
 
         # Draw general particles
         self.particle_manager.update()
-        self.particle_manager.draw(self.screen, offset_x, offset_y)
+        self.dirty_rects.mark(self.particle_manager.draw(self.screen, offset_x, offset_y))
 
         # Display HUD info
-        self.hud_manager.display_info(
-            self.screen,
-            self.score,
-            self.current_ability,
-            self.target_number,
-            self.overall_destroyed,
-            self.TOTAL_NUMBERS,
-            "numbers",
+        self.dirty_rects.mark(
+            self.hud_manager.display_info(
+                self.screen,
+                self.score,
+                self.current_ability,
+                self.target_number,
+                self.overall_destroyed,
+                self.TOTAL_NUMBERS,
+                "numbers",
+            )
         )
 
-    def _draw_stars(self, stars, offset_x, offset_y):
-        """Draw and update background stars."""
-        for star in stars:
-            x, y, radius = star
-            y += 1  # Slower star movement speed
-            pygame.draw.circle(self.screen, (200, 200, 200), (x + offset_x, y + offset_y), radius)
-            if y > self.height + radius:  # Reset when fully off screen
-                y = random.randint(-50, -10)
-                x = random.randint(0, self.width)
-            star[1] = y
-            star[0] = x
-
     def _update_and_draw_numbers(self, offset_x, offset_y):
         """Update and draw falling numbers."""
-        for number_obj in self.numbers[:]:
+        for number_obj, (render_x, render_y) in zip(
+            self.numbers[:], self.physics_system.render_positions(self.numbers)
+        ):
             # Draw the number
-            draw_pos_x = int(number_obj["x"] + offset_x)
-            draw_pos_y = int(number_obj["y"] + offset_y)
+            draw_pos_x = int(render_x + offset_x)
+            draw_pos_y = int(render_y + offset_y)
 
             # Use gray for non-target numbers, black for the target number
-            text_color = BLACK if number_obj["value"] == self.target_number else (150, 150, 150)
-
-            # Use cached font surface if available
-            try:
-                cached_surface = self.resource_manager.get_falling_object_surface(
-                    "numbers", number_obj["value"], text_color
-                )
-                text_rect = cached_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                # Inflate rect by 50% for easier interaction (25 pixels on each side)
-                interaction_rect = text_rect.inflate(50, 50)
-                number_obj["rect"] = interaction_rect
-                self.screen.blit(cached_surface, text_rect)
-            except:
-                # Fallback: Original rendering method
-                text_surface = self.target_font.render(number_obj["value"], True, text_color)
-                text_rect = text_surface.get_rect(center=(draw_pos_x, draw_pos_y))
-                # Inflate rect by 50% for easier interaction (25 pixels on each side)
-                interaction_rect = text_rect.inflate(50, 50)
-                number_obj["rect"] = interaction_rect
-                self.screen.blit(text_surface, text_rect)
+            text_color = BLACK if number_obj.value == self.target_number else (150, 150, 150)
+
+            # Draw from the shared glyph atlas
+            glyph = self.resource_manager.get_falling_glyph(number_obj.value, text_color)
+            text_rect = self.sprite_batcher.draw_surface(
+                "glyphs", glyph, center=(draw_pos_x, draw_pos_y)
+            )
+            # Inflate rect by 50% for easier interaction (25 pixels on each side)
+            number_obj.rect.update(text_rect)
+            number_obj.rect.inflate_ip(50, 50)
+
+            # The inflated collision rect covers the drawn number
+            self.dirty_rects.mark(number_obj.rect)
+
+        self.sprite_batcher.flush(self.screen)
 
     def _process_lasers(self, offset_x, offset_y):
         """Process legacy laser effects."""
         for laser in self.lasers[:]:
             if laser["duration"] > 0:
                 if laser["type"] != "flamethrower":
-                    pygame.draw.line(
-                        self.screen,
-                        random.choice(laser.get("colors", FLAME_COLORS)),
-                        (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
-                        (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
-                        random.choice(laser.get("widths", [5, 10, 15])),
+                    self.dirty_rects.mark(
+                        pygame.draw.line(
+                            self.screen,
+                            random.choice(laser.get("colors", FLAME_COLORS)),
+                            (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
+                            (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
+                            random.choice(laser.get("widths", [5, 10, 15])),
+                        )
                     )
                 laser["duration"] -= 1
             else:
@@ -576,7 +536,7 @@ class NumbersLevel(BaseLevel):
         """Process explosion effects."""
         for explosion in self.explosions[:]:
             if explosion["duration"] > 0:
-                self.draw_explosion(explosion, offset_x, offset_y)
+                self.dirty_rects.mark(self.draw_explosion(explosion, offset_x, offset_y))
                 explosion["duration"] -= 1
             else:
                 self.explosions.remove(explosion)
@@ -8,7 +8,6 @@ from settings import (
     BLACK,
     FLAME_COLORS,
     GROUP_SIZE,
-    LETTER_SPAWN_INTERVAL,
     LEVEL_PROGRESS_PATH,
     SEQUENCES,
     WHITE,
@@ -17,11 +16,14 @@ from base_level import BaseLevel
 from unified_physics import UnifiedObjectFactory, UnifiedTargetSystem, UnifiedPhysicsSystem
 from universal_class import (
     CheckpointManager,
+    DirtyRectManager,
     FlamethrowerManager,
     GlassShatterManager,
     HUDManager,
     MultiTouchManager,
+    StarFieldManager,
 )
+from utils.texture_atlas import get_sprite_batcher
 
 
 class ShapesLevel(BaseLevel):
@@ -105,6 +107,23 @@ class ShapesLevel(BaseLevel):
         # Initialize flamethrower manager
         self.flamethrower_manager = FlamethrowerManager()
 
+        # Falling shapes are built by the shared factory
+        self.object_factory = UnifiedObjectFactory(resource_manager)
+
+        # Shapes are a few large bodies, so a sweep beats a grid
+        self.physics_system = UnifiedPhysicsSystem(width, height, collision_strategy="sweep")
+        timing = PERFORMANCE_SETTINGS.get(
+            center_piece_manager.display_mode, PERFORMANCE_SETTINGS["DEFAULT"]
+        )
+        self.physics_system.collision_frequency = timing["collision_check_frequency"]
+
+        # Fixed-timestep simulation, rendered at the display mode's frame rate
+        self.physics_system.configure_timestep(timing)
+        self.render_fps = timing["render_fps"]
+        self.dirty_rects = DirtyRectManager.from_settings(width, height, timing)
+        self.sprite_batcher = get_sprite_batcher()
+        self.star_field = StarFieldManager(width, height)
+
         # Shapes configuration
         self.sequence = SEQUENCES["shapes"]
         self.groups = [
@@ -124,6 +143,7 @@ class ShapesLevel(BaseLevel):
         self.total_destroyed = 0
         self.overall_destroyed = 0
         self.running = True
+        self.physics_system.clear()
         self.letters = []
         self.letters_spawned = 0
         self.letters_destroyed = 0
@@ -173,32 +193,29 @@ class ShapesLevel(BaseLevel):
         self.flamethrower_manager.clear()
         self.center_piece_manager.reset()
 
-        # Initialize background stars
-        stars = []
-        for _ in range(100):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            radius = random.randint(2, 4)
-            stars.append([x, y, radius])
+        # Fresh background stars for this run
+        self.star_field.reset()
 
         # Run main game loop
-        return self._main_game_loop(stars)
+        return self._main_game_loop()
 
-    def _main_game_loop(self, stars):
+    def _main_game_loop(self):
         """Main game loop for the shapes level."""
         clock = pygame.time.Clock()
+        self.physics_system.timestep.reset()
+        frame_seconds = self.physics_system.timestep.tick_seconds
+        self.dirty_rects.invalidate()
 
         while self.running:
             # Handle events
             if not self._handle_events():
                 return False
 
-            # Spawning items
-            if self.game_started:
-                self._spawn_items()
+            # Spawn, move and collide shapes in fixed ticks
+            self.physics_system.advance(frame_seconds, self._simulation_tick)
 
-            # Update and draw frame
-            self._update_and_draw_frame(stars)
+            # Draw frame
+            self._update_and_draw_frame()
 
             # Handle checkpoint logic
             if not self._handle_checkpoint_logic():
@@ -209,12 +226,20 @@ class ShapesLevel(BaseLevel):
             if progression_result is not None:
                 return progression_result
 
-            # Update frame counter and clock
-            self.frame_count += 1
-            clock.tick(50)
+            # Limit render rate; gameplay speed follows the physics tick rate
+            frame_seconds = clock.tick(self.render_fps) / 1000.0
 
         return True
 
+    def _simulation_tick(self):
+        """Advance spawning, physics and collisions by one fixed tick."""
+        self.physics_system.apply_queued_explosions({"shape": self.letters})
+        if self.game_started:
+            self._spawn_items()
+        self._update_shapes()
+        self.physics_system.handle_layered_collisions({"shape": self.letters}, self.frame_count)
+        self.frame_count += 1
+
     def _handle_events(self):
         """Handle all pygame events."""
         for event in pygame.event.get():
@@ -268,28 +293,31 @@ class ShapesLevel(BaseLevel):
         """Handle click/touch on the screen."""
         hit_target = False
 
+        # Wake resting shapes around the click
+        self.physics_system.wake_bodies(click_x, click_y, 150, self.letters)
+
         # Process click on target
         for letter_obj in self.letters[:]:
-            if letter_obj["rect"].collidepoint(click_x, click_y):
+            if letter_obj.rect.collidepoint(click_x, click_y):
                 hit_target = True
-                if letter_obj["value"] == self.target_letter:
+                if letter_obj.value == self.target_letter:
                     self.score += 10
                     # Play voice sound for destroyed target (lowercase for shapes)
                     if self.sound_manager:
-                        self.sound_manager.play_voice(letter_obj["value"].lower())
+                        self.sound_manager.play_voice(letter_obj.value.lower())
                     # Common destruction effects
-                    self.create_explosion(letter_obj["x"], letter_obj["y"])
+                    self.create_explosion(letter_obj.x, letter_obj.y)
                     self.flamethrower_manager.create_flamethrower(
-                        self.player_x, self.player_y - 80, letter_obj["x"], letter_obj["y"]
+                        self.player_x, self.player_y - 80, letter_obj.x, letter_obj.y
                     )
-                    self.center_piece_manager.trigger_convergence(letter_obj["x"], letter_obj["y"])
-                    self.apply_explosion_effect(letter_obj["x"], letter_obj["y"], 150, self.letters)
+                    self.center_piece_manager.trigger_convergence(letter_obj.x, letter_obj.y)
+                    self.physics_system.queue_explosion(letter_obj.x, letter_obj.y, 150)
 
                     # Add visual feedback particles
                     for i in range(20):
                         self.create_particle(
-                            letter_obj["x"],
-                            letter_obj["y"],
+                            letter_obj.x,
+                            letter_obj.y,
                             random.choice(FLAME_COLORS),
                             random.randint(40, 80),
                             random.uniform(-2, 2),
@@ -299,6 +327,7 @@ class ShapesLevel(BaseLevel):
 
                     # Remove letter and update counts
                     self.letters.remove(letter_obj)
+                    self.physics_system.remove_object(letter_obj)
                     self.letters_destroyed += 1
 
                     # Update target
@@ -318,24 +347,14 @@ class ShapesLevel(BaseLevel):
 
     def _spawn_items(self):
         """Handle spawning of falling shapes."""
-        if self.letters_to_spawn:
-            if self.frame_count % LETTER_SPAWN_INTERVAL == 0:
-                item_value = self.letters_to_spawn.pop(0)
-                letter_obj = {
-                    "value": item_value,
-                    "x": random.randint(50, self.width - 50),
-                    "y": -50,
-                    "rect": pygame.Rect(0, 0, 0, 0),  # Will be updated when drawn
-                    "size": 240,  # doubled from 120 to 240 for 100% increase
-                    "dx": random.choice([-1, -0.5, 0.5, 1]) * 1.5,
-                    "dy": random.choice([1, 1.5]) * 1.5 * 4.2,  # 20% faster fall speed
-                    "can_bounce": False,
-                    "mass": random.uniform(40, 60),
-                }
-                self.letters.append(letter_obj)
-                self.letters_spawned += 1
-
-    def _update_and_draw_frame(self, stars):
+        letter_obj = self.object_factory.spawn_next(
+            "shape", self.letters_to_spawn, self.frame_count, self.physics_system, self.width
+        )
+        if letter_obj is not None:
+            self.letters.append(letter_obj)
+            self.letters_spawned += 1
+
+    def _update_and_draw_frame(self):
         """Update and draw the current frame."""
         # Apply screen shake if active
         offset_x, offset_y = self.glass_shatter_manager.get_screen_shake_offset()
@@ -343,6 +362,18 @@ class ShapesLevel(BaseLevel):
         # Update glass shatter manager
         self.glass_shatter_manager.update()
 
+        # Background, cracks, shake or a checkpoint screen change the whole screen
+        self.dirty_rects.watch(
+            "scene",
+            (
+                self.glass_shatter_manager.get_background_color(),
+                self.glass_shatter_manager.get_crack_count(),
+                offset_x,
+                offset_y,
+                self.checkpoint_manager.screens_shown,
+            ),
+        )
+
         # Fill background based on shatter state
         self.screen.fill(self.glass_shatter_manager.get_background_color())
 
@@ -350,26 +381,23 @@ class ShapesLevel(BaseLevel):
         self.glass_shatter_manager.draw_cracks(self.screen)
 
         # Draw background stars
-        self._draw_stars(stars, offset_x, offset_y)
+        self.dirty_rects.mark(self._draw_stars(offset_x, offset_y))
 
         # Draw center piece (swirl particles + target display)
-        self.center_piece_manager.update_and_draw(
-            self.screen, self.target_letter, "shapes", offset_x, offset_y
+        self.dirty_rects.mark(
+            self.center_piece_manager.update_and_draw(
+                self.screen, self.target_letter, "shapes", offset_x, offset_y
+            )
         )
 
-        # Update and draw falling shapes
-        self._update_and_draw_shapes(offset_x, offset_y)
-
-        # Handle collisions between shapes with performance optimization
-        collision_frequency = PERFORMANCE_SETTINGS.get(
-            self.center_piece_manager.display_mode, PERFORMANCE_SETTINGS["DEFAULT"]
-        )["collision_check_frequency"]
-        if self.frame_count % collision_frequency == 0:
-            self._handle_shape_collisions()
+        # Draw falling shapes; the inflated collision rect covers each outline
+        for letter_obj in self.letters:
+            self._draw_shape(letter_obj, offset_x, offset_y)
+            self.dirty_rects.mark(letter_obj.rect)
 
         # Process flamethrower effects
         self.flamethrower_manager.update()
-        self.flamethrower_manager.draw(self.screen, offset_x, offset_y)
+        self.dirty_rects.mark(self.flamethrower_manager.draw(self.screen, offset_x, offset_y))
 
         # Process legacy lasers / flame effects
         self._process_lasers(offset_x, offset_y)
@@ -379,80 +407,39 @@ class ShapesLevel(BaseLevel):
 
         # Draw particles
         self.particle_manager.update()
-        self.particle_manager.draw(self.screen, offset_x, offset_y)
+        self.dirty_rects.mark(self.particle_manager.draw(self.screen, offset_x, offset_y))
 
         # Display HUD
-        self.hud_manager.display_info(
-            self.screen,
-            self.score,
-            self.current_ability,
-            self.target_letter,
-            self.overall_destroyed + self.letters_destroyed,
-            self.TOTAL_LETTERS,
-            "shapes",
+        self.dirty_rects.mark(
+            self.hud_manager.display_info(
+                self.screen,
+                self.score,
+                self.current_ability,
+                self.target_letter,
+                self.overall_destroyed + self.letters_destroyed,
+                self.TOTAL_LETTERS,
+                "shapes",
+            )
         )
 
         # Update display
-        pygame.display.flip()
-
-    def _draw_stars(self, stars, offset_x, offset_y):
-        """Draw and update background stars."""
-        for star in stars:
-            x, y, radius = star
-            y += 1
-            pygame.draw.circle(self.screen, (200, 200, 200), (x + offset_x, y + offset_y), radius)
-            if y > self.height + radius:
-                y = random.randint(-50, -10)
-                x = random.randint(0, self.width)
-            star[1] = y
-            star[0] = x
+        self.sprite_batcher.end_frame()
+        self.dirty_rects.present()
 
     # Center target drawing now handled by CenterPieceManager
 
-    def _update_and_draw_shapes(self, offset_x, offset_y):
-        """Update and draw falling shapes."""
-        for letter_obj in self.letters[:]:
-            # Update position
-            letter_obj["x"] += letter_obj["dx"]
-            letter_obj["y"] += letter_obj["dy"]
-
-            # Bouncing logic
-            if not letter_obj["can_bounce"] and letter_obj["y"] > self.height // 5:
-                letter_obj["can_bounce"] = True
-
-            if letter_obj["can_bounce"]:
-                bounce_dampening = 0.8
-
-                # Left/Right walls
-                if letter_obj["x"] <= 0 + letter_obj["size"] / 2:
-                    letter_obj["x"] = 0 + letter_obj["size"] / 2
-                    letter_obj["dx"] = abs(letter_obj["dx"]) * bounce_dampening
-                elif letter_obj["x"] >= self.width - letter_obj["size"] / 2:
-                    letter_obj["x"] = self.width - letter_obj["size"] / 2
-                    letter_obj["dx"] = -abs(letter_obj["dx"]) * bounce_dampening
-
-                # Top/Bottom walls
-                if letter_obj["y"] <= 0 + letter_obj["size"] / 2:
-                    letter_obj["y"] = 0 + letter_obj["size"] / 2
-                    letter_obj["dy"] = abs(letter_obj["dy"]) * bounce_dampening
-                elif letter_obj["y"] >= self.height - letter_obj["size"] / 2:
-                    letter_obj["y"] = self.height - letter_obj["size"] / 2
-                    letter_obj["dy"] = -abs(letter_obj["dy"]) * bounce_dampening
-                    letter_obj["dx"] *= bounce_dampening
-                    if letter_obj["x"] < self.width / 2:
-                        letter_obj["dx"] += random.uniform(0.1, 0.3)
-                    else:
-                        letter_obj["dx"] -= random.uniform(0.1, 0.3)
-
-            # Draw the shape
-            self._draw_shape(letter_obj, offset_x, offset_y)
+    def _update_shapes(self):
+        """Move falling shapes and bounce them off the walls."""
+        # Resting shapes sleep and are skipped by the batched step
+        self.physics_system.step()
 
     def _draw_shape(self, letter_obj, offset_x, offset_y):
         """Draw a single shape."""
-        draw_pos_x = int(letter_obj["x"] + offset_x)
-        draw_pos_y = int(letter_obj["y"] + offset_y)
-        value = letter_obj["value"]
-        size = letter_obj["size"]
+        render_x, render_y = self.physics_system.render_position(letter_obj)
+        draw_pos_x = int(render_x + offset_x)
+        draw_pos_y = int(render_y + offset_y)
+        value = letter_obj.value
+        size = letter_obj.size
         pos = (draw_pos_x, draw_pos_y)
         color = BLACK  # Use BLACK for falling shapes (as in original)
 
@@ -461,17 +448,20 @@ class ShapesLevel(BaseLevel):
                 pos[0] - int(size * 1.5) // 2, pos[1] - size // 2, int(size * 1.5), size
             )
             # Inflate rect by 50% for easier interaction (25 pixels on each side)
-            letter_obj["rect"] = rect.inflate(50, 50)
+            letter_obj.rect.update(rect)
+            letter_obj.rect.inflate_ip(50, 50)
             pygame.draw.rect(self.screen, color, rect, 6)
         elif value == "Square":
             rect = pygame.Rect(pos[0] - size // 2, pos[1] - size // 2, size, size)
             # Inflate rect by 50% for easier interaction (25 pixels on each side)
-            letter_obj["rect"] = rect.inflate(50, 50)
+            letter_obj.rect.update(rect)
+            letter_obj.rect.inflate_ip(50, 50)
             pygame.draw.rect(self.screen, color, rect, 6)
         elif value == "Circle":
             rect = pygame.Rect(pos[0] - size // 2, pos[1] - size // 2, size, size)
             # Inflate rect by 50% for easier interaction (25 pixels on each side)
-            letter_obj["rect"] = rect.inflate(50, 50)
+            letter_obj.rect.update(rect)
+            letter_obj.rect.inflate_ip(50, 50)
             pygame.draw.circle(self.screen, color, pos, size // 2, 6)
         elif value == "Triangle":
             points = [
@@ -481,7 +471,8 @@ class ShapesLevel(BaseLevel):
             ]
             rect = pygame.Rect(pos[0] - size // 2, pos[1] - size // 2, size, size)
             # Inflate rect by 50% for easier interaction (25 pixels on each side)
-            letter_obj["rect"] = rect.inflate(50, 50)
+            letter_obj.rect.update(rect)
+            letter_obj.rect.inflate_ip(50, 50)
             pygame.draw.polygon(self.screen, color, points, 6)
         elif value == "Pentagon":
             points = []
@@ -493,61 +484,24 @@ class ShapesLevel(BaseLevel):
                 )
             rect = pygame.Rect(pos[0] - size // 2, pos[1] - size // 2, size, size)
             # Inflate rect by 50% for easier interaction (25 pixels on each side)
-            letter_obj["rect"] = rect.inflate(50, 50)
+            letter_obj.rect.update(rect)
+            letter_obj.rect.inflate_ip(50, 50)
             pygame.draw.polygon(self.screen, color, points, 6)
 
-    def _handle_shape_collisions(self):
-        """Handle collisions between falling shapes."""
-        for i, letter_obj1 in enumerate(self.letters):
-            for j in range(i + 1, len(self.letters)):
-                letter_obj2 = self.letters[j]
-                dx = letter_obj2["x"] - letter_obj1["x"]
-                dy = letter_obj2["y"] - letter_obj1["y"]
-                distance_sq = dx * dx + dy * dy
-
-                radius1 = letter_obj1["size"] / 1.8
-                radius2 = letter_obj2["size"] / 1.8
-                min_distance = radius1 + radius2
-                min_distance_sq = min_distance * min_distance
-
-                if distance_sq < min_distance_sq and distance_sq > 0:
-                    distance = math.sqrt(distance_sq)
-                    nx = dx / distance
-                    ny = dy / distance
-
-                    # Resolve interpenetration
-                    overlap = min_distance - distance
-                    total_mass = letter_obj1["mass"] + letter_obj2["mass"]
-                    push_factor = overlap / total_mass
-                    letter_obj1["x"] -= nx * push_factor * letter_obj2["mass"]
-                    letter_obj1["y"] -= ny * push_factor * letter_obj2["mass"]
-                    letter_obj2["x"] += nx * push_factor * letter_obj1["mass"]
-                    letter_obj2["y"] += ny * push_factor * letter_obj1["mass"]
-
-                    # Calculate collision response
-                    dvx = letter_obj1["dx"] - letter_obj2["dx"]
-                    dvy = letter_obj1["dy"] - letter_obj2["dy"]
-                    dot_product = dvx * nx + dvy * ny
-                    impulse = (2 * dot_product) / total_mass
-                    bounce_factor = 0.85
-
-                    letter_obj1["dx"] -= impulse * letter_obj2["mass"] * nx * bounce_factor
-                    letter_obj1["dy"] -= impulse * letter_obj2["mass"] * ny * bounce_factor
-                    letter_obj2["dx"] += impulse * letter_obj1["mass"] * nx * bounce_factor
-                    letter_obj2["dy"] += impulse * letter_obj1["mass"] * ny * bounce_factor
-
     def _process_lasers(self, offset_x, offset_y):
         """Process and draw legacy laser effects (non-flamethrower)."""
         for laser in self.lasers[:]:
             if laser["duration"] > 0:
                 # Only process non-flamethrower effects here
                 if laser["type"] != "flamethrower":
-                    pygame.draw.line(
-                        self.screen,
-                        random.choice(laser.get("colors", FLAME_COLORS)),
-                        (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
-                        (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
-                        random.choice(laser.get("widths", [5, 10, 15])),
+                    self.dirty_rects.mark(
+                        pygame.draw.line(
+                            self.screen,
+                            random.choice(laser.get("colors", FLAME_COLORS)),
+                            (laser["start_pos"][0] + offset_x, laser["start_pos"][1] + offset_y),
+                            (laser["end_pos"][0] + offset_x, laser["end_pos"][1] + offset_y),
+                            random.choice(laser.get("widths", [5, 10, 15])),
+                        )
                     )
                 laser["duration"] -= 1
             else:
@@ -557,7 +511,7 @@ class ShapesLevel(BaseLevel):
         """Process and draw explosions."""
         for explosion in self.explosions[:]:
             if explosion["duration"] > 0:
-                self.draw_explosion(explosion, offset_x, offset_y)
+                self.dirty_rects.mark(self.draw_explosion(explosion, offset_x, offset_y))
                 explosion["duration"] -= 1
             else:
                 self.explosions.remove(explosion)
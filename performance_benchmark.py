@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmark for SS6 Super Student Game
+Compares physics collision strategies and game object models, headless.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Dict, List
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from base_level import BaseGameObject
+from unified_physics import BROAD_PHASE_STRATEGIES, UnifiedPhysicsSystem
+
+BODY_COUNTS = (10, 50, 200, 1000)
+SCREEN_WIDTH, SCREEN_HEIGHT = 1920, 1080
+
+
+def _spawn_bodies(physics: UnifiedPhysicsSystem, count: int, size: float, seed: int):
+    """Scatter bodies over the screen with random velocities."""
+    rng = np.random.default_rng(seed)
+    objects = []
+    for i in range(count):
+        obj = BaseGameObject(
+            float(rng.uniform(0, SCREEN_WIDTH)), float(rng.uniform(0, SCREEN_HEIGHT)), str(i)
+        )
+        obj.size = size
+        obj.dx = float(rng.uniform(-4, 4))
+        obj.dy = float(rng.uniform(-4, 4))
+        obj.can_bounce = True
+        objects.append(physics.add_object(obj))
+    return objects
+
+
+def benchmark_broad_phase(
+    strategy: str, count: int, size: float = 240, frames: int = 60, seed: int = 1
+) -> Dict:
+    """
+    Time step + collision passes for one strategy and population.
+
+    Returns:
+        Dict with mean/median milliseconds per frame and average pair counts
+    """
+    physics = UnifiedPhysicsSystem(SCREEN_WIDTH, SCREEN_HEIGHT, collision_strategy=strategy)
+    physics.collision_frequency = 1
+    objects = _spawn_bodies(physics, count, size, seed)
+
+    frame_times: List[float] = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        physics.step()
+        physics.handle_object_collisions(objects, frame)
+        frame_times.append((time.perf_counter() - start) * 1000)
+
+    stats = physics.get_collision_stats()
+    return {
+        "strategy": strategy,
+        "bodies": count,
+        "mean_ms": statistics.mean(frame_times),
+        "median_ms": statistics.median(frame_times),
+        "avg_candidate_pairs": stats["total_candidate_pairs"] / stats["passes"],
+        "avg_contacts": stats["total_contacts"] / stats["passes"],
+        "brute_force_pairs": stats["brute_force_pairs"],
+    }
+
+
+def run_broad_phase_benchmark(
+    counts=BODY_COUNTS, size: float = 240, frames: int = 60, max_brute_bodies: int = 1000
+) -> List[Dict]:
+    """Run every collision strategy at every body count."""
+    results = []
+    for count in counts:
+        for strategy in BROAD_PHASE_STRATEGIES:
+            if strategy == "brute" and count > max_brute_bodies:
+                continue
+            results.append(benchmark_broad_phase(strategy, count, size, frames))
+    return results
+
+
+def print_broad_phase_results(results: List[Dict]):
+    """Print a comparison table, marking the fastest strategy per count."""
+    print(
+        f"{'bodies':>7} {'strategy':>9} {'mean ms':>9} {'median ms':>10} "
+        f"{'pairs':>10} {'contacts':>9}"
+    )
+    for count in sorted({r["bodies"] for r in results}):
+        rows = [r for r in results if r["bodies"] == count]
+        fastest = min(rows, key=lambda r: r["median_ms"])["strategy"]
+        for r in rows:
+            marker = " *" if r["strategy"] == fastest else ""
+            print(
+                f"{r['bodies']:>7} {r['strategy']:>9} {r['mean_ms']:>9.3f} {r['median_ms']:>10.3f} "
+                f"{r['avg_candidate_pairs']:>10.0f} {r['avg_contacts']:>9.0f}{marker}"
+            )
+
+
+def _make_dict_body(rng) -> Dict:
+    """Level item in the old dict layout."""
+    return {
+        "value": "A",
+        "x": float(rng.uniform(0, SCREEN_WIDTH)),
+        "y": float(rng.uniform(0, SCREEN_HEIGHT)),
+        "rect": pygame.Rect(0, 0, 0, 0),
+        "size": 240,
+        "dx": float(rng.uniform(-4, 4)),
+        "dy": float(rng.uniform(-4, 4)),
+        "can_bounce": True,
+        "mass": 50.0,
+        "type": "letter",
+    }
+
+
+def _make_slotted_body(rng) -> BaseGameObject:
+    """Level item as a slotted BaseGameObject."""
+    obj = BaseGameObject(
+        float(rng.uniform(0, SCREEN_WIDTH)), float(rng.uniform(0, SCREEN_HEIGHT)), "A", "letter"
+    )
+    obj.dx = float(rng.uniform(-4, 4))
+    obj.dy = float(rng.uniform(-4, 4))
+    obj.can_bounce = True
+    obj.mass = 50.0
+    return obj
+
+
+def _allocated_bytes(factory, count: int, seed: int) -> int:
+    """Bytes allocated while building count bodies."""
+    rng = np.random.default_rng(seed)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    bodies = [factory(rng) for _ in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del bodies
+    return allocated
+
+
+def _step_dicts(bodies: List[Dict], width: int, height: int):
+    """The per-dict integration loop the levels used to run each tick."""
+    for obj in bodies:
+        if obj.get("sleeping"):
+            continue
+        obj["x"] += obj["dx"]
+        obj["y"] += obj["dy"]
+        if not obj["can_bounce"] and obj["y"] > height // 5:
+            obj["can_bounce"] = True
+        if obj["can_bounce"]:
+            half = obj.get("size", 50) / 2
+            if obj["x"] <= half:
+                obj["x"] = half
+                obj["dx"] = abs(obj["dx"]) * 0.8
+            elif obj["x"] >= width - half:
+                obj["x"] = width - half
+                obj["dx"] = -abs(obj["dx"]) * 0.8
+            if obj["y"] <= half:
+                obj["y"] = half
+                obj["dy"] = abs(obj["dy"]) * 0.8
+            elif obj["y"] >= height - half:
+                obj["y"] = height - half
+                obj["dy"] = -abs(obj["dy"]) * 0.8
+                obj["dx"] *= 0.8
+                if obj["x"] < width / 2:
+                    obj["dx"] += random.uniform(0.1, 0.3)
+                else:
+                    obj["dx"] -= random.uniform(0.1, 0.3)
+
+
+def _time_frames(step, collide, frames: int):
+    """Median milliseconds per frame spent integrating and colliding."""
+    step_times, collide_times = [], []
+    for frame in range(frames):
+        start = time.perf_counter()
+        step()
+        middle = time.perf_counter()
+        collide(frame)
+        step_times.append((middle - start) * 1000)
+        collide_times.append((time.perf_counter() - middle) * 1000)
+    return statistics.median(step_times), statistics.median(collide_times)
+
+
+def benchmark_object_model(count: int, frames: int = 60, seed: int = 1) -> Dict:
+    """
+    Compare dict items against slotted objects bound to the batched store.
+
+    Returns:
+        Dict with bytes per body and median milliseconds per frame for
+        integration and collisions under each model
+    """
+    rng = np.random.default_rng(seed)
+    dict_physics = UnifiedPhysicsSystem(SCREEN_WIDTH, SCREEN_HEIGHT, collision_strategy="sweep")
+    dict_bodies = [_make_dict_body(rng) for _ in range(count)]
+    dict_step, dict_collide = _time_frames(
+        lambda: _step_dicts(dict_bodies, SCREEN_WIDTH, SCREEN_HEIGHT),
+        lambda frame: dict_physics.handle_layered_collisions({"letter": dict_bodies}, frame),
+        frames,
+    )
+
+    rng = np.random.default_rng(seed)
+    slot_physics = UnifiedPhysicsSystem(SCREEN_WIDTH, SCREEN_HEIGHT, collision_strategy="sweep")
+    slot_bodies = [slot_physics.add_object(_make_slotted_body(rng)) for _ in range(count)]
+    slot_step, slot_collide = _time_frames(
+        slot_physics.step,
+        lambda frame: slot_physics.handle_layered_collisions({"letter": slot_bodies}, frame),
+        frames,
+    )
+
+    return {
+        "bodies": count,
+        "dict_bytes": _allocated_bytes(_make_dict_body, count, seed) / count,
+        "slotted_bytes": _allocated_bytes(_make_slotted_body, count, seed) / count,
+        "dict_step_ms": dict_step,
+        "slotted_step_ms": slot_step,
+        "dict_collide_ms": dict_collide,
+        "slotted_collide_ms": slot_collide,
+    }
+
+
+def print_object_model_results(results: List[Dict]):
+    """Print memory per body and frame time for dict and slotted items."""
+    print(
+        f"{'bodies':>7} {'dict B':>8} {'slots B':>8} {'dict step':>10} {'slots step':>11} "
+        f"{'dict coll':>10} {'slots coll':>11}"
+    )
+    for r in results:
+        print(
+            f"{r['bodies']:>7} {r['dict_bytes']:>8.0f} {r['slotted_bytes']:>8.0f} "
+            f"{r['dict_step_ms']:>10.3f} {r['slotted_step_ms']:>11.3f} "
+            f"{r['dict_collide_ms']:>10.3f} {r['slotted_collide_ms']:>11.3f}"
+        )
+
+
+def main():
+    """Main benchmark function."""
+    parser = argparse.ArgumentParser(description="SS6 performance benchmarks")
+    parser.add_argument("--size", type=float, default=240, help="body size in pixels")
+    parser.add_argument("--frames", type=int, default=60, help="frames per run")
+    parser.add_argument(
+        "--counts", type=int, nargs="+", default=list(BODY_COUNTS), help="body counts to test"
+    )
+    args = parser.parse_args()
+
+    print(f"⚡ Broad phase comparison (body size {args.size:g}px, {args.frames} frames)")
+    results = run_broad_phase_benchmark(args.counts, args.size, args.frames)
+    print_broad_phase_results(results)
+
+    print(f"\n🧱 Dict items vs slotted objects, median ms per frame ({args.frames} frames)")
+    print_object_model_results(
+        [benchmark_object_model(count, args.frames) for count in args.counts]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -71,7 +71,7 @@ def test_emoji_spawning():
             level._ensure_target_emojis_available()
 
             if frame % 60 == 0:  # Check every second
-                objects = [obj["value"] for obj in level.letters]
+                objects = [obj.value for obj in level.letters]
                 print(f"Frame {frame}: Objects on screen: {objects}")
 
     pygame.quit()
@@ -4,6 +4,7 @@ Comprehensive test suite for core game logic, managers, and level systems.
 """
 
 import json
+import math
 import os
 import sys
 import tempfile
@@ -365,6 +366,84 @@ class TestPerformanceOptimizations(unittest.TestCase):
         self.assertTrue(success)
         self.assertIn("test_texture", atlas.regions)
 
+    def test_texture_atlas_packs_and_grows(self):
+        """Test that mixed sizes pack without overlap and spill onto new pages."""
+        from utils.texture_atlas import TextureAtlas
+
+        atlas = TextureAtlas(128, 128, max_pages=2)
+        sizes = [(60, 20), (30, 70), (64, 64), (40, 40), (20, 90), (50, 30)] * 2
+        for i, size in enumerate(sizes):
+            self.assertTrue(atlas.add_texture(f"tex_{i}", pygame.Surface(size)))
+
+        self.assertEqual(len(atlas.pages), 2)
+        for page_index in range(2):
+            rects = [
+                rect
+                for name, rect in atlas.regions.items()
+                if atlas.region_pages[name] == page_index
+            ]
+            for i, rect in enumerate(rects):
+                self.assertTrue(atlas.pages[page_index].get_rect().contains(rect))
+                self.assertEqual(rect.collidelist(rects[i + 1 :]), -1)
+        self.assertFalse(atlas.add_texture("too_big", pygame.Surface((129, 10))))
+
+    def test_glyph_atlas_lookup_by_text(self):
+        """Test that glyphs are packed once per text and served from the atlas."""
+        from utils.resource_manager import glyph_text
+        from utils.texture_atlas import GlyphAtlas
+
+        glyphs = GlyphAtlas(pygame.font.Font(None, 48), (0, 0, 0))
+        first = glyphs.get(glyph_text("a"))
+        self.assertIs(glyphs.get("α"), first)
+        self.assertIs(first.get_abs_parent(), glyphs.atlas.pages[0])
+        self.assertEqual(glyphs.misses, 1)
+        self.assertEqual(glyph_text("A"), "A")
+
+    def test_atlas_disk_cache_round_trip(self):
+        """Test that a cached atlas is built once and then loaded from disk."""
+        from utils.texture_atlas import AtlasManager, atlas_cache_key
+
+        builds = []
+
+        def build(atlas):
+            builds.append(atlas)
+            texture = pygame.Surface((10, 10), pygame.SRCALPHA)
+            texture.fill((255, 0, 0, 128))
+            atlas.add_texture("red", texture)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            key = atlas_cache_key([], "DEFAULT", {"size": 10})
+            self.assertNotEqual(key, atlas_cache_key([], "QBOARD", {"size": 10}))
+
+            AtlasManager(cache_dir).load_cached_atlas("test", key, build, 64, 64)
+            manager = AtlasManager(cache_dir)
+            atlas = manager.load_cached_atlas("test", key, build, 64, 64)
+
+            self.assertEqual(len(builds), 1)
+            self.assertEqual(manager.cache_hits, 1)
+            self.assertEqual(atlas.get_subsurface("red").get_at((5, 5)), (255, 0, 0, 128))
+
+    def test_text_cache_reuses_hud_text(self):
+        """Test that HUD text is only re-rendered when it changes."""
+        from universal_class import HUDManager, TextSurfaceCache
+
+        font = pygame.font.Font(None, 24)
+        glass = Mock()
+        glass.get_background_color.return_value = (0, 0, 0)
+        hud = HUDManager(800, 600, font, glass)
+        hud.text_cache = TextSurfaceCache(max_entries=3)
+        screen = pygame.Surface((800, 600))
+
+        for _ in range(5):
+            hud.display_info(screen, 0, None, "A", 2, 26, "alphabet")
+        self.assertEqual(hud.text_cache.misses, 2)
+        self.assertEqual(hud.text_cache.hits, 8)
+
+        hud.display_info(screen, 0, None, "B", 3, 26, "alphabet")
+        hud.display_info(screen, 0, None, "C", 4, 26, "alphabet")
+        self.assertEqual(hud.text_cache.get_stats()["entries"], 3)
+        self.assertEqual(hud.text_cache.evictions, 3)
+
     def test_memory_profiler_initialization(self):
         """Test memory profiler initialization."""
         from utils.memory_profiler import MemoryProfiler
@@ -392,6 +471,1049 @@ class TestPerformanceOptimizations(unittest.TestCase):
         current_metrics = profiler.get_current_metrics()
         self.assertIsNotNone(current_metrics)
 
+    def test_particle_sprite_cache(self):
+        """Test that particle drawing reuses cached circle sprites."""
+        from utils.particle_system import ParticleManager
+
+        manager = ParticleManager(max_particles=50)
+        screen = pygame.Surface((400, 400))
+        for i in range(20):
+            manager.create_particle(200, 200, (255, 100, 0), 40 + i % 2, 0, 0, 20)
+
+        manager.batcher.clear()
+        manager.draw(screen)
+        manager.draw(screen)
+        stats = manager.get_stats()
+        self.assertEqual(stats["surface_allocations_per_frame"], 0)
+        self.assertEqual(stats["sprites"], 1)
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 39))
+        self.assertEqual(screen.get_at((200, 200))[:3], (255, 100, 0))
+
+        # Sprites live in the batcher's atlas, keyed by the quantized sprite key
+        key = ("particle", *manager.sprite_renderer.key((255, 100, 0), 41, 255))
+        self.assertIsNotNone(manager.batcher.atlases["particles"].get_region(key))
+
+    def test_particle_bursts_reach_zero_allocations(self):
+        """Test that repeated hit bursts settle to no sprite allocations per frame."""
+        import random
+
+        from settings import FLAME_COLORS
+        from utils.particle_system import ParticleManager
+
+        manager = ParticleManager(max_particles=100)
+        manager.batcher.clear()
+        screen = pygame.Surface((800, 600))
+        renderer = manager.sprite_renderer
+
+        # Every sprite a hit burst can produce fits in the particle atlas budget
+        keys = {
+            renderer.key(color, size, alpha)
+            for color in FLAME_COLORS
+            for size in range(40, 81)
+            for alpha in range(256)
+        }
+        key_bytes = sum((radius * 2) ** 2 * 4 for _, radius, _ in keys)
+        self.assertLessEqual(key_bytes, manager.get_stats()["budget_bytes"])
+
+        rng = random.Random(5)
+        allocations = []
+        for frame in range(400):
+            if frame % 5 == 0:  # A hit: 20 flame particles, size 40-80, fading over 20 frames
+                for _ in range(20):
+                    manager.create_particle(
+                        400,
+                        300,
+                        rng.choice(FLAME_COLORS),
+                        rng.randint(40, 80),
+                        rng.uniform(-2, 2),
+                        rng.uniform(-2, 2),
+                        20,
+                    )
+            manager.update()
+            manager.draw(screen)
+            allocations.append(manager.get_stats()["surface_allocations_per_frame"])
+
+        self.assertEqual(sum(allocations[-100:]), 0)
+        self.assertLessEqual(manager.get_stats()["sprites"], len(keys))
+
+    def test_particle_sprites_evicted_under_atlas_budget(self):
+        """Test that particle sprites beyond the atlas budget evict the least recent."""
+        from utils.particle_system import ParticleManager
+        from utils.texture_atlas import SpriteBatcher
+
+        sprite_bytes = 40 * 40 * 4  # Radius 20 sprite
+        manager = ParticleManager(max_particles=10)
+        manager.batcher = SpriteBatcher(atlas_budgets={"particles": 2 * sprite_bytes})
+        screen = pygame.Surface((200, 200))
+        for color in [(255, 0, 0), (0, 255, 0), (255, 0, 0), (0, 0, 255)]:
+            manager.clear()
+            manager.create_particle(100, 100, color, 20, 0, 0, 10)
+            manager.draw(screen)
+
+        stats = manager.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 3, 1))
+        self.assertEqual(stats["cached_bytes"], 2 * sprite_bytes)
+        atlas = manager.batcher.atlases["particles"]
+        renderer = manager.sprite_renderer
+        self.assertIsNone(atlas.get_region(("particle", *renderer.key((0, 255, 0), 20, 255))))
+        self.assertIsNotNone(atlas.get_region(("particle", *renderer.key((255, 0, 0), 20, 255))))
+
+    def test_particle_store_compacts_survivors(self):
+        """Test that the particle store evicts the oldest and keeps survivors in order."""
+        from utils.particle_system import ParticleManager
+
+        manager = ParticleManager(max_particles=3)
+        manager.set_culling_distance(100)
+        manager.create_particle(10, 10, (255, 0, 0), 4, 0, 0, 5)
+        manager.create_particle(20, 10, (0, 255, 0), 4, 500, 0, 9)  # Flies offscreen
+        manager.create_particle(30, 10, (0, 0, 255), 4, 1, 0, 1)  # Expires first
+        manager.create_particle(40, 10, (9, 9, 9), 4, 1, 1, 8)  # Replaces the oldest
+
+        self.assertEqual(manager.count, 3)
+        self.assertEqual(list(manager.colors[:3]), [(255, 0, 0), (0, 255, 0), (9, 9, 9)])
+
+        manager.update()
+        self.assertEqual(manager.get_stats()["particles"], 2)
+        self.assertEqual(list(manager.colors[:2]), [(255, 0, 0), (9, 9, 9)])
+        self.assertEqual((manager.x[1], manager.y[1], manager.duration[1]), (41, 11, 7))
+        self.assertEqual(len(manager.draw(pygame.Surface((100, 100)))), 2)
+
+    def test_particle_store_swap_release_and_single_eviction(self):
+        """Test that releases swap in the last particle and a full store evicts only the oldest."""
+        from utils.particle_system import ParticleManager
+
+        manager = ParticleManager(max_particles=16)
+        for i in range(16):
+            manager.create_particle(i, 0, (i, 0, 0), 4, 0, 0, 10 + i)
+
+        manager.release_particle(3)
+        self.assertEqual(manager.count, 15)
+        self.assertEqual((manager.x[3], manager.colors[3]), (15, (15, 0, 0)))
+
+        manager.create_particle(99, 0, (99, 0, 0), 4, 0, 0, 50)
+        manager.create_particle(98, 0, (98, 0, 0), 4, 0, 0, 50)
+        self.assertEqual(manager.count, 16)  # Filled the released slot, then evicted one
+        durations = manager.duration[: manager.count].tolist()
+        self.assertNotIn(10, durations)
+        self.assertEqual(durations[-2:], [50, 50])
+        self.assertEqual(durations[:3], [11, 12, 25])  # Survivors keep their order
+
+    def test_enhanced_particles_vectorized_update(self):
+        """Test that enhanced particle bursts expire and cull with the same stats."""
+        from utils.enhanced_particle_system import EnhancedParticleSystem
+
+        system = EnhancedParticleSystem(max_particles=50)
+        system.set_screen_size(200, 200)
+        slow = system.create_particle_burst(
+            100, 100, count=40, speed_range=(10, 10), life_range=(0.5, 0.5)
+        )
+        fast = system.create_particle_burst(
+            100, 100, count=40, speed_range=(10000, 10000), life_range=(5, 5)
+        )
+        self.assertEqual((slow, fast), (40, 10))
+
+        system.update(0.1)
+        system.draw(pygame.Surface((200, 200)))
+        stats = system.get_stats()
+        self.assertEqual(stats["particles_culled"], 10)
+        self.assertEqual(stats["active_particles"], 40)
+        self.assertEqual(stats["draw_calls"], 40)
+
+        system.update(0.5)
+        stats = system.get_stats()
+        self.assertEqual(stats["particles_expired"], 40)
+        self.assertEqual(stats["particles_created"], 50)
+        self.assertEqual(system.get_particle_count(), 0)
+
+    def test_enhanced_particle_store_warmup_and_shrink(self):
+        """Test that the particle store grows to its peak once and shrinks when idle."""
+        from Display_settings import MAX_PARTICLES
+        from utils.enhanced_particle_system import EnhancedParticleSystem
+
+        system = EnhancedParticleSystem(max_particles=400, display_mode="QBOARD")
+        self.assertEqual(system.get_stats()["capacity"], MAX_PARTICLES["QBOARD"])
+
+        # The first big burst grows the store, later ones reuse it
+        for _ in range(3):
+            system.create_particle_burst(0, 0, count=250, speed_range=(0, 0), life_range=(1, 1))
+            system.update(1.0)
+        stats = system.get_stats()
+        self.assertEqual(stats["capacity"], 300)
+        self.assertEqual(stats["high_water_mark"], 250)
+        self.assertEqual(stats["allocations"], 2)
+
+        system.update(system.idle_shrink_delay)
+        self.assertEqual(system.get_stats()["capacity"], MAX_PARTICLES["QBOARD"])
+
+    def test_transformed_texture_cache(self):
+        """Test that transformed particle textures are quantized, reused and budgeted."""
+        from utils.enhanced_particle_system import TransformedTextureCache
+
+        texture = pygame.Surface((32, 32), pygame.SRCALPHA)
+        texture.fill((255, 255, 255, 255))
+        cache = TransformedTextureCache(memory_budget=32 * 32 * 4)
+        cache.prebake("square", texture)
+
+        first = cache.get("square", texture, 0.5, 90, (210, 100, 50))
+        self.assertIs(cache.get("square", texture, 0.51, 91, (212, 98, 52)), first)
+        self.assertEqual(first.get_size(), (16, 16))
+        self.assertEqual(first.get_at((8, 8)), (208, 96, 48, 255))
+
+        cache.get("square", texture, 1.0, 0, (255, 255, 255))
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 2, 1))
+        self.assertLessEqual(stats["cached_bytes"], cache.memory_budget)
+        self.assertEqual(stats["prebaked_textures"], 1)
+
+    def test_rasterized_particles_splat_in_one_blit(self):
+        """Test that rasterized particles are splatted additively in a single blit."""
+        from utils.enhanced_particle_system import EnhancedParticleSystem
+
+        system = EnhancedParticleSystem(max_particles=3000)
+        system.set_screen_size(400, 400)
+        system.create_particle_burst(
+            200, 200, count=2000, color=(64, 64, 64, 255), speed_range=(0, 0), rasterize=True
+        )
+        system.create_particle_burst(50, 50, count=5, color=(0, 0, 255, 255), speed_range=(0, 0))
+
+        screen = pygame.Surface((400, 400))
+        system.draw(screen)
+        stats = system.get_stats()
+        self.assertEqual(stats["draw_calls"], 2005)
+        self.assertEqual(stats["rasterizer"]["frames"], 1)
+        self.assertEqual(stats["rasterizer"]["particles_splatted"], 2000)
+
+        # Overlapping splats add up and clamp, sprites still draw normally
+        self.assertEqual(screen.get_at((200, 200))[:3], (255, 255, 255))
+        self.assertGreater(screen.get_at((50, 50))[2], 0)
+        self.assertEqual(screen.get_at((100, 300))[:3], (0, 0, 0))
+
+    def test_splat_rasterizer_far_apart_particles(self):
+        """Test that splats in opposite screen corners only pay for the tiles they touch."""
+        import time
+
+        import numpy as np
+
+        from utils.particle_rasterizer import TILE_SIZE, SplatRasterizer
+
+        rasterizer = SplatRasterizer()
+        screen = pygame.Surface((1920, 1080))
+        xs, ys = np.array([2, 1917]), np.array([2, 1077])
+        radii = np.array([3, 3])
+        colors = np.array([[255, 0, 0, 255], [0, 0, 255, 255]])
+        alphas = np.array([255, 255])
+
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            rasterizer.draw(screen, xs, ys, radii, colors, alphas)
+            timings.append(time.perf_counter() - start)
+
+        stats = rasterizer.get_stats()
+        self.assertEqual(stats["last_tiles"], 2)
+        self.assertEqual(stats["last_area"], 2 * (TILE_SIZE + 2 * 3) ** 2)
+        self.assertLess(min(timings), 0.01)
+        self.assertEqual(screen.get_at((2, 2))[:3], (255, 0, 0))
+        self.assertEqual(screen.get_at((1917, 1077))[:3], (0, 0, 255))
+        self.assertEqual(screen.get_at((960, 540))[:3], (0, 0, 0))
+
+    def test_sprite_batcher_one_blits_per_atlas(self):
+        """Test that batched sprites are packed once and submitted per atlas."""
+        from utils.texture_atlas import SpriteBatcher
+
+        batcher = SpriteBatcher()
+        screen = pygame.Surface((400, 400))
+        glyph = pygame.Surface((30, 40))
+        glyph.fill((0, 255, 0))
+
+        for i in range(20):
+            batcher.draw_circle((255, 0, 0) if i % 2 else (0, 0, 255), 8, (20 + i * 15, 50))
+        rect = batcher.draw_surface("glyphs", glyph, center=(200, 200))
+        batcher.flush(screen)
+        batcher.end_frame()
+
+        stats = batcher.get_stats()
+        self.assertEqual(stats["sprites"], 3)
+        self.assertEqual(stats["batches_per_frame"], 2)
+        self.assertEqual(stats["blits_per_frame"], 21)
+        self.assertEqual(rect, pygame.Rect(185, 180, 30, 40))
+        self.assertEqual(screen.get_at((200, 200))[:3], (0, 255, 0))
+        self.assertEqual(screen.get_at((35, 50))[:3], (255, 0, 0))
+
+    def test_sprite_batcher_evicts_least_recent_sprites(self):
+        """Test that a full atlas evicts its least recently drawn sprite, not everything."""
+        from utils.texture_atlas import SpriteBatcher, render_circle
+
+        sprite_bytes = 32 * 32 * 4
+        batcher = SpriteBatcher(atlas_sizes={"test": 64}, atlas_budgets={"test": 3 * sprite_bytes})
+        screen = pygame.Surface((200, 200))
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), (0, 255, 255)]
+
+        def draw(key, x=100):
+            return batcher.draw("test", key, lambda: render_circle(colors[key], 16), center=(x, 50))
+
+        for key in range(3):
+            draw(key)
+        batcher.flush(screen)
+        draw(0)  # Recently used again
+        batcher.flush(screen)
+        atlas = batcher.atlases["test"]
+        freed = atlas.get_texture_rect(1)
+
+        draw(3)
+        batcher.flush(screen)
+        self.assertIsNone(atlas.get_region(1))
+        self.assertIsNotNone(atlas.get_region(0))
+        self.assertEqual(atlas.get_texture_rect(3), freed)  # Space is reused
+        stats = batcher.atlas_stats("test")
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 4, 1))
+        self.assertEqual(stats["cached_bytes"], 3 * sprite_bytes)
+        self.assertEqual(batcher.get_stats()["atlas_resets"], 0)
+
+        # Sprites queued for the next flush are never evicted from under it
+        for key, x in zip((0, 2, 3), (20, 60, 100)):
+            draw(key, x)
+        draw(4, 140)
+        batcher.flush(screen)
+        self.assertEqual(batcher.get_stats()["evictions"], 4)
+        for key, x in zip((0, 2, 3, 4), (20, 60, 100, 140)):
+            self.assertEqual(screen.get_at((x, 50))[:3], colors[key])
+
+    def test_sprite_batcher_bounds_oversized_sprites(self):
+        """Test that sprites too large for a page share the atlas byte budget."""
+        from utils.texture_atlas import SpriteBatcher
+
+        sprite_bytes = 80 * 80 * 4
+        batcher = SpriteBatcher(atlas_sizes={"test": 64}, atlas_budgets={"test": 2 * sprite_bytes})
+        screen = pygame.Surface((200, 200))
+        surfaces = []
+        for i in range(5):
+            surface = pygame.Surface((80, 80))
+            surface.fill((i * 50, 0, 0))
+            surfaces.append(surface)
+            batcher.draw_surface("test", surface, center=(100, 100))
+            batcher.flush(screen)
+        self.assertEqual(screen.get_at((100, 100))[:3], (200, 0, 0))
+
+        stats = batcher.atlas_stats("test")
+        self.assertEqual((stats["oversized"], stats["evictions"]), (2, 3))
+        self.assertEqual(stats["cached_bytes"], 2 * sprite_bytes)
+        batcher.draw_surface("test", surfaces[4])
+        self.assertEqual(batcher.atlas_stats("test")["hits"], 1)
+
+        # A sprite larger than the whole budget is drawn but never kept
+        batcher.draw_surface("test", pygame.Surface((120, 120)))
+        batcher.flush(screen)
+        self.assertEqual(batcher.atlas_stats("test")["oversized"], 2)
+
+    def test_explosion_frames_follow_age(self):
+        """Test that explosion frames match the legacy expansion and are reused."""
+        from utils.explosion_renderer import ExplosionRenderer
+
+        renderer = ExplosionRenderer()
+        screen = pygame.Surface((800, 800))
+        explosion = {
+            "x": 400,
+            "y": 400,
+            "radius": 10,
+            "color": (255, 69, 0),
+            "max_radius": 270,
+            "duration": 30,
+            "start_duration": 30,
+        }
+
+        radius = 10.0
+        for _ in range(30):
+            radius += (270 - radius) * 0.1
+            renderer.draw(screen, explosion)
+            self.assertEqual(explosion["radius"], int(radius))
+            explosion["duration"] -= 1
+
+        # A second explosion of the same color draws from the same discs
+        explosion.update({"duration": 30, "radius": 10})
+        renderer.draw(screen, explosion)
+        stats = renderer.get_stats()
+        self.assertEqual(stats["sheets_built"], 1)
+        self.assertEqual(stats["discs"], stats["discs_built"])
+        self.assertLess(stats["discs"], 30)
+        self.assertEqual(screen.get_at((400, 400))[:3], (255, 69, 0))
+
+    def test_explosion_discs_prewarmed_within_budget(self):
+        """Test that prewarmed explosion discs are reused and bounded by bytes."""
+        from settings import FLAME_COLORS
+        from utils.explosion_renderer import ExplosionRenderer
+
+        renderer = ExplosionRenderer()
+        renderer.prewarm(FLAME_COLORS)
+        built = renderer.get_stats()["discs_built"]
+        self.assertLessEqual(renderer.cached_bytes, renderer.memory_budget)
+
+        explosion = {
+            "x": 100,
+            "y": 100,
+            "color": FLAME_COLORS[1],
+            "max_radius": 270,
+            "duration": 30,
+            "start_duration": 30,
+        }
+        screen = pygame.Surface((200, 200))
+        while explosion["duration"] > 0:
+            renderer.draw(screen, explosion)
+            explosion["duration"] -= 1
+        stats = renderer.get_stats()
+        self.assertEqual(stats["discs_built"], built)
+        self.assertEqual(stats["evictions"], 0)
+
+        small = ExplosionRenderer(memory_budget=renderer.cached_bytes // 4)
+        small.prewarm(FLAME_COLORS)
+        self.assertGreater(small.get_stats()["evictions"], 0)
+        self.assertLessEqual(small.cached_bytes, small.memory_budget)
+
+    def test_flame_beam_draws_from_palette(self):
+        """Test that flame beams blit pre-rendered puffs along the line."""
+        from utils.flame_renderer import FlameRenderer
+
+        renderer = FlameRenderer(seed=1)
+        screen = pygame.Surface((800, 600))
+        colors = [(255, 0, 0)]
+
+        rect = renderer.draw_beam(screen, (100, 300), (700, 300), colors, [40])
+        self.assertIsNone(renderer.draw_beam(screen, (50, 50), (50, 50), colors, [40]))
+
+        stats = renderer.get_stats()
+        self.assertEqual(stats["palettes"], 1)
+        self.assertEqual(stats["puffs_drawn"], 40)
+        self.assertTrue(rect.collidepoint(400, 300))
+        self.assertLessEqual(rect.height, 60)
+
+        # Solid flame cores are drawn, and nothing outside the returned rect
+        reds = pygame.surfarray.pixels_red(screen)
+        self.assertEqual(reds.max(), 255)
+        self.assertEqual(reds.sum(), reds[rect.left : rect.right, rect.top : rect.bottom].sum())
+        del reds
+
+    def test_dot_sprites_are_reused(self):
+        """Test that shaded dot sprites are rendered once per look and then reused."""
+        from utils.dot_renderer import DotSpriteCache, glow_step
+
+        cache = DotSpriteCache()
+        sprite, half = cache.get((0, 0, 255), 48, 240, False, 0)
+        self.assertEqual(half, 48)
+        self.assertEqual(sprite.get_at((48, 48))[:3], (0, 0, 203))  # Innermost ring
+        self.assertEqual(sprite.get_at((48, 1))[3], 240)  # Shimmer alpha on the rim
+
+        # Target dots carry the halo and share sprites within a glow step
+        target, target_half = cache.get((255, 0, 0), 48, 240, True, 0)
+        self.assertEqual(target_half, 56)
+        self.assertEqual(glow_step(1), glow_step(0))
+        cache.begin_frame()
+        self.assertIs(cache.get((255, 0, 0), 49, 245, True, 1)[0], target)
+        self.assertIs(cache.get((0, 0, 255), 48, 240, False, 1)[0], sprite)
+        self.assertEqual(cache.get_stats()["frame_allocations"], 0)
+        self.assertEqual(cache.get_stats()["hits"], 2)
+
+    @patch("pygame.display.update")
+    @patch("pygame.display.flip")
+    def test_dirty_rect_updates(self, mock_flip, mock_update):
+        """Test that small changes update only the dirty regions."""
+        from universal_class import DirtyRectManager
+
+        dirty = DirtyRectManager(1000, 1000, enabled=True, full_update_threshold=0.4)
+        dirty.present()  # First frame always flips
+        self.assertEqual(mock_flip.call_count, 1)
+
+        # Last frame's rect is included so moved objects get erased
+        dirty.mark(pygame.Rect(10, 10, 50, 50))
+        dirty.present()
+        dirty.mark(pygame.Rect(100, 10, 50, 50))
+        dirty.present()
+        mock_update.assert_called_with([pygame.Rect(10, 10, 50, 50), pygame.Rect(100, 10, 50, 50)])
+        self.assertEqual(mock_flip.call_count, 1)
+
+        # Large dirty area falls back to a full flip
+        dirty.mark(pygame.Rect(0, 0, 1000, 500))
+        dirty.present()
+        self.assertEqual(mock_flip.call_count, 2)
+
+        # Whole-screen changes force a flip
+        dirty.watch("scene", (255, 255, 255))
+        dirty.present()
+        dirty.watch("scene", (255, 255, 255))
+        dirty.present()
+        dirty.watch("scene", (0, 0, 0))
+        dirty.present()
+        self.assertEqual(mock_flip.call_count, 4)
+        self.assertEqual(dirty.get_stats()["partial_updates"], 3)
+
+    @patch("pygame.display.update")
+    @patch("pygame.display.flip")
+    def test_dirty_rects_disabled_flips_without_collecting(self, mock_flip, mock_update):
+        """Test that the default disabled mode just flips and keeps no rects."""
+        from universal_class import DirtyRectManager
+
+        dirty = DirtyRectManager(1000, 1000)
+        for _ in range(3):
+            dirty.mark([pygame.Rect(i * 20, 100, 8, 8) for i in range(40)])
+            dirty.present()
+        self.assertEqual(mock_flip.call_count, 3)
+        mock_update.assert_not_called()
+        self.assertEqual(dirty.rects, [])
+        self.assertEqual(dirty.previous_rects, [])
+
+    @patch("pygame.display.update")
+    @patch("pygame.display.flip")
+    def test_dirty_fraction_counts_overlaps_once(self, mock_flip, mock_update):
+        """Test that moving letters' old and new rects are not counted twice."""
+        import numpy as np
+
+        from universal_class import DirtyRectManager
+
+        dirty = DirtyRectManager(1920, 1080, enabled=True, full_update_threshold=0.4)
+        letters = [pygame.Rect(40 + 230 * i, 120 + 90 * (i % 3), 260, 300) for i in range(8)]
+        for letter in letters:
+            dirty.mark(letter)
+        dirty.present()
+        for frame in range(30):
+            previous = letters
+            letters = [letter.move(3, 2 if frame % 2 else -2) for letter in letters]
+            for letter in letters:
+                dirty.mark(letter)
+            dirty.present()
+
+            screen = np.zeros((1080, 1920), dtype=bool)
+            for rect in previous + letters:
+                screen[rect.top : rect.bottom, rect.left : rect.right] = True
+            self.assertAlmostEqual(dirty.last_dirty_fraction, screen.mean())
+            self.assertLess(dirty.last_dirty_fraction, 0.4)
+
+        # Summed areas would exceed the threshold on every frame
+        self.assertGreater(2 * len(letters) * 260 * 300 / (1920 * 1080), 0.4)
+        self.assertEqual(mock_flip.call_count, 1)
+        self.assertEqual(mock_update.call_count, 30)
+
+    def test_crack_layer_is_cached(self):
+        """Test that cracks are rasterized once and rebuilt only when they change."""
+        from universal_class import GlassShatterManager
+
+        manager = GlassShatterManager(400, 400)
+        screen = pygame.Surface((400, 400))
+        screen.fill((255, 255, 255))
+        self.assertIsNone(manager.draw_cracks(screen))
+
+        manager._create_crack(200, 200)
+        manager.draw_cracks(screen)
+        layer = manager._crack_layer
+        manager.draw_cracks(screen)
+        self.assertIs(manager._crack_layer, layer)
+        self.assertEqual(screen.get_at((200, 200))[:3], (0, 0, 0))
+
+        manager._create_crack(100, 100)
+        manager.draw_cracks(screen)
+        self.assertIsNot(manager._crack_layer, layer)
+
+        manager.reset()
+        self.assertIsNone(manager.draw_cracks(screen))
+
+    def test_star_field_scrolls_and_wraps(self):
+        """Test that the star tile scrolls down and wraps around the screen."""
+        from universal_class import StarFieldManager
+
+        stars = StarFieldManager(200, 100, count=1, speed=30)
+        stars.stars = [(50, 80, 3)]
+        screen = pygame.Surface((200, 100))
+
+        screen.fill((0, 0, 0))
+        rects = stars.draw(screen)
+        self.assertEqual(screen.get_at((50, 10))[:3], (200, 200, 200))  # 80 + 30 wraps to 10
+        self.assertEqual(screen.get_at((50, 80))[:3], (0, 0, 0))
+        self.assertTrue(rects[0].collidepoint(50, 10))
+
+
+class TestUnifiedPhysics(unittest.TestCase):
+    """Test the vectorized unified physics backend."""
+
+    def setUp(self):
+        """Set up test environment."""
+        from base_level import BaseGameObject
+        from unified_physics import UnifiedPhysicsSystem
+
+        self.BaseGameObject = BaseGameObject
+        self.UnifiedPhysicsSystem = UnifiedPhysicsSystem
+        self.physics = UnifiedPhysicsSystem(1920, 1080)
+
+    def test_bound_object_is_view_into_store(self):
+        """Test that a registered object reads and writes its store row."""
+        obj = self.BaseGameObject(100.0, 200.0, "A", "letter")
+        obj.dx = 3.0
+        self.physics.add_object(obj)
+
+        self.assertIs(obj.store, self.physics.bodies)
+        self.assertEqual(self.physics.bodies.x[obj.row], 100.0)
+        self.assertEqual(self.physics.bodies.dx[obj.row], 3.0)
+
+        obj.y = 250.0
+        self.assertEqual(self.physics.bodies.y[obj.row], 250.0)
+
+        self.physics.remove_object(obj)
+        self.assertIsNone(obj.store)
+        self.assertEqual(obj.y, 250.0)
+        self.assertEqual(len(self.physics.bodies), 0)
+
+    def test_batched_step_matches_scalar_update(self):
+        """Test that the batched step integrates like update_physics."""
+        scalar = self.BaseGameObject(500.0, 300.0, "A", "letter")
+        batched = self.BaseGameObject(500.0, 300.0, "A", "letter")
+        for obj in (scalar, batched):
+            obj.dx, obj.dy = 4.0, -7.0
+        self.physics.add_object(batched)
+
+        for _ in range(10):
+            scalar.update_physics(1920, 1080)
+            self.physics.step()
+
+        self.assertAlmostEqual(batched.x, scalar.x)
+        self.assertAlmostEqual(batched.y, scalar.y)
+        self.assertAlmostEqual(batched.dy, scalar.dy)
+        self.assertTrue(batched.can_bounce)
+
+    def test_batched_step_bounces_off_walls(self):
+        """Test wall reflection and damping in the batched step."""
+        objects = []
+        for i in range(200):
+            obj = self.BaseGameObject(1900.0, 1060.0, str(i), "letter")
+            obj.dx, obj.dy = 10.0, 10.0
+            objects.append(self.physics.add_object(obj))
+
+        self.physics.step()
+
+        for obj in objects:
+            self.assertEqual(obj.x, 1920 - obj.size / 2)
+            self.assertEqual(obj.y, 1080 - obj.size / 2)
+            self.assertAlmostEqual(obj.dy, -8.0)
+            self.assertLess(obj.dx, 0)
+
+    def test_dead_objects_are_not_integrated(self):
+        """Test that dead bodies keep their state."""
+        obj = self.physics.add_object(self.BaseGameObject(10.0, 10.0, "A"))
+        obj.dx = 5.0
+        obj.alive = False
+
+        self.physics.step()
+
+        self.assertEqual(obj.x, 10.0)
+
+    def test_collision_across_cell_border(self):
+        """Test that overlapping bodies in neighbouring cells collide."""
+        left = self.BaseGameObject(0.0, 500.0, "A")
+        right = self.BaseGameObject(0.0, 500.0, "B")
+        cell_size = self.physics.broad_phase.cell_size or 64
+        left.x = cell_size * 4 - 5.0
+        right.x = cell_size * 4 + 5.0
+        left.dx, right.dx = 2.0, -2.0
+        for obj in (left, right):
+            self.physics.add_object(obj)
+
+        self.physics.handle_object_collisions([left, right], 0)
+
+        self.assertEqual(self.physics.get_collision_stats()["contacts"], 1)
+        self.assertLess(left.dx, 0)
+        self.assertGreater(right.dx, 0)
+        self.assertGreater(right.x - left.x, 10.0)
+
+    def test_broad_phase_prunes_pairs(self):
+        """Test that the grid tests far fewer pairs than brute force."""
+        objects = []
+        for i in range(200):
+            obj = self.BaseGameObject((i % 20) * 95.0 + 10, (i // 20) * 105.0 + 10, str(i))
+            obj.size = 48
+            objects.append(self.physics.add_object(obj))
+
+        self.physics.handle_object_collisions(objects, 0)
+        stats = self.physics.get_collision_stats()
+
+        self.assertEqual(stats["brute_force_pairs"], 200 * 199 // 2)
+        self.assertLess(stats["pair_ratio"], 0.1)
+        self.assertGreaterEqual(stats["cell_size"], 2 * objects[0].size / 1.8)
+
+    def test_collision_strategies_find_same_contacts(self):
+        """Test that grid, sweep and brute broad phases agree."""
+        import numpy as np
+        from unified_physics import BROAD_PHASE_STRATEGIES
+
+        rng = np.random.default_rng(7)
+        x = rng.uniform(0, 1920, 150)
+        y = rng.uniform(0, 1080, 150)
+        radius = rng.uniform(20, 133, 150)
+
+        moved_x = x + 15.0 * (radius > 60)
+
+        def overlapping(strategy):
+            broad_phase = BROAD_PHASE_STRATEGIES[strategy](1920, 1080)
+            # Second frame exercises the sweep's incremental re-sort
+            broad_phase.find_pairs(x, y, radius)
+            first, second = broad_phase.find_pairs(moved_x, y, radius)
+            found = set()
+            for a, b in zip(first.tolist(), second.tolist()):
+                dist_sq = (moved_x[a] - moved_x[b]) ** 2 + (y[a] - y[b]) ** 2
+                if dist_sq < (radius[a] + radius[b]) ** 2:
+                    found.add((min(a, b), max(a, b)))
+            return found
+
+        expected = overlapping("brute")
+        self.assertTrue(expected)
+        self.assertEqual(overlapping("grid"), expected)
+        self.assertEqual(overlapping("sweep"), expected)
+
+    def test_layered_collisions_on_level_dicts(self):
+        """Test dict bodies, layer masks and the contact callback."""
+        letter = {"x": 500.0, "y": 500.0, "dx": 2.0, "dy": 0.0, "size": 240, "mass": 50.0}
+        emoji = {"x": 560.0, "y": 500.0, "dx": -2.0, "dy": 0.0, "mass": 50.0}
+        emoji["surface"] = pygame.Surface((96, 96))
+        contacts = []
+        self.physics.contact_callback = lambda a, b: contacts.append((a, b))
+
+        self.physics.set_layer_collision("letter", "emoji", False)
+        self.physics.handle_layered_collisions({"letter": [letter], "emoji": [emoji]}, 0)
+        self.assertEqual(letter["x"], 500.0)
+        self.assertEqual(self.physics.get_collision_stats()["candidate_pairs"], 0)
+
+        self.physics.set_layer_collision("letter", "emoji", True)
+        self.physics.handle_layered_collisions({"letter": [letter], "emoji": [emoji]}, 0)
+        self.assertLess(letter["dx"], 0)
+        self.assertGreater(emoji["dx"], 0)
+        self.assertGreater(emoji["x"] - letter["x"], 60.0)
+        self.assertEqual(contacts, [(letter, emoji)])
+
+    def test_fixed_timestep_is_independent_of_render_rate(self):
+        """Test that ticks follow elapsed time, with bounded catch-up."""
+        from unified_physics import FixedTimestep
+
+        slow, fast = FixedTimestep(50), FixedTimestep(50)
+        slow_ticks = sum(slow.advance(1 / 25) for _ in range(25))
+        fast_ticks = sum(fast.advance(1 / 100) for _ in range(100))
+        self.assertEqual(slow_ticks, 50)
+        self.assertIn(fast_ticks, (49, 50))
+
+        stalled = FixedTimestep(50, max_catch_up_steps=5)
+        self.assertEqual(stalled.advance(2.0), 5)
+        self.assertAlmostEqual(stalled.dropped_seconds, 1.9, delta=0.03)
+        self.assertLess(stalled.alpha, 1.0)
+
+    def test_render_position_interpolates_between_ticks(self):
+        """Test render interpolation for store bodies and level dicts."""
+        obj = self.physics.add_object(self.BaseGameObject(100.0, 100.0, "A"))
+        obj.dx, obj.dy = 10.0, 0.0
+        body = {"x": 100.0, "y": 100.0}
+
+        def tick():
+            self.physics.step()
+            body["x"] += 10.0
+
+        ticks = self.physics.advance(0.03, tick, (self.physics.registered_objects(), [body]))
+
+        self.assertEqual(ticks, 1)
+        self.assertAlmostEqual(self.physics.timestep.alpha, 0.5)
+        self.assertAlmostEqual(self.physics.render_position(obj)[0], 105.0)
+        self.assertAlmostEqual(self.physics.render_position(body)[0], 105.0)
+
+    def test_separating_bodies_do_not_bounce(self):
+        """Test that overlapping bodies already moving apart keep their velocities."""
+        self.physics.collision_frequency = 1
+        left = {"x": 500.0, "y": 500.0, "dx": -3.0, "dy": 0.0, "radius": 48}
+        right = {"x": 580.0, "y": 500.0, "dx": 3.0, "dy": 0.0, "radius": 48}
+        self.physics.handle_layered_collisions({"dot": [left, right]}, 0)
+
+        self.assertEqual((left["dx"], right["dx"]), (-3.0, 3.0))
+        self.assertLess(left["x"], 500.0)  # Still pushed out of overlap
+        self.assertGreater(right["x"], 580.0)
+
+        # Bodies closing on each other do bounce
+        left.update(x=500.0, dx=3.0)
+        right.update(x=580.0, dx=-3.0)
+        self.physics.handle_layered_collisions({"dot": [left, right]}, 0)
+        self.assertLess(left["dx"], 0.0)
+        self.assertGreater(right["dx"], 0.0)
+
+    def test_emojis_collide_at_half_their_width(self):
+        """Test that CL-case emojis collide at width / 2 and alphabet emojis at size / 1.8."""
+        from types import SimpleNamespace
+
+        from levels.cl_case_level import CLCaseLevel
+        from unified_physics import UnifiedObjectFactory
+
+        self.physics.collision_frequency = 1
+        level = SimpleNamespace(
+            width=1920,
+            physics_system=self.physics,
+            emoji_objects=[],
+            resource_manager=Mock(),
+        )
+        level.resource_manager.get_letter_emojis.return_value = [pygame.Surface((100, 100))]
+        factory = UnifiedObjectFactory()
+
+        def cl_case_emoji():
+            CLCaseLevel._spawn_emoji_target(level, "a", "emoji1")
+            return level.emoji_objects[-1]
+
+        def alphabet_emoji():
+            return self.physics.add_object(factory.create_emoji_object("", "a", 0, 0.0, 0.0, None))
+
+        def gap_after_collision(spawn, gap, y):
+            bodies = [spawn(), spawn()]
+            for body, x in zip(bodies, (500.0, 500.0 + gap)):
+                body.x, body.y = x, y
+                body.dx = body.dy = 0.0
+            self.physics.handle_object_collisions(bodies, 0)
+            return bodies[1].x - bodies[0].x
+
+        # CL-case emojis are 100 wide with radius 50: touching below 100, apart above it
+        self.assertGreater(gap_after_collision(cl_case_emoji, 95, 100.0), 95)
+        self.assertEqual(gap_after_collision(cl_case_emoji, 105, 300.0), 105)
+
+        # Alphabet emojis are size 96 with radius 96 / 1.8, about 53
+        self.assertGreater(gap_after_collision(alphabet_emoji, 100, 500.0), 100)
+        self.assertEqual(gap_after_collision(alphabet_emoji, 110, 700.0), 110)
+
+    def test_render_positions_read_store_columns(self):
+        """Test batched draw positions match render_position for mixed draw lists."""
+        bound = [
+            self.physics.add_object(self.BaseGameObject(100.0 * i, 50.0, "A")) for i in range(4)
+        ]
+        for obj in bound:
+            obj.dx, obj.dy = 10.0, 4.0
+        unbound = self.BaseGameObject(700.0, 80.0, "B")
+        body = {"x": 300.0, "y": 300.0}
+        self.physics.advance(0.03, self.physics.step, (self.physics.registered_objects(),))
+
+        objects = [bound[2], unbound, bound[0], body, bound[3]]
+        expected = [self.physics.render_position(obj) for obj in objects]
+        for actual, wanted in zip(self.physics.render_positions(objects), expected):
+            self.assertAlmostEqual(actual[0], wanted[0])
+            self.assertAlmostEqual(actual[1], wanted[1])
+        self.assertEqual(
+            self.physics.positions(objects),
+            [(obj.x, obj.y) for obj in (bound[2], unbound, bound[0])]
+            + [(300.0, 300.0), (bound[3].x, bound[3].y)],
+        )
+        self.assertEqual(self.physics.render_positions([]), [])
+
+    def test_resting_bodies_fall_asleep_and_wake(self):
+        """Test sleeping, skipped sleeping pairs and waking on contact."""
+        self.physics.collision_frequency = 1
+        resting = [
+            {"x": 500.0, "y": 900.0, "dx": 0.05, "dy": 0.0, "radius": 48},
+            {"x": 590.0, "y": 900.0, "dx": 0.0, "dy": 0.0, "radius": 48},
+        ]
+        for tick in range(self.physics.sleep_ticks):
+            self.physics.handle_layered_collisions({"dot": resting}, tick)
+
+        self.assertTrue(all(self.physics.is_sleeping(dot) for dot in resting))
+        self.assertEqual(resting[0]["dx"], 0.0)
+        self.physics.handle_layered_collisions({"dot": resting}, 0)
+        self.assertEqual(self.physics.get_collision_stats()["skipped_sleeping_pairs"], 1)
+
+        mover = {"x": 420.0, "y": 900.0, "dx": 8.0, "dy": 0.0, "radius": 48}
+        self.physics.handle_layered_collisions({"dot": resting + [mover]}, 0)
+        self.assertFalse(self.physics.is_sleeping(resting[0]))
+        self.assertTrue(self.physics.is_sleeping(resting[1]))
+
+    def test_explosion_wakes_sleeping_objects(self):
+        """Test that batched stepping skips sleepers until an explosion."""
+        obj = self.physics.add_object(self.BaseGameObject(500.0, 500.0, "A"))
+        self.physics.bodies.sleeping[obj.row] = True
+
+        self.physics.step()
+        self.physics.apply_explosion_force(450.0, 500.0, 150, [obj])
+        self.assertFalse(self.physics.is_sleeping(obj))
+        self.assertGreater(obj.dx, 0)
+
+    def test_batched_explosions_match_sequential(self):
+        """Test that queued explosions push bodies like the per-object loop."""
+        import random
+
+        rng = random.Random(3)
+        bodies = [
+            {"x": rng.uniform(0, 1000), "y": rng.uniform(0, 800), "dx": 0.0, "dy": 0.0,
+             "size": 40, "can_bounce": False}
+            for _ in range(150)
+        ]
+        blasts = [(300.0, 300.0), (320.0, 340.0), (800.0, 600.0)]
+
+        expected = [dict(body) for body in bodies]
+        for ex, ey in blasts:
+            for body in expected:
+                ox, oy = body["x"] - ex, body["y"] - ey
+                dist = math.hypot(ox, oy)
+                if 0 < dist < 150:
+                    force = (1 - dist / 150) * 15
+                    body["dx"] += ox / dist * force
+                    body["dy"] += oy / dist * force
+                    body["can_bounce"] = True
+
+        for strategy in ("grid", "sweep", "brute"):
+            physics = self.UnifiedPhysicsSystem(1000, 800, collision_strategy=strategy)
+            trial = [dict(body) for body in bodies]
+            for ex, ey in blasts:
+                physics.queue_explosion(ex, ey, 150)
+            pushed = physics.apply_queued_explosions({"letter": trial})
+
+            self.assertEqual(pushed, sum(1 for body in expected if body["can_bounce"]))
+            self.assertEqual(physics.pending_explosions, [])
+            for got, want in zip(trial, expected):
+                self.assertAlmostEqual(got["dx"], want["dx"], places=9)
+                self.assertAlmostEqual(got["dy"], want["dy"], places=9)
+                self.assertEqual(got["can_bounce"], want["can_bounce"])
+
+    def test_explosion_layer_filter(self):
+        """Test that a layered explosion only pushes its own layer."""
+        letter = {"x": 520.0, "y": 500.0, "dx": 0.0, "dy": 0.0, "size": 40}
+        emoji = {"x": 480.0, "y": 500.0, "dx": 0.0, "dy": 0.0, "size": 40}
+        self.physics.queue_explosion(500.0, 500.0, 150, layer="emoji")
+        self.physics.apply_queued_explosions({"letter": [letter], "emoji": [emoji]})
+        self.assertEqual(letter["dx"], 0.0)
+        self.assertLess(emoji["dx"], 0.0)
+
+    def test_swept_collision_catches_tunnelling(self):
+        """Test that fast bodies passing through each other still collide."""
+        for strategy in ("grid", "sweep", "brute"):
+            physics = self.UnifiedPhysicsSystem(1000, 1000, collision_strategy=strategy)
+            physics.collision_frequency = 1
+            # Moved 60px toward each other this tick and ended up swapped
+            falling = {"x": 500.0, "y": 560.0, "dx": 0.0, "dy": 60.0, "size": 36, "mass": 1}
+            rising = {"x": 500.0, "y": 500.0, "dx": 0.0, "dy": -60.0, "size": 36, "mass": 1}
+
+            physics.handle_layered_collisions({"number": [falling, rising]}, 0)
+
+            self.assertEqual(physics.get_collision_stats()["swept_contacts"], 1)
+            self.assertLess(falling["dy"], 0)
+            self.assertGreater(rising["dy"], 0)
+            self.assertLess(falling["y"], rising["y"])
+
+        physics.ccd_enabled = False
+        falling.update(y=560.0, dy=60.0)
+        rising.update(y=500.0, dy=-60.0)
+        physics.handle_layered_collisions({"number": [falling, rising]}, 0)
+        self.assertEqual(falling["dy"], 60.0)
+
+    def test_slow_bodies_skip_swept_test(self):
+        """Test that bodies moving less than the threshold are not swept."""
+        self.physics.collision_frequency = 1
+        a = self.physics.add_object(self.BaseGameObject(100.0, 100.0, "A"))
+        b = self.physics.add_object(self.BaseGameObject(900.0, 100.0, "B"))
+        a.dx = 1.0
+        self.physics.handle_object_collisions([a, b], 0)
+        self.assertEqual(self.physics.get_collision_stats()["fast_bodies"], 0)
+
+    def test_game_objects_are_slotted(self):
+        """Test that game objects have no instance dict and reuse their rect."""
+        from unified_physics import UnifiedObjectFactory
+
+        factory = UnifiedObjectFactory()
+        emoji = factory.create_emoji_object("", "A", 1, 10.0, 20.0, None)
+        dot = factory.create_color_dot(0, 0, (1, 2, 3))
+        for obj in (self.BaseGameObject(0.0, 0.0, "A"), emoji, dot):
+            self.assertFalse(hasattr(obj, "__dict__"))
+        with self.assertRaises(AttributeError):
+            emoji.unknown_field = 1
+
+        rect = emoji.rect
+        emoji.size = 40
+        self.assertIs(emoji.get_rect(), rect)
+        self.assertEqual(rect.center, (10, 20))
+        self.assertEqual(emoji.value, "A_emoji_1")
+
+    def test_invalid_collision_strategy(self):
+        """Test that unknown strategies are rejected."""
+        with self.assertRaises(ValueError):
+            self.physics.set_collision_strategy("octree")
+        self.physics.set_collision_strategy("sweep")
+        self.assertEqual(self.physics.get_collision_stats()["strategy"], "sweep")
+
+
+class TestHeadlessSimulator(unittest.TestCase):
+    """Test the headless physics simulator."""
+
+    def setUp(self):
+        """Set up test environment."""
+        import headless_simulator
+
+        self.simulator = headless_simulator
+
+    def test_simulation_is_reproducible(self):
+        """Test that a seeded run reports the same metrics twice."""
+        params = {"objects": 6, "spawn_interval": 10, "max_ticks": 400, "seed": 7}
+        first = self.simulator.simulate(params)
+        second = self.simulator.simulate(params)
+
+        for key in ("ticks", "collisions", "peak_pileup", "time_to_settle"):
+            self.assertEqual(first[key], second[key])
+        self.assertLessEqual(first["ticks"], 400)
+        self.assertGreater(first["ticks_per_second"], 0)
+
+    def test_parameter_grid_sweep(self):
+        """Test that a grid expands to every combination and runs in-process."""
+        grid = self.simulator.parameter_grid(spawn_interval=[10, 20], mode=["letter", "number"])
+        self.assertEqual(len(grid), 4)
+
+        for params in grid:
+            params.update(objects=3, max_ticks=100)
+        results = self.simulator.run_sweep(grid, workers=1)
+        self.assertEqual([r["mode"] for r in results], ["letter", "number"] * 2)
+
+    def test_level_spawn_modes(self):
+        """Test that every level spawn mode simulates and emoji companions are rejected."""
+        for mode in self.simulator.SPAWN_MODES:
+            result = self.simulator.simulate(
+                {"mode": mode, "objects": 3, "spawn_interval": 5, "max_ticks": 60}
+            )
+            self.assertEqual(result["mode"], mode)
+        with self.assertRaises(ValueError):
+            self.simulator.simulate({"mode": "emoji"})
+
+    def test_falling_body_keeps_pile_unsettled(self):
+        """Test that one body just spawned above a resting pile blocks settling."""
+        from base_level import BaseGameObject
+        from unified_physics import UnifiedPhysicsSystem
+
+        physics = UnifiedPhysicsSystem(1920, 1080)
+        for i in range(20):
+            body = physics.add_object(BaseGameObject(100.0 + 90 * i, 960.0, str(i)))
+            body.dx = body.dy = 0.0
+        falling = physics.add_object(BaseGameObject(900.0, 40.0, "new"))
+        falling.dx, falling.dy = 0.0, 6.2
+        escaped = physics.add_object(BaseGameObject(-4000.0, -500.0, "gone"))
+        escaped.dx, escaped.dy = -6.0, -0.5
+
+        self.assertGreaterEqual(self.simulator._max_speed(physics, 1920, 1080), 6.0)
+        self.assertEqual(
+            self.simulator._escaped_rows(physics, 1920, 1080).tolist(), [False] * 21 + [True]
+        )
+        falling.dy = 0.0
+        self.assertEqual(self.simulator._max_speed(physics, 1920, 1080), 0.0)
+
+        # The last shape has to land before the pile counts as settled
+        result = self.simulator.simulate({"mode": "shape"})
+        self.assertTrue(result["settled"])
+        self.assertGreater(result["time_to_settle"], 100)
+
+    def test_spawn_step_is_shared_with_levels(self):
+        """Test the factory spawn step the levels and the simulator both call."""
+        from unified_physics import UnifiedObjectFactory, UnifiedPhysicsSystem
+
+        factory = UnifiedObjectFactory()
+        physics = UnifiedPhysicsSystem(1920, 1080)
+        queue = ["A", "B"]
+
+        self.assertIsNone(factory.spawn_next("shape", queue, 7, physics, 1920, interval=30))
+        shape = factory.spawn_next("shape", queue, 30, physics, 1920, interval=30)
+        self.assertEqual((shape.value, shape.type, shape.y), ("A", "shape", -50))
+        self.assertTrue(50 <= shape.x <= 1870)
+        self.assertIs(shape.store, physics.bodies)
+        self.assertEqual(queue, ["B"])
+        letter = factory.spawn_next("case_letter", queue, 60, physics, 1920, interval=30)
+        self.assertEqual((letter.type, letter.size), ("letter", 240))
+        self.assertIsNone(factory.spawn_next("case_letter", queue, 90, physics, 1920))
+
 
 class TestLevelSystem(unittest.TestCase):
     """Test level system components."""
@@ -483,6 +1605,126 @@ class TestLevelSystem(unittest.TestCase):
         except ImportError:
             self.skipTest("AlphabetLevel not available for testing")
 
+    def test_colors_dots_use_batched_physics(self):
+        """Test that colors level dots live in the physics store and bounce in its step."""
+        from levels.colors_level import DOT_RADIUS, ColorsLevel
+
+        level = ColorsLevel(
+            1920,
+            1080,
+            pygame.Surface((1920, 1080)),
+            self.font_mock,
+            self.managers["particle_manager"],
+            self.managers["glass_shatter_manager"],
+            self.managers["multi_touch_manager"],
+            self.managers["hud_manager"],
+            100,
+            self.functions["create_explosion_func"],
+            Mock(),
+            self.functions["game_over_screen_func"],
+            [],
+            self.functions["draw_explosion_func"],
+            self.managers["sound_manager"],
+        )
+        top = level._create_dot(60.0, 60.0, (255, 0, 0), True)
+        top.dx, top.dy = -20.0, -20.0
+        middle = level._create_dot(900.0, 500.0, (0, 0, 255), False)
+        middle.dx, middle.dy = 4.0, 0.0
+        level.dots = [top, middle]
+        self.assertIs(top.store, level.physics_system.bodies)
+
+        level._simulation_tick()
+
+        # Walls stop the drawn radius and keep the full speed, even near the top
+        self.assertAlmostEqual(top.x, DOT_RADIUS)
+        self.assertAlmostEqual(top.y, DOT_RADIUS)
+        self.assertEqual((top.dx, top.dy), (20.0, 20.0))
+        self.assertEqual((middle.x, middle.y), (904.0, 500.0))
+
+        level._handle_click(904, 500)  # Distractors are hit but not destroyed
+        self.assertTrue(middle.alive)
+        level._handle_click(top.x, top.y)
+        self.assertFalse(top.alive)
+        self.assertIsNone(top.store)
+        self.assertEqual(len(level.physics_system.bodies), 1)
+
+    @patch("pygame.display.update")
+    @patch("pygame.display.flip")
+    def test_level_frame_uses_partial_updates(self, mock_flip, mock_update):
+        """Test that a busy level frame goes out as a rect update, not a flip."""
+        from levels.alphabet_level import AlphabetLevel
+        from universal_class import GlassShatterManager
+        from utils.particle_system import ParticleManager
+
+        screen = pygame.Surface((1920, 1080))
+        particles = ParticleManager(200)
+        self.managers["glass_shatter_manager"] = GlassShatterManager(1920, 1080)
+        self.managers["particle_manager"] = particles
+        self.managers["center_piece_manager"].update_and_draw.return_value = None
+        self.managers["flamethrower_manager"].draw.return_value = None
+        self.managers["hud_manager"].display_info.return_value = pygame.Rect(20, 20, 400, 60)
+        self.managers["resource_manager"].get_falling_glyph.return_value = pygame.Surface(
+            (80, 100)
+        )
+        self.managers["resource_manager"].get_letter_emojis.return_value = []
+        self.functions["draw_explosion_func"].return_value = None
+        level = AlphabetLevel(
+            1920,
+            1080,
+            screen,
+            [self.font_mock],
+            self.font_mock,
+            self.font_mock,
+            **self.managers,
+            **self.functions,
+            explosions_list=[],
+            lasers_list=[],
+        )
+        level.reset_level_state()
+        level.game_started = True
+        level.dirty_rects.enabled = True
+        level.star_field.reset()
+
+        for frame in range(120):
+            level.physics_system.advance(1 / 50, level._simulation_tick)
+            if frame % 10 == 0:  # A tap sprays a burst of sparks
+                for spark in range(20):
+                    particles.create_particle(
+                        frame * 15, 500, (255, 128, 0), 6, spark % 5 - 2, spark // 5 - 2, 40
+                    )
+            level._draw_frame()
+            level.dirty_rects.mark(particles.draw(screen))
+            level.dirty_rects.present()
+
+        # Stars, letters, particles and last frame's rects overflow max_rects
+        # before merging, yet every frame after the first is a partial update
+        self.assertGreater(len(level.letters), 0)
+        self.assertEqual(mock_flip.call_count, 1)
+        self.assertEqual(mock_update.call_count, 119)
+        rects = mock_update.call_args[0][0]
+        self.assertLessEqual(len(rects), level.dirty_rects.max_rects)
+        self.assertTrue(all(isinstance(rect, pygame.Rect) for rect in rects))
+
+    @patch("pygame.display.update")
+    @patch("pygame.display.flip")
+    def test_dirty_rects_merge_before_rect_limit(self, mock_flip, mock_update):
+        """Test that too many small rects are merged rather than flipping the display."""
+        from universal_class import DirtyRectManager
+
+        dirty = DirtyRectManager(1000, 1000, enabled=True, max_rects=16)
+        dirty.present()
+        for i in range(40):
+            dirty.mark(pygame.Rect(i * 20, 100, 8, 8))  # A row of close stars
+        dirty.mark(pygame.Rect(900, 900, 50, 50))
+        dirty.present()
+
+        self.assertEqual(mock_flip.call_count, 1)
+        rects = mock_update.call_args[0][0]
+        self.assertLessEqual(len(rects), 16)
+        for i in range(40):
+            self.assertNotEqual(pygame.Rect(i * 20, 100, 8, 8).collidelist(rects), -1)
+        self.assertLess(dirty.get_stats()["last_dirty_fraction"], 0.05)
+
 
 class TestUtilityFunctions(unittest.TestCase):
     """Test utility functions."""
@@ -537,6 +1779,8 @@ def run_all_tests():
         TestSoundSystem,
         TestGameLogic,
         TestPerformanceOptimizations,
+        TestUnifiedPhysics,
+        TestHeadlessSimulator,
         TestLevelSystem,
         TestUtilityFunctions,
     ]
@@ -5,8 +5,406 @@ Consolidates collision detection and physics calculations to eliminate duplicati
 
 import math
 import random
-from typing import List, Dict, Any, Optional, Tuple
-from base_level import BaseGameObject
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable
+
+import numpy as np
+
+from base_level import BaseGameObject, ColorDot, EmojiObject
+from settings import LETTER_SPAWN_INTERVAL
+
+
+DEFAULT_LAYER = "default"
+DEFAULT_TICK_RATE = 50  # Simulation ticks per second; levels were tuned at 50 FPS
+DEFAULT_MAX_CATCH_UP_STEPS = 5
+
+
+def _body_alive(obj) -> bool:
+    """Whether a game object or level dict takes part in collisions."""
+    if isinstance(obj, dict):
+        return obj.get("alive", True)
+    return obj.alive
+
+
+def _body_state(obj) -> Tuple[float, float, float, float, float, float]:
+    """Read (x, y, dx, dy, mass, radius) from a game object or level dict."""
+    if not isinstance(obj, dict):
+        return obj.x, obj.y, obj.dx, obj.dy, obj.mass, obj.size * obj.collision_scale
+
+    if "radius" in obj:
+        radius = obj["radius"]
+    elif "size" in obj:
+        radius = obj["size"] / 1.8
+    elif "surface" in obj:
+        radius = obj["surface"].get_width() / 2
+    else:
+        radius = 50 / 1.8
+    return obj["x"], obj["y"], obj["dx"], obj["dy"], obj.get("mass", 1.0), radius
+
+
+class PhysicsBodyStore:
+    """
+    Structure-of-arrays storage for rigid body state.
+
+    Every physics attribute lives in its own NumPy column so the whole body
+    population can be integrated in a handful of vectorized operations.
+    BaseGameObject instances bound to a store are thin views onto one row.
+    """
+
+    COLUMNS = {
+        "x": np.float64,
+        "y": np.float64,
+        "dx": np.float64,
+        "dy": np.float64,
+        "mass": np.float64,
+        "size": np.float64,
+        "collision_scale": np.float64,  # Collision radius as a share of size
+        "can_bounce": np.bool_,
+        "alive": np.bool_,
+        # Positions at the start of the last fixed tick, for render interpolation
+        "prev_x": np.float64,
+        "prev_y": np.float64,
+        # Resting bodies are put to sleep and skip integration and narrow phase
+        "sleeping": np.bool_,
+        "still_ticks": np.int32,
+    }
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = 0
+        self.occupied = np.zeros(0, dtype=np.bool_)
+        self.objects: List[Optional[BaseGameObject]] = []
+        self._free_rows: List[int] = []
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self._grow(max(1, capacity))
+
+    def _grow(self, new_capacity: int):
+        """Resize every column, keeping existing rows in place."""
+        extra = new_capacity - self.capacity
+        for name, dtype in self.COLUMNS.items():
+            column = getattr(self, name)
+            setattr(self, name, np.concatenate([column, np.zeros(extra, dtype=dtype)]))
+        self.occupied = np.concatenate([self.occupied, np.zeros(extra, dtype=np.bool_)])
+        self.objects.extend([None] * extra)
+        # Hand out low rows first so active bodies stay packed together
+        self._free_rows.extend(range(new_capacity - 1, self.capacity - 1, -1))
+        self._free_rows.sort(reverse=True)
+        self.capacity = new_capacity
+
+    def allocate(self, obj: Optional[BaseGameObject] = None) -> int:
+        """Reserve a row for a body and return its index."""
+        if not self._free_rows:
+            self._grow(self.capacity * 2)
+        row = self._free_rows.pop()
+        self.occupied[row] = True
+        self.objects[row] = obj
+        return row
+
+    def release(self, row: int):
+        """Return a row to the free list and clear its state."""
+        if not self.occupied[row]:
+            return
+        for name in self.COLUMNS:
+            getattr(self, name)[row] = 0
+        self.occupied[row] = False
+        self.objects[row] = None
+        self._free_rows.append(row)
+
+    def active_mask(self) -> np.ndarray:
+        """Boolean mask of rows that hold a live body."""
+        return self.occupied & self.alive
+
+    def active_rows(self) -> np.ndarray:
+        """Indices of rows that hold a live body."""
+        return np.flatnonzero(self.active_mask())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.occupied))
+
+
+class UniformGridBroadPhase:
+    """
+    Uniform-grid broad phase for circle bodies.
+
+    The cell size is the largest collision diameter in the population, so
+    overlapping bodies are never more than one cell apart. Each occupied
+    cell is tested against itself and its forward half-neighbourhood
+    (east, south-west, south, south-east); the other four neighbours are
+    covered when those cells take their turn, so no pair is produced twice
+    and no de-duplication set is needed.
+
+    Cell bookkeeping arrays are kept between frames and only reallocated
+    when the cell size changes.
+    """
+
+    FORWARD_OFFSETS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+    def __init__(self, width: int, height: int, min_cell_size: int = 16):
+        self.width = width
+        self.height = height
+        self.min_cell_size = min_cell_size
+        self.cell_size = 0
+        self.cols = 0
+        self.rows = 0
+        self.rebuilds = 0
+        self._cell_start = np.zeros(1, dtype=np.intp)
+        self._order = None
+        self._counts = None
+
+    def _configure(self, cell_size: int):
+        """Resize the grid when the largest body changes."""
+        if cell_size == self.cell_size:
+            return
+        self.cell_size = cell_size
+        self.cols = int(self.width // cell_size) + 1
+        self.rows = int(self.height // cell_size) + 1
+        self._cell_start = np.zeros(self.cols * self.rows + 1, dtype=np.intp)
+        self.rebuilds += 1
+
+    def build(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray):
+        """Bucket bodies into grid cells for pair finding and radius queries."""
+        # Round up to a multiple of 8 so small size changes keep the grid
+        diameter = 2 * float(radius.max()) if len(radius) else 0.0
+        self._configure(max(self.min_cell_size, int(math.ceil(diameter / 8.0)) * 8))
+
+        # Clamp off-screen bodies into the border cells; clamping never
+        # separates bodies by more than one cell, so pairs are still found
+        cell_x = np.clip((x // self.cell_size).astype(np.intp), 0, self.cols - 1)
+        cell_y = np.clip((y // self.cell_size).astype(np.intp), 0, self.rows - 1)
+        keys = cell_y * self.cols + cell_x
+
+        # Counting sort of bodies into cells, reusing the start-offset buffer
+        self._order = np.argsort(keys, kind="stable")
+        self._counts = np.bincount(keys, minlength=self.cols * self.rows)
+        np.cumsum(self._counts, out=self._cell_start[1:])
+
+    def query(self, qx: float, qy: float, qr: float) -> np.ndarray:
+        """
+        Indices of bodies whose centres may lie within qr of (qx, qy).
+
+        Only the cells under the circle's bounding box are visited; within a
+        grid row those cells are one contiguous run of the sorted order.
+        """
+        if self._order is None or len(self._order) == 0:
+            return np.zeros(0, dtype=np.intp)
+        cs = self.cell_size
+        x0 = min(max(int((qx - qr) // cs), 0), self.cols - 1)
+        x1 = min(max(int((qx + qr) // cs), 0), self.cols - 1)
+        y0 = min(max(int((qy - qr) // cs), 0), self.rows - 1)
+        y1 = min(max(int((qy + qr) // cs), 0), self.rows - 1)
+        starts = self._cell_start
+        runs = [
+            self._order[starts[cy * self.cols + x0]:starts[cy * self.cols + x1 + 1]]
+            for cy in range(y0, y1 + 1)
+        ]
+        return np.concatenate(runs)
+
+    def find_pairs(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray, keys=None):
+        """
+        Find candidate pairs of bodies that may overlap.
+
+        Returns:
+            Two index arrays (first, second) into the input arrays
+        """
+        if len(x) < 2:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+
+        self.build(x, y, radius)
+        order = self._order.tolist()
+        counts = self._counts
+        starts = self._cell_start.tolist()
+
+        first: List[int] = []
+        second: List[int] = []
+        for key in np.flatnonzero(counts).tolist():
+            members = order[starts[key]:starts[key + 1]]
+
+            # Pairs inside the cell
+            for a in range(len(members) - 1):
+                for b in range(a + 1, len(members)):
+                    first.append(members[a])
+                    second.append(members[b])
+
+            # Pairs with the forward neighbours
+            cy, cx = divmod(key, self.cols)
+            for off_x, off_y in self.FORWARD_OFFSETS:
+                nx, ny = cx + off_x, cy + off_y
+                if not (0 <= nx < self.cols and ny < self.rows):
+                    continue
+                neighbour_key = ny * self.cols + nx
+                neighbours = order[starts[neighbour_key]:starts[neighbour_key + 1]]
+                for a in members:
+                    for b in neighbours:
+                        first.append(a)
+                        second.append(b)
+
+        return np.array(first, dtype=np.intp), np.array(second, dtype=np.intp)
+
+
+class SweepAndPruneBroadPhase:
+    """
+    Sort-and-sweep broad phase along the x axis.
+
+    The body order sorted by left edge is kept between frames and repaired
+    with an insertion sort, which is close to linear because bodies move
+    only a little per frame. Suited to small populations of large bodies,
+    where a uniform grid degenerates into a handful of crowded cells.
+    """
+
+    def __init__(self, width: int = 0, height: int = 0):
+        self.width = width
+        self.height = height
+        self.cell_size = 0  # Not grid based; kept for a uniform stats interface
+        self.swaps = 0  # Insertion-sort swaps in the last pass
+        self._order_keys: List[int] = []
+        self._query_order = None
+        self._query_x = None
+
+    def build(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray):
+        """Sort body centres by x for radius queries."""
+        self._query_order = np.argsort(x, kind="stable")
+        self._query_x = x[self._query_order]
+
+    def query(self, qx: float, qy: float, qr: float) -> np.ndarray:
+        """Indices of bodies whose centre x lies within qr of qx."""
+        if self._query_x is None:
+            return np.zeros(0, dtype=np.intp)
+        lo = np.searchsorted(self._query_x, qx - qr, side="left")
+        hi = np.searchsorted(self._query_x, qx + qr, side="right")
+        return self._query_order[lo:hi]
+
+    def _ordered_indices(self, keys: List[int]) -> List[int]:
+        """Map last frame's order onto the current bodies, appending new ones."""
+        index_of = {key: index for index, key in enumerate(keys)}
+        order = [index_of.pop(key) for key in self._order_keys if key in index_of]
+        order.extend(index_of.values())
+        return order
+
+    def find_pairs(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray, keys=None):
+        """
+        Find candidate pairs whose x and y extents overlap.
+
+        Args:
+            keys: Stable per-body identifiers (e.g. store rows) used to carry
+                the sorted order over to the next frame
+
+        Returns:
+            Two index arrays (first, second) into the input arrays
+        """
+        count = len(x)
+        if keys is None:
+            keys = np.arange(count)
+        keys = keys.tolist()
+        if count < 2:
+            self._order_keys = keys
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+
+        min_x = (x - radius).tolist()
+        max_x = (x + radius).tolist()
+        ys = y.tolist()
+        rs = radius.tolist()
+
+        # Insertion sort from last frame's order
+        order = self._ordered_indices(keys)
+        swaps = 0
+        for i in range(1, count):
+            current = order[i]
+            edge = min_x[current]
+            j = i - 1
+            while j >= 0 and min_x[order[j]] > edge:
+                order[j + 1] = order[j]
+                j -= 1
+                swaps += 1
+            order[j + 1] = current
+        self.swaps = swaps
+        self._order_keys = [keys[index] for index in order]
+
+        # Sweep: each body only looks right until the intervals stop overlapping
+        first: List[int] = []
+        second: List[int] = []
+        for position, a in enumerate(order):
+            right_edge = max_x[a]
+            ay, ar = ys[a], rs[a]
+            for b in order[position + 1:]:
+                if min_x[b] > right_edge:
+                    break
+                if abs(ys[b] - ay) < ar + rs[b]:
+                    first.append(a)
+                    second.append(b)
+
+        return np.array(first, dtype=np.intp), np.array(second, dtype=np.intp)
+
+
+class BruteForceBroadPhase:
+    """Tests every pair of bodies; cheapest for a handful of bodies."""
+
+    def __init__(self, width: int = 0, height: int = 0):
+        self.width = width
+        self.height = height
+        self.cell_size = 0
+        self._count = 0
+
+    def build(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray):
+        """Remember the body count for radius queries."""
+        self._count = len(x)
+
+    def query(self, qx: float, qy: float, qr: float) -> np.ndarray:
+        """Every body is a candidate."""
+        return np.arange(self._count)
+
+    def find_pairs(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray, keys=None):
+        """Return every pair as two index arrays (first, second)."""
+        first, second = np.triu_indices(len(x), 1)
+        return first.astype(np.intp), second.astype(np.intp)
+
+
+BROAD_PHASE_STRATEGIES = {
+    "grid": UniformGridBroadPhase,
+    "sweep": SweepAndPruneBroadPhase,
+    "brute": BruteForceBroadPhase,
+}
+
+
+class FixedTimestep:
+    """
+    Accumulator that turns variable frame times into fixed simulation ticks.
+
+    Each rendered frame adds its duration to the accumulator and the
+    simulation runs one tick per whole tick interval stored there. A stalled
+    frame is caught up over at most max_catch_up_steps ticks; time beyond
+    that is dropped so a long stall cannot trigger a spiral of death.
+    """
+
+    def __init__(
+        self,
+        tick_rate: float = DEFAULT_TICK_RATE,
+        max_catch_up_steps: int = DEFAULT_MAX_CATCH_UP_STEPS,
+    ):
+        self.tick_rate = tick_rate
+        self.tick_seconds = 1.0 / tick_rate
+        self.max_catch_up_steps = max_catch_up_steps
+        self.accumulator = 0.0
+        self.dropped_seconds = 0.0
+
+    def advance(self, frame_seconds: float) -> int:
+        """Add a frame's duration and return how many ticks to run."""
+        self.accumulator += max(0.0, frame_seconds)
+        steps = int(self.accumulator // self.tick_seconds)
+        if steps > self.max_catch_up_steps:
+            dropped = (steps - self.max_catch_up_steps) * self.tick_seconds
+            self.dropped_seconds += dropped
+            self.accumulator -= dropped
+            steps = self.max_catch_up_steps
+        self.accumulator -= steps * self.tick_seconds
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a tick elapsed since the last one, for interpolation."""
+        return max(0.0, min(1.0, self.accumulator / self.tick_seconds))
+
+    def reset(self):
+        """Discard any accumulated time."""
+        self.accumulator = 0.0
 
 
 class UnifiedPhysicsSystem:
@@ -15,137 +413,753 @@ class UnifiedPhysicsSystem:
     Eliminates duplicate collision code across level classes.
     """
 
-    def __init__(self, width: int, height: int):
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        collision_strategy: str = "grid",
+        tick_rate: float = DEFAULT_TICK_RATE,
+        max_catch_up_steps: int = DEFAULT_MAX_CATCH_UP_STEPS,
+        seed: Optional[int] = None,
+    ):
         self.width = width
         self.height = height
-        self.collision_frequency = 2  # Check collisions every N frames for performance
+        self.collision_frequency = 2  # Check collisions every N ticks for performance
+        self.bounce_damping = 0.8  # Velocity kept after hitting a wall
+        self.wall_extent = 0.5  # Share of a body's size kept inside the walls
+        self.floor_push = (0.1, 0.3)  # Sideways push range after a floor bounce, or None
+        self.restitution = 0.85  # Velocity kept along the normal in body collisions
+
+        # Vectorized backend: registered objects are views into these arrays
+        self.bodies = PhysicsBodyStore()
+        self._rng = np.random.default_rng(seed)
+
+        # Fixed-timestep stepping
+        self.timestep = FixedTimestep(tick_rate, max_catch_up_steps)
+        self.tick_count = 0
+
+        # Collision pipeline
+        self.collision_strategy = collision_strategy
+        self.broad_phase = None
+        self.set_collision_strategy(collision_strategy)
+        self.disabled_layer_pairs = set()
+        self.contact_callback = None  # Called as callback(body_a, body_b) on each bounce
+        self.pending_explosions: List[Tuple[float, float, float, float, Optional[str]]] = []
+
+        # Body sleeping
+        self.sleep_enabled = True
+        self.sleep_speed = 0.15  # Speed (px/tick) below which a body counts as still
+        self.sleep_ticks = 30  # Still ticks before a body falls asleep
+
+        # Continuous collision detection for bodies that move far per pass
+        self.ccd_enabled = True
+        self.ccd_fraction = 0.5  # Sweep bodies travelling more than this share of their radius
+        self.collision_stats = {
+            "bodies": 0,
+            "candidate_pairs": 0,
+            "contacts": 0,
+            "brute_force_pairs": 0,
+            "passes": 0,
+            "total_candidate_pairs": 0,
+            "total_contacts": 0,
+            "skipped_sleeping_pairs": 0,
+            "sleeping": 0,
+            "explosion_candidates": 0,
+            "explosion_hits": 0,
+            "fast_bodies": 0,
+            "swept_contacts": 0,
+        }
+
+    def set_collision_strategy(self, strategy: str):
+        """
+        Select the broad phase used by handle_object_collisions.
+
+        Args:
+            strategy: "grid" for many small bodies, "sweep" for few large
+                bodies, or "brute" for a handful of bodies
+        """
+        if strategy not in BROAD_PHASE_STRATEGIES:
+            raise ValueError(
+                f"Unknown collision strategy '{strategy}', "
+                f"expected one of {sorted(BROAD_PHASE_STRATEGIES)}"
+            )
+        self.collision_strategy = strategy
+        self.broad_phase = BROAD_PHASE_STRATEGIES[strategy](self.width, self.height)
+
+    def add_object(self, obj: BaseGameObject) -> BaseGameObject:
+        """Register an object with the batched physics backend."""
+        if obj.store is not self.bodies:
+            if obj.store is not None:
+                obj.unbind()
+            row = obj.bind(self.bodies)
+            self.bodies.prev_x[row] = obj.x
+            self.bodies.prev_y[row] = obj.y
+        return obj
+
+    def remove_object(self, obj: BaseGameObject):
+        """Detach an object from the backend, keeping its last state."""
+        if obj.store is self.bodies:
+            obj.unbind()
+
+    def clear(self):
+        """Detach every registered object."""
+        for row in np.flatnonzero(self.bodies.occupied):
+            obj = self.bodies.objects[row]
+            if obj is not None:
+                obj.unbind()
+            else:
+                self.bodies.release(row)
 
     def update_object_physics(self, obj: BaseGameObject, frame_count: int):
         """Update physics for a single game object."""
-        obj.update_physics(self.width, self.height)
+        obj.update_physics(self.width, self.height, self.bounce_damping)
+
+    def step(self):
+        """
+        Integrate every registered body in one batched pass.
+
+        Matches BaseGameObject.update_physics: move by velocity, enable
+        bouncing once a body has fallen past the top fifth of the screen,
+        then reflect and damp velocities at the walls. Levels with other
+        wall rules adjust bounce_damping, wall_extent and floor_push.
+        """
+        b = self.bodies
+        active = b.active_mask() & ~b.sleeping
+        if not active.any():
+            return
+
+        np.add(b.x, b.dx, out=b.x, where=active)
+        np.add(b.y, b.dy, out=b.y, where=active)
+
+        b.can_bounce |= active & (b.y > self.height // 5)
+        bouncing = active & b.can_bounce
+        if not bouncing.any():
+            return
+
+        damping = self.bounce_damping
+        half = b.size * self.wall_extent
+
+        # Left/Right walls
+        left = bouncing & (b.x <= half)
+        right = bouncing & ~left & (b.x >= self.width - half)
+        b.x[left] = half[left]
+        b.dx[left] = np.abs(b.dx[left]) * damping
+        b.x[right] = self.width - half[right]
+        b.dx[right] = -np.abs(b.dx[right]) * damping
+
+        # Top/Bottom walls
+        top = bouncing & (b.y <= half)
+        bottom = bouncing & ~top & (b.y >= self.height - half)
+        b.y[top] = half[top]
+        b.dy[top] = np.abs(b.dy[top]) * damping
+        b.y[bottom] = self.height - half[bottom]
+        b.dy[bottom] = -np.abs(b.dy[bottom]) * damping
+
+        # Push horizontally away from the edge on bottom bounces
+        if bottom.any():
+            b.dx[bottom] *= damping
+            if self.floor_push is not None:
+                low, high = self.floor_push
+                nudge = self._rng.uniform(low, high, int(np.count_nonzero(bottom)))
+                b.dx[bottom] += np.where(b.x[bottom] < self.width / 2, 1.0, -1.0) * nudge
+
+    def configure_timestep(self, performance_settings: Dict[str, Any]):
+        """Apply tick rate and catch-up limit from a PERFORMANCE_SETTINGS entry."""
+        self.timestep = FixedTimestep(
+            performance_settings.get("physics_tick_rate", DEFAULT_TICK_RATE),
+            performance_settings.get("max_catch_up_steps", DEFAULT_MAX_CATCH_UP_STEPS),
+        )
+
+    def advance(
+        self,
+        frame_seconds: float,
+        tick: Optional[Callable[[], None]] = None,
+        bodies: Iterable[List[Any]] = (),
+    ) -> int:
+        """
+        Run as many fixed ticks as the elapsed frame time calls for.
+
+        Args:
+            frame_seconds: Wall-clock duration of the last rendered frame
+            tick: Callable that advances the game by one tick; defaults to
+                step() plus collisions for every registered body
+            bodies: Lists of level dicts whose positions should be
+                snapshotted for render_position() before each tick
+
+        Returns:
+            Number of ticks run
+        """
+        steps = self.timestep.advance(frame_seconds)
+        for _ in range(steps):
+            self.snapshot_positions(bodies)
+            if tick is None:
+                self.step()
+                self.handle_object_collisions(self.registered_objects(), self.tick_count)
+            else:
+                tick()
+            self.tick_count += 1
+        return steps
+
+    def registered_objects(self) -> List[BaseGameObject]:
+        """Live objects bound to this system's store."""
+        objects = self.bodies.objects
+        return [objects[row] for row in self.bodies.active_rows().tolist()]
+
+    def snapshot_positions(self, bodies: Iterable[List[Any]] = ()):
+        """Remember current positions as the start of the next tick."""
+        b = self.bodies
+        np.copyto(b.prev_x, b.x)
+        np.copyto(b.prev_y, b.y)
+        for group in bodies:
+            for obj in group:
+                if isinstance(obj, dict):
+                    obj["prev_x"] = obj["x"]
+                    obj["prev_y"] = obj["y"]
+
+    def render_position(self, obj) -> Tuple[float, float]:
+        """
+        Position to draw a body at, blended between the last two ticks.
+
+        Bodies that have not been through a tick yet are drawn where they are.
+        """
+        alpha = self.timestep.alpha
+        if isinstance(obj, dict):
+            x, y = obj["x"], obj["y"]
+            prev_x, prev_y = obj.get("prev_x", x), obj.get("prev_y", y)
+        elif obj.store is self.bodies:
+            row = obj.row
+            x, y = self.bodies.x[row].item(), self.bodies.y[row].item()
+            prev_x, prev_y = self.bodies.prev_x[row].item(), self.bodies.prev_y[row].item()
+        else:
+            return obj.x, obj.y
+        return prev_x + (x - prev_x) * alpha, prev_y + (y - prev_y) * alpha
+
+    def render_positions(self, objects: List[Any]) -> List[Tuple[float, float]]:
+        """
+        render_position for a whole draw list, read straight from the store.
+
+        Bound bodies are interpolated in one vectorized pass instead of four
+        descriptor reads apiece; any other object falls back to render_position.
+        """
+        rows = self._store_rows(objects)
+        b = self.bodies
+        alpha = self.timestep.alpha
+        prev_x = b.prev_x[rows]
+        prev_y = b.prev_y[rows]
+        x = prev_x + (b.x[rows] - prev_x) * alpha
+        y = prev_y + (b.y[rows] - prev_y) * alpha
+        positions = list(zip(x.tolist(), y.tolist()))
+        for i in np.flatnonzero(rows < 0).tolist():
+            positions[i] = self.render_position(objects[i])
+        return positions
+
+    def positions(self, objects: List[Any]) -> List[Tuple[float, float]]:
+        """Current (x, y) of many bodies, read straight from the store columns."""
+        rows = self._store_rows(objects)
+        positions = list(zip(self.bodies.x[rows].tolist(), self.bodies.y[rows].tolist()))
+        for i in np.flatnonzero(rows < 0).tolist():
+            obj = objects[i]
+            positions[i] = (obj["x"], obj["y"]) if isinstance(obj, dict) else (obj.x, obj.y)
+        return positions
+
+    def set_layer_collision(self, layer_a: str, layer_b: str, enabled: bool = True):
+        """
+        Enable or disable collisions between two layers.
+
+        Every layer collides with every layer (itself included) by default.
+        """
+        pair = frozenset((layer_a, layer_b))
+        if enabled:
+            self.disabled_layer_pairs.discard(pair)
+        else:
+            self.disabled_layer_pairs.add(pair)
+
+    def layers_collide(self, layer_a: str, layer_b: str) -> bool:
+        """Check whether two layers are allowed to collide."""
+        return frozenset((layer_a, layer_b)) not in self.disabled_layer_pairs
 
     def handle_object_collisions(self, objects: List[BaseGameObject], frame_count: int):
-        """Handle collisions between all objects using optimized algorithm."""
-        if len(objects) < 2 or frame_count % self.collision_frequency != 0:
+        """Handle collisions between all objects on a single layer."""
+        self.handle_layered_collisions({DEFAULT_LAYER: objects}, frame_count)
+
+    def handle_layered_collisions(self, layers: Dict[str, List[Any]], frame_count: int):
+        """
+        Run the collision pipeline over bodies grouped into named layers.
+
+        Bodies may be BaseGameObject instances or level dicts with "x", "y",
+        "dx", "dy" and optional "mass" keys. Their collision radius is taken
+        from "radius", "size" / 1.8 or half the "surface" width, in that order;
+        game objects collide at size * collision_scale.
+
+        Args:
+            layers: Mapping of layer name to the bodies on that layer
+            frame_count: Current frame, used with collision_frequency
+        """
+        if frame_count % self.collision_frequency != 0:
             return
 
-        # Use spatial partitioning for better performance
-        grid = self._create_collision_grid(objects)
-        checked_pairs = set()
+        objects = []
+        layer_ids = []
+        for layer_id, group in enumerate(layers.values()):
+            for obj in group:
+                if _body_alive(obj):
+                    objects.append(obj)
+                    layer_ids.append(layer_id)
 
-        for y in range(len(grid)):
-            for x in range(len(grid[0])):
-                cell_objects = grid[y][x]
-                if len(cell_objects) < 2:
-                    continue
+        if len(objects) < 2:
+            self._record_collision_stats(len(objects), 0, 0)
+            return
+
+        rows, (x, y, dx, dy, mass, radius) = self._gather_state(objects)
+        sleeping, still_ticks, settled = self._gather_sleep_state(objects, rows)
+        was_sleeping = sleeping.copy()
+
+        sweep = self._sweep_bounds(x, y, dx, dy, radius)
+        if sweep is None:
+            first, second = self.broad_phase.find_pairs(x, y, radius, rows)
+        else:
+            fast, sweep_x, sweep_y, bound_x, bound_y, bound_r = sweep
+            first, second = self.broad_phase.find_pairs(bound_x, bound_y, bound_r, rows)
+        if self.disabled_layer_pairs:
+            allowed = self._layer_matrix(list(layers))
+            layer_ids = np.array(layer_ids, dtype=np.intp)
+            keep = allowed[layer_ids[first], layer_ids[second]]
+            first, second = first[keep], second[keep]
 
-                # Check collisions within cell and with adjacent cells
-                for i, obj1_idx in enumerate(cell_objects):
-                    for j in range(i + 1, len(cell_objects)):
-                        obj2_idx = cell_objects[j]
-                        pair = (min(obj1_idx, obj2_idx), max(obj1_idx, obj2_idx))
-                        if pair in checked_pairs:
-                            continue
-                        checked_pairs.add(pair)
+        # Two sleeping bodies cannot start moving on their own
+        skipped = 0
+        if sleeping.any():
+            awake_pair = ~(sleeping[first] & sleeping[second])
+            skipped = len(first) - int(np.count_nonzero(awake_pair))
+            first, second = first[awake_pair], second[awake_pair]
 
-                        obj1 = objects[obj1_idx]
-                        obj2 = objects[obj2_idx]
+        candidates = len(first)
+        contacts = self._narrow_phase(first, second, x, y, radius)
+        swept = 0
+        if sweep is not None:
+            # Fast pairs that end the pass apart may have passed through each other
+            misses = np.flatnonzero(~contacts & (fast[first] | fast[second]))
+            hits = self._swept_contacts(
+                first[misses], second[misses], x, y, sweep_x, sweep_y, radius
+            )
+            contacts[misses[hits]] = True
+            swept = int(np.count_nonzero(hits))
+        first, second = first[contacts], second[contacts]
+        if sleeping.any() and len(first):
+            self._wake_on_contact(first, second, dx, dy, sleeping, still_ticks)
+        bounced = self._resolve_contacts(first, second, x, y, dx, dy, mass, radius)
+        if self.sleep_enabled:
+            self._update_sleep(dx, dy, sleeping, still_ticks, settled)
+        self._record_collision_stats(len(objects), candidates, len(first))
+        self.collision_stats["skipped_sleeping_pairs"] = skipped
+        self.collision_stats["sleeping"] = int(np.count_nonzero(sleeping))
+        self.collision_stats["fast_bodies"] = 0 if sweep is None else int(np.count_nonzero(fast))
+        self.collision_stats["swept_contacts"] = swept
 
-                        if self._check_collision(obj1, obj2):
-                            self._resolve_collision(obj1, obj2)
+        if rows is not None:
+            self._scatter_rows(rows, x, y, dx, dy)
+            self.bodies.sleeping[rows] = sleeping
+            self.bodies.still_ticks[rows] = still_ticks
+        else:
+            # Bodies that slept through the pass are left untouched
+            changed = ~(was_sleeping & sleeping)
+            touched = np.flatnonzero(sleeping & ~was_sleeping)
+            if len(first):
+                touched = np.unique(np.concatenate((first, second, touched)))
+            self._scatter_objects(objects, touched, x, y, dx, dy)
+            self._scatter_sleep_state(objects, np.flatnonzero(changed), sleeping, still_ticks)
 
-    def _create_collision_grid(self, objects: List[BaseGameObject]) -> List[List[List[int]]]:
-        """Create spatial grid for optimized collision detection."""
-        grid_size = 120
-        grid_cols = (self.width // grid_size) + 1
-        grid_rows = (self.height // grid_size) + 1
+        if self.contact_callback is not None:
+            for i, j in bounced:
+                self.contact_callback(objects[i], objects[j])
 
-        grid = [[[] for _ in range(grid_cols)] for _ in range(grid_rows)]
+    def _gather_sleep_state(self, objects: List[Any], rows):
+        """Read sleeping flags, still-tick counters and settled flags."""
+        if rows is not None:
+            b = self.bodies
+            return b.sleeping[rows], b.still_ticks[rows], b.can_bounce[rows]
 
+        count = len(objects)
+        sleeping = np.zeros(count, dtype=np.bool_)
+        still_ticks = np.zeros(count, dtype=np.int32)
+        settled = np.zeros(count, dtype=np.bool_)
         for i, obj in enumerate(objects):
-            if obj.alive:
-                grid_x = min(int(obj.x // grid_size), grid_cols - 1)
-                grid_y = min(int(obj.y // grid_size), grid_rows - 1)
-                grid[grid_y][grid_x].append(i)
+            # Unregistered game objects have nowhere to keep sleep state
+            if isinstance(obj, dict):
+                sleeping[i] = obj.get("sleeping", False)
+                still_ticks[i] = obj.get("still_ticks", 0)
+                settled[i] = obj.get("can_bounce", True)
+        return sleeping, still_ticks, settled
 
-        return grid
+    def _wake_on_contact(self, first, second, dx, dy, sleeping, still_ticks):
+        """Wake sleeping bodies hit by a moving one."""
+        moving = dx * dx + dy * dy > self.sleep_speed * self.sleep_speed
+        woken = np.concatenate(
+            (first[sleeping[first] & moving[second]], second[sleeping[second] & moving[first]])
+        )
+        sleeping[woken] = False
+        still_ticks[woken] = 0
 
-    def _check_collision(self, obj1: BaseGameObject, obj2: BaseGameObject) -> bool:
-        """Check if two objects are colliding."""
-        if not (obj1.alive and obj2.alive):
-            return False
+    def _update_sleep(self, dx, dy, sleeping, still_ticks, settled):
+        """
+        Advance still-tick counters and put resting bodies to sleep.
 
-        dx = obj2.x - obj1.x
-        dy = obj2.y - obj1.y
-        distance_sq = dx * dx + dy * dy
+        A sleeping body whose velocity was raised from outside (an explosion
+        push, a click) is woken here as well.
+        """
+        slow = settled & (dx * dx + dy * dy <= self.sleep_speed * self.sleep_speed)
+        counting = slow & ~sleeping
+        still_ticks[:] = np.where(slow, still_ticks + counting * self.collision_frequency, 0)
+        sleeping[:] = slow & (sleeping | (still_ticks >= self.sleep_ticks))
+        dx[sleeping] = 0.0
+        dy[sleeping] = 0.0
 
-        # Calculate collision radius based on object size
-        radius1 = obj1.size / 1.8
-        radius2 = obj2.size / 1.8
-        min_distance_sq = (radius1 + radius2) ** 2
+    def _scatter_sleep_state(self, objects, indices, sleeping, still_ticks):
+        """Write sleep state back to level dicts."""
+        for i in indices.tolist():
+            obj = objects[i]
+            if isinstance(obj, dict):
+                obj["sleeping"] = bool(sleeping[i])
+                obj["still_ticks"] = int(still_ticks[i])
 
-        return distance_sq < min_distance_sq and distance_sq > 0
+    def wake(self, obj):
+        """Wake a sleeping body so it is integrated and collided again."""
+        if isinstance(obj, dict):
+            obj["sleeping"] = False
+            obj["still_ticks"] = 0
+        elif obj.store is self.bodies:
+            self.bodies.sleeping[obj.row] = False
+            self.bodies.still_ticks[obj.row] = 0
 
-    def _resolve_collision(self, obj1: BaseGameObject, obj2: BaseGameObject):
-        """Resolve collision between two objects."""
-        dx = obj2.x - obj1.x
-        dy = obj2.y - obj1.y
-        distance = math.sqrt(dx * dx + dy * dy)
+    def is_sleeping(self, obj) -> bool:
+        """Check whether a body is currently asleep."""
+        if isinstance(obj, dict):
+            return obj.get("sleeping", False)
+        if obj.store is self.bodies:
+            return bool(self.bodies.sleeping[obj.row])
+        return False
 
-        if distance == 0:
-            return
+    def wake_bodies(self, x: float, y: float, radius: float, bodies: List[Any]):
+        """Wake every body within radius of a point, e.g. around a click."""
+        radius_sq = radius * radius
+        for obj in bodies:
+            if not self.is_sleeping(obj):
+                continue
+            if isinstance(obj, dict):
+                ox, oy = obj["x"], obj["y"]
+            else:
+                ox, oy = obj.x, obj.y
+            if (ox - x) ** 2 + (oy - y) ** 2 <= radius_sq:
+                self.wake(obj)
 
-        # Normalize collision vector
-        nx = dx / distance
-        ny = dy / distance
+    def _layer_matrix(self, names: List[str]) -> np.ndarray:
+        """Build the layer-vs-layer collision matrix for one pipeline pass."""
+        allowed = np.ones((len(names), len(names)), dtype=bool)
+        for a, name_a in enumerate(names):
+            for b, name_b in enumerate(names):
+                allowed[a, b] = self.layers_collide(name_a, name_b)
+        return allowed
 
-        # Resolve interpenetration
-        overlap = (obj1.size + obj2.size) / 1.8 - distance
-        total_mass = obj1.mass + obj2.mass
-        push_factor = overlap / total_mass
+    def _store_rows(self, objects: List[Any]) -> np.ndarray:
+        """Store row of each object, or -1 for dicts and bodies not in this system."""
+        b = self.bodies
+        return np.fromiter(
+            (obj.row if getattr(obj, "store", None) is b else -1 for obj in objects),
+            dtype=np.intp,
+            count=len(objects),
+        )
 
-        obj1.x -= nx * push_factor * obj2.mass
-        obj1.y -= ny * push_factor * obj2.mass
-        obj2.x += nx * push_factor * obj1.mass
-        obj2.y += ny * push_factor * obj1.mass
+    def _gather_state(self, objects: List[Any]):
+        """Copy body state into contiguous arrays for the pipeline."""
+        b = self.bodies
+        rows = self._store_rows(objects)
+        if not (rows < 0).any():
+            return rows, (
+                b.x[rows],
+                b.y[rows],
+                b.dx[rows],
+                b.dy[rows],
+                b.mass[rows],
+                b.size[rows] * b.collision_scale[rows],
+            )
 
-        # Calculate collision response
-        dvx = obj1.dx - obj2.dx
-        dvy = obj1.dy - obj2.dy
-        dot_product = dvx * nx + dvy * ny
+        # Unregistered objects and level dicts: pack their fields instead
+        state = np.array([_body_state(obj) for obj in objects], dtype=np.float64)
+        return None, tuple(state.T.copy())
 
-        if dot_product < 0:  # Objects moving toward each other
-            impulse = (2 * dot_product) / total_mass
-            bounce_factor = 0.85
+    def _scatter_rows(self, rows, x, y, dx, dy):
+        """Write pipeline results back to the store."""
+        b = self.bodies
+        b.x[rows] = x
+        b.y[rows] = y
+        b.dx[rows] = dx
+        b.dy[rows] = dy
 
-            obj1.dx -= impulse * obj2.mass * nx * bounce_factor
-            obj1.dy -= impulse * obj2.mass * ny * bounce_factor
-            obj2.dx += impulse * obj1.mass * nx * bounce_factor
-            obj2.dy += impulse * obj1.mass * ny * bounce_factor
+    def _scatter_objects(self, objects, indices, x, y, dx, dy):
+        """Write pipeline results back to the bodies that were in contact."""
+        for i in indices.tolist():
+            obj = objects[i]
+            if isinstance(obj, dict):
+                obj["x"], obj["y"] = float(x[i]), float(y[i])
+                obj["dx"], obj["dy"] = float(dx[i]), float(dy[i])
+            else:
+                obj.x, obj.y = float(x[i]), float(y[i])
+                obj.dx, obj.dy = float(dx[i]), float(dy[i])
 
-    def apply_explosion_force(self, x: float, y: float, force_radius: float,
-                            objects: List[BaseGameObject], force_strength: float = 15):
-        """Apply explosion force to nearby objects."""
-        for obj in objects:
-            if not obj.alive:
+    def _narrow_phase(self, first: np.ndarray, second: np.ndarray, x, y, radius) -> np.ndarray:
+        """Vectorized circle overlap test for candidate pairs."""
+        ddx = x[second] - x[first]
+        ddy = y[second] - y[first]
+        distance_sq = ddx * ddx + ddy * ddy
+        reach = radius[first] + radius[second]
+        return (distance_sq < reach * reach) & (distance_sq > 0)
+
+    def _sweep_bounds(self, x, y, dx, dy, radius):
+        """
+        Find bodies that need a swept test and their broad-phase bounds.
+
+        A body's sweep is its displacement since the previous collision pass,
+        taken as velocity times collision_frequency. Fast bodies are indexed by
+        a circle enclosing their whole sweep so tunnelled pairs are still found.
+
+        Returns:
+            None when no body is fast, else (fast, sweep_x, sweep_y,
+            bound_x, bound_y, bound_radius)
+        """
+        if not self.ccd_enabled:
+            return None
+        sweep_x = dx * self.collision_frequency
+        sweep_y = dy * self.collision_frequency
+        travel = np.hypot(sweep_x, sweep_y)
+        fast = travel > self.ccd_fraction * radius
+        if not fast.any():
+            return None
+
+        bound_x = np.where(fast, x - sweep_x * 0.5, x)
+        bound_y = np.where(fast, y - sweep_y * 0.5, y)
+        bound_r = np.where(fast, radius + travel * 0.5, radius)
+        return fast, sweep_x, sweep_y, bound_x, bound_y, bound_r
+
+    def _swept_contacts(self, first, second, x, y, sweep_x, sweep_y, radius) -> np.ndarray:
+        """
+        Swept-circle time-of-impact test for pairs that end the pass apart.
+
+        Solves |d + v*t| = r_i + r_j for the earliest t in [0, 1], where d is
+        the separation at the start of the sweep and v the relative sweep.
+        Bodies that hit are rewound to their earliest impact, just inside
+        contact, so the regular resolver pushes them apart and bounces them.
+
+        Returns:
+            Boolean mask of pairs that collided during the sweep
+        """
+        if len(first) == 0:
+            return np.zeros(0, dtype=bool)
+
+        start_x = x - sweep_x
+        start_y = y - sweep_y
+        ddx = start_x[second] - start_x[first]
+        ddy = start_y[second] - start_y[first]
+        vx = sweep_x[second] - sweep_x[first]
+        vy = sweep_y[second] - sweep_y[first]
+        # Aim slightly inside contact so the rewound pair registers as overlapping
+        reach = (radius[first] + radius[second]) * 0.999
+
+        a = vx * vx + vy * vy
+        b = 2 * (ddx * vx + ddy * vy)
+        c = ddx * ddx + ddy * ddy - reach * reach
+        discriminant = b * b - 4 * a * c
+        hits = (a > 0) & (c > 0) & (b < 0) & (discriminant >= 0)
+        toi = np.ones(len(first))
+        toi[hits] = (-b[hits] - np.sqrt(discriminant[hits])) / (2 * a[hits])
+        hits &= toi <= 1.0
+        if not hits.any():
+            return hits
+
+        # Rewind each body to the earliest impact it takes part in
+        body_toi = np.ones(len(x))
+        np.minimum.at(body_toi, first[hits], toi[hits])
+        np.minimum.at(body_toi, second[hits], toi[hits])
+        rewind = 1.0 - body_toi
+        x -= sweep_x * rewind
+        y -= sweep_y * rewind
+        return hits
+
+    def _resolve_contacts(self, first, second, x, y, dx, dy, mass, radius):
+        """
+        Sequential impulse resolution for overlapping pairs.
+
+        Pairs are solved one after another on plain Python floats, so later
+        pairs see positions already pushed apart by earlier ones.
+
+        Returns:
+            List of (i, j) pairs that received a bounce impulse
+        """
+        bounced = []
+        if len(first) == 0:
+            return bounced
+
+        bounce_factor = self.restitution
+
+        px, py, vx, vy = x.tolist(), y.tolist(), dx.tolist(), dy.tolist()
+        m, r = mass.tolist(), radius.tolist()
+
+        for i, j in zip(first.tolist(), second.tolist()):
+            ddx = px[j] - px[i]
+            ddy = py[j] - py[i]
+            distance = math.sqrt(ddx * ddx + ddy * ddy)
+            min_distance = r[i] + r[j]
+            if distance == 0 or distance >= min_distance:
                 continue
 
-            dx = obj.x - x
-            dy = obj.y - y
-            distance_sq = dx * dx + dy * dy
+            # Normalize collision vector
+            nx = ddx / distance
+            ny = ddy / distance
+
+            # Resolve interpenetration, pushing each body by the other's mass share
+            total_mass = m[i] + m[j]
+            push_factor = (min_distance - distance) / total_mass
+            px[i] -= nx * push_factor * m[j]
+            py[i] -= ny * push_factor * m[j]
+            px[j] += nx * push_factor * m[i]
+            py[j] += ny * push_factor * m[i]
+
+            # Only bounce bodies that are moving toward each other
+            dot_product = (vx[i] - vx[j]) * nx + (vy[i] - vy[j]) * ny
+            if dot_product > 0:
+                impulse = (2 * dot_product) / total_mass * bounce_factor
+                vx[i] -= impulse * m[j] * nx
+                vy[i] -= impulse * m[j] * ny
+                vx[j] += impulse * m[i] * nx
+                vy[j] += impulse * m[i] * ny
+                bounced.append((i, j))
+
+        x[:] = px
+        y[:] = py
+        dx[:] = vx
+        dy[:] = vy
+        return bounced
+
+    def _record_collision_stats(self, bodies: int, candidate_pairs: int, contacts: int):
+        """Update broad-phase efficiency metrics for the last collision pass."""
+        stats = self.collision_stats
+        stats["bodies"] = bodies
+        stats["candidate_pairs"] = candidate_pairs
+        stats["contacts"] = contacts
+        stats["brute_force_pairs"] = bodies * (bodies - 1) // 2
+        stats["passes"] += 1
+        stats["total_candidate_pairs"] += candidate_pairs
+        stats["total_contacts"] += contacts
+
+    def get_collision_stats(self) -> Dict[str, Any]:
+        """Get broad-phase metrics, including the fraction of pairs tested."""
+        stats = dict(self.collision_stats)
+        brute_force = stats["brute_force_pairs"]
+        stats["pair_ratio"] = stats["candidate_pairs"] / brute_force if brute_force else 0.0
+        stats["cell_size"] = self.broad_phase.cell_size
+        stats["strategy"] = self.collision_strategy
+        return stats
+
+    def queue_explosion(
+        self,
+        x: float,
+        y: float,
+        force_radius: float,
+        force_strength: float = 15,
+        layer: Optional[str] = None,
+    ):
+        """
+        Queue an explosion push for the next apply_queued_explosions() pass.
+
+        Args:
+            layer: Only push bodies on this layer; None pushes every layer
+        """
+        self.pending_explosions.append((x, y, force_radius, force_strength, layer))
+
+    def apply_queued_explosions(self, layers: Dict[str, List[Any]]) -> int:
+        """
+        Apply every queued explosion to the given bodies in one batched pass.
+
+        Bodies are indexed once by the broad phase and each explosion only
+        visits the bodies the index returns for its radius.
 
-            if distance_sq < force_radius * force_radius and distance_sq > 0:
-                distance = math.sqrt(distance_sq)
-                # Force is stronger closer to center
-                force = (1 - (distance / force_radius)) * force_strength
+        Returns:
+            Number of bodies pushed
+        """
+        explosions = self.pending_explosions
+        if not explosions:
+            return 0
+        self.pending_explosions = []
 
-                # Apply force to velocity
-                if distance > 0:
-                    obj.dx += (dx / distance) * force
-                    obj.dy += (dy / distance) * force
+        objects = []
+        layer_names = []
+        for name, group in layers.items():
+            for obj in group:
+                if _body_alive(obj):
+                    objects.append(obj)
+                    layer_names.append(name)
+        if not objects:
+            return 0
 
-                # Enable bouncing after explosion
+        rows, (x, y, dx, dy, _mass, radius) = self._gather_state(objects)
+        self.broad_phase.build(x, y, radius)
+
+        # Candidate (explosion, body) pairs from radius queries
+        body_parts = []
+        explosion_parts = []
+        for index, (ex, ey, er, _strength, layer) in enumerate(explosions):
+            candidates = self.broad_phase.query(ex, ey, er)
+            if layer is not None:
+                candidates = [i for i in candidates.tolist() if layer_names[i] == layer]
+            body_parts.append(np.asarray(candidates, dtype=np.intp))
+            explosion_parts.append(np.full(len(candidates), index, dtype=np.intp))
+        bodies = np.concatenate(body_parts)
+        owners = np.concatenate(explosion_parts)
+
+        centre_x, centre_y, reach, strength = (
+            np.array([e[i] for e in explosions], dtype=np.float64) for i in range(4)
+        )
+        offset_x = x[bodies] - centre_x[owners]
+        offset_y = y[bodies] - centre_y[owners]
+        distance_sq = offset_x * offset_x + offset_y * offset_y
+        hit = (distance_sq < reach[owners] ** 2) & (distance_sq > 0)
+        self.collision_stats["explosion_candidates"] = len(bodies)
+
+        bodies, owners = bodies[hit], owners[hit]
+        distance = np.sqrt(distance_sq[hit])
+        # Force is stronger closer to center
+        force = (1 - distance / reach[owners]) * strength[owners]
+        np.add.at(dx, bodies, offset_x[hit] / distance * force)
+        np.add.at(dy, bodies, offset_y[hit] / distance * force)
+
+        pushed = np.unique(bodies)
+        self.collision_stats["explosion_hits"] = len(pushed)
+        if rows is not None:
+            pushed_rows = rows[pushed]
+            b = self.bodies
+            b.dx[pushed_rows] = dx[pushed]
+            b.dy[pushed_rows] = dy[pushed]
+            # Enable bouncing after explosion
+            b.can_bounce[pushed_rows] = True
+            b.sleeping[pushed_rows] = False
+            b.still_ticks[pushed_rows] = 0
+            return len(pushed)
+
+        for i in pushed.tolist():
+            obj = objects[i]
+            if isinstance(obj, dict):
+                obj["dx"], obj["dy"] = float(dx[i]), float(dy[i])
+                obj["can_bounce"] = True
+            else:
+                obj.dx, obj.dy = float(dx[i]), float(dy[i])
                 obj.can_bounce = True
+            self.wake(obj)
+        return len(pushed)
+
+    def apply_explosion_force(self, x: float, y: float, force_radius: float,
+                            objects: List[Any], force_strength: float = 15):
+        """Apply explosion force to nearby objects immediately."""
+        self.queue_explosion(x, y, force_radius, force_strength)
+        self.apply_queued_explosions({DEFAULT_LAYER: objects})
 
 
 class UnifiedObjectFactory:
@@ -157,6 +1171,22 @@ class UnifiedObjectFactory:
     def __init__(self, resource_manager=None):
         self.resource_manager = resource_manager
 
+    def spawn_next(self, kind: str, queue: List[str], tick: int, physics: "UnifiedPhysicsSystem",
+                   width: int, interval: int = LETTER_SPAWN_INTERVAL) -> Optional[BaseGameObject]:
+        """
+        Spawn step shared by the falling-object levels and the headless simulator.
+
+        Every interval ticks the front of queue is built by create_<kind>_object
+        at a random x just above the screen and bound to physics. Needs no display.
+
+        Returns:
+            The spawned body, or None when nothing was due this tick
+        """
+        if not queue or tick % interval:
+            return None
+        create = getattr(self, f"create_{kind}_object")
+        return physics.add_object(create(queue.pop(0), random.randint(50, width - 50), -50))
+
     def create_letter_object(self, value: str, x: float, y: float) -> BaseGameObject:
         """Create a letter game object."""
         obj = BaseGameObject(x, y, value, "letter")
@@ -166,6 +1196,15 @@ class UnifiedObjectFactory:
         obj.dy = random.choice([10, 5.5]) * 1.5 * 1.2
         return obj
 
+    def create_case_letter_object(self, value: str, x: float, y: float) -> BaseGameObject:
+        """Create a C/L case letter, lighter and slower to fall than alphabet letters."""
+        obj = BaseGameObject(x, y, value, "letter")
+        obj.size = 240
+        obj.dx = random.choice([-1, -0.5, 0.5, 1]) * 1.5
+        obj.dy = random.choice([5, 10.5]) * 1.5 * 1.2
+        obj.mass = random.uniform(40, 60)
+        return obj
+
     def create_number_object(self, value: str, x: float, y: float) -> BaseGameObject:
         """Create a number game object."""
         obj = BaseGameObject(x, y, value, "number")
@@ -175,29 +1214,34 @@ class UnifiedObjectFactory:
         obj.dy = random.choice([6, 11.5]) * 1.5 * 3.2
         return obj
 
+    def create_shape_object(self, value: str, x: float, y: float) -> BaseGameObject:
+        """Create a shape game object."""
+        obj = BaseGameObject(x, y, value, "shape")
+        obj.size = 240
+        obj.mass = random.uniform(40, 60)
+        obj.dx = random.choice([-1, -0.5, 0.5, 1]) * 1.5
+        obj.dy = random.choice([1, 1.5]) * 1.5 * 4.2
+        return obj
+
     def create_emoji_object(self, value: str, letter: str, emoji_index: int,
                           x: float, y: float, surface) -> BaseGameObject:
         """Create an emoji game object."""
-        obj = BaseGameObject(x, y, f"{letter}_emoji_{emoji_index}", "emoji")
+        obj = EmojiObject(x, y, f"{letter}_emoji_{emoji_index}", letter, surface)
         obj.size = 96
         obj.mass = random.uniform(100, 120)
         obj.dx = random.choice([-1, -0.5, 0.5, 1]) * 1.2
         obj.dy = random.choice([8, 6]) * 1.2
-        obj.surface = surface
-        obj.letter = letter
         obj.emoji_index = emoji_index
         return obj
 
     def create_color_dot(self, x: float, y: float, color: Tuple[int, int, int],
                         is_target: bool = False) -> BaseGameObject:
         """Create a color dot game object."""
-        obj = BaseGameObject(x, y, f"dot_{color}", "color_dot")
+        obj = ColorDot(x, y, f"dot_{color}", color, is_target)
         obj.size = 48
         obj.mass = random.uniform(30, 50)
         obj.dx = random.uniform(-6, 6)
         obj.dy = random.uniform(-6, 6)
-        obj.color = color
-        obj.target = is_target
         return obj
 
 
@@ -9,13 +9,17 @@ and modularity.
 Index of Classes:
 - MultiTouchManager: Handles multi-touch input and event processing. (Lines 9-128)
 - GlassShatterManager: Manages visual glass shatter effects and screen refresh. (Lines 130-466)
+- StarFieldManager: Draws the scrolling star background from a pre-rendered tile.
+- TextSurfaceCache: LRU cache of rendered text surfaces shared by the HUD and checkpoint screen.
 - HUDManager: Displays Heads-Up Display elements (score, ability, etc.). (Lines 468-665)
 - CheckpointManager: Manages checkpoint screens and game state restoration. (Lines 667-874)
 - FlamethrowerManager: Handles flamethrower visual effects. (Lines 876-998)
 - CenterPieceManager: Manages the central target display and associated effects. (Lines 1000-1316)
+- DirtyRectManager: Tracks drawn regions for partial display updates.
 
 Dependencies:
 - pygame: For graphics, event handling, and game loop.
+- numpy: For measuring the screen area covered by dirty rects.
 - random: For generating random numbers used in effects and game logic.
 - math: For mathematical calculations (e.g., angles, distances).
 - settings: For game-specific constants (colors, durations, etc.).
@@ -23,10 +27,27 @@ Dependencies:
 
 import math
 import random
+from collections import OrderedDict
 
+import numpy as np
 import pygame
 
 from settings import BLACK, FLAME_COLORS, WHITE
+from utils.flame_renderer import FlameRenderer
+from utils.texture_atlas import get_sprite_batcher
+
+DEFAULT_FLAME_WIDTHS = [20, 30, 40]
+
+# Transparent colorkey for cached background layers (never a crack or star color)
+LAYER_COLORKEY = (255, 0, 255)
+
+
+def _union_rects(rects):
+    """Bounding rect of everything drawn, or None if nothing was."""
+    rects = [rect for rect in rects if rect is not None]
+    if not rects:
+        return None
+    return rects[0].unionall(rects[1:])
 
 
 class MultiTouchManager:
@@ -179,6 +200,11 @@ class GlassShatterManager:
         # Glass crack state
         self.glass_cracks = []
 
+        # Cracks rasterized once into a cached layer, rebuilt only when they change
+        self._crack_layer = None
+        self._crack_layer_pos = (0, 0)
+        self._crack_layer_dirty = True
+
         # Background colors
         self.current_background = WHITE
         self.opposite_background = BLACK
@@ -195,6 +221,7 @@ class GlassShatterManager:
     def reset(self):
         """Reset all glass shatter state for a new level/game."""
         self.glass_cracks = []
+        self._crack_layer_dirty = True
         self.refresh_timer = self.refresh_interval
         self._processing_shatter = False
         self._last_crack_time = 0
@@ -297,6 +324,7 @@ class GlassShatterManager:
                 "color": draw_crack_color,
             }
         )
+        self._crack_layer_dirty = True
 
     def _trigger_shatter(self):
         """
@@ -332,6 +360,7 @@ class GlassShatterManager:
         if self.refresh_timer <= 0:
             # Clear all cracks and reset timer
             self.glass_cracks = []
+            self._crack_layer_dirty = True
             self.refresh_timer = self.refresh_interval
 
             # Create refresh particle effect if particle manager is available
@@ -369,10 +398,53 @@ class GlassShatterManager:
 
         Args:
             surface: Pygame surface to draw on
+
+        Returns:
+            pygame.Rect: Area covered by the crack layer, or None without cracks
         """
+        if self._crack_layer_dirty:
+            self._build_crack_layer()
+        if self._crack_layer is None:
+            return None
+        return surface.blit(self._crack_layer, self._crack_layer_pos)
+
+    def _build_crack_layer(self):
+        """Rasterize every crack into a transparent layer cropped to their bounds."""
+        self._crack_layer_dirty = False
+        if not self.glass_cracks:
+            self._crack_layer = None
+            return
+
+        points = [
+            point
+            for crack in self.glass_cracks
+            for line in [crack["points"], *crack["branches"]]
+            for point in line
+        ]
+        pad = 4  # Covers the widest line
+        left = int(min(x for x, _ in points)) - pad
+        top = int(min(y for _, y in points)) - pad
+        right = int(max(x for x, _ in points)) + pad
+        bottom = int(max(y for _, y in points)) + pad
+
+        layer = pygame.Surface((right - left, bottom - top))
+        layer.fill(LAYER_COLORKEY)
+        self._rasterize_cracks(layer, left, top)
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()  # Match the display format for faster blits
+        # RLE lets the blit skip the transparent runs between crack lines
+        layer.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+        self._crack_layer = layer
+        self._crack_layer_pos = (left, top)
+
+    def _rasterize_cracks(self, surface, origin_x=0, origin_y=0):
+        """Draw every crack polyline onto surface, shifted by the surface origin."""
         # Determine crack color based on current background
         draw_crack_color = WHITE if self.current_background == BLACK else BLACK
 
+        def shift(point):
+            return (point[0] - origin_x, point[1] - origin_y)
+
         # Draw all cracks
         for crack in self.glass_cracks:
             # Draw main segments
@@ -380,8 +452,8 @@ class GlassShatterManager:
                 pygame.draw.line(
                     surface,
                     draw_crack_color,
-                    crack["points"][i],
-                    crack["points"][i + 1],
+                    shift(crack["points"][i]),
+                    shift(crack["points"][i + 1]),
                     int(crack["width"]),
                 )
 
@@ -391,8 +463,8 @@ class GlassShatterManager:
                     pygame.draw.line(
                         surface,
                         draw_crack_color,
-                        branch[i],
-                        branch[i + 1],
+                        shift(branch[i]),
+                        shift(branch[i + 1]),
                         int(crack["width"] * 0.7),  # Branches are thinner
                     )
 
@@ -436,6 +508,164 @@ class GlassShatterManager:
         """
         self.current_background = current
         self.opposite_background = opposite
+        self._crack_layer_dirty = True  # Crack color follows the background
+
+
+class StarFieldManager:
+    """
+    Universal class to manage the scrolling star background.
+    Stars are rendered once into a screen-sized tile that scrolls down and
+    wraps, so drawing them costs two blits instead of a circle per star.
+    """
+
+    def __init__(self, width, height, count=100, speed=1, color=(200, 200, 200)):
+        """
+        Initialize the star field.
+
+        Args:
+            width (int): Screen width
+            height (int): Screen height
+            count (int): Number of stars
+            speed (int): Pixels scrolled per frame
+            color (tuple): RGB star color
+        """
+        self.width = width
+        self.height = height
+        self.count = count
+        self.speed = speed
+        self.color = color
+        self.reset()
+
+    def reset(self):
+        """Scatter a fresh set of stars for a new level."""
+        self.stars = [
+            (random.randint(0, self.width), random.randint(0, self.height), random.randint(2, 4))
+            for _ in range(self.count)
+        ]
+        self.scroll = 0
+        self._tile = None
+
+    def _build_tile(self):
+        """Render the stars into a transparent, vertically wrapping tile."""
+        tile = pygame.Surface((self.width, self.height))
+        tile.fill(LAYER_COLORKEY)
+        for x, y, radius in self.stars:
+            # Stars crossing the seam are drawn on both edges so the wrap is invisible
+            for wrap_y in (y - self.height, y, y + self.height):
+                if -radius <= wrap_y <= self.height + radius:
+                    pygame.draw.circle(tile, self.color, (x, wrap_y), radius)
+        if pygame.display.get_surface() is not None:
+            tile = tile.convert()  # Match the display format for faster blits
+        # RLE lets the blit skip the empty sky between stars
+        tile.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+        self._tile = tile
+
+    def draw(self, surface, offset_x=0, offset_y=0):
+        """
+        Scroll the stars one step and draw them.
+
+        Args:
+            surface: Pygame surface to draw on
+            offset_x (int): X offset for screen shake
+            offset_y (int): Y offset for screen shake
+
+        Returns:
+            list: Screen rect of each star, for dirty-rect updates
+        """
+        if self._tile is None:
+            self._build_tile()
+        self.scroll = (self.scroll + self.speed) % self.height
+        split = self.height - self.scroll
+
+        # Bottom of the tile wraps around to the top of the screen
+        surface.blit(self._tile, (offset_x, offset_y + self.scroll), (0, 0, self.width, split))
+        surface.blit(self._tile, (offset_x, offset_y), (0, split, self.width, self.scroll))
+        return self.star_rects(offset_x, offset_y)
+
+    def star_rects(self, offset_x=0, offset_y=0):
+        """Current screen rect of every star, including pieces wrapped across the seam."""
+        rects = []
+        for x, y, radius in self.stars:
+            left = x - radius + offset_x
+            top = (y + self.scroll) % self.height - radius + offset_y
+            size = radius * 2
+            rects.append(pygame.Rect(left, top, size, size))
+            if top + size > self.height + offset_y:
+                rects.append(pygame.Rect(left, top - self.height, size, size))
+            elif top < offset_y:
+                rects.append(pygame.Rect(left, top + self.height, size, size))
+        return rects
+
+
+class TextSurfaceCache:
+    """
+    Universal class to cache rendered text surfaces.
+    Surfaces are keyed on (font, text, color, antialias), so text is only
+    re-rendered when one of those inputs changes. Least recently used
+    entries are evicted past max_entries.
+    """
+
+    def __init__(self, max_entries=128):
+        """
+        Initialize the text surface cache.
+
+        Args:
+            max_entries (int): Most surfaces kept before evicting the oldest
+        """
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color):
+        """
+        Get a rendered text surface, with the same arguments as font.render.
+
+        Args:
+            font: Pygame font object
+            text (str): Text to render
+            antialias (bool): Whether to antialias the text
+            color: RGB color tuple
+
+        Returns:
+            pygame.Surface: Rendered text, shared between callers; do not modify
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drop every cached surface."""
+        self.surfaces.clear()
+
+    def get_stats(self):
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Text cache shared by the HUD and checkpoint screen
+text_cache = TextSurfaceCache()
 
 
 class HUDManager:
@@ -458,6 +688,7 @@ class HUDManager:
         self.height = height
         self.small_font = small_font
         self.glass_shatter_manager = glass_shatter_manager
+        self.text_cache = text_cache  # Text is re-rendered only when it changes
 
         # HUD positioning constants
         self.margin = 20
@@ -486,52 +717,64 @@ class HUDManager:
             total_letters (int): Total targets in level
             mode (str): Game mode ("colors", "alphabet", "numbers", "shapes", "clcase")
             **kwargs: Additional mode-specific parameters
+
+        Returns:
+            pygame.Rect: Bounding box of the drawn HUD
         """
         # Determine text color based on background
         text_color = BLACK if self.glass_shatter_manager.get_background_color() == WHITE else WHITE
 
         # Different layout for colors mode to prevent overlap
         if mode == "colors":
-            self._display_colors_hud(
+            return self._display_colors_hud(
                 screen, target_letter, overall_destroyed, total_letters, text_color, **kwargs
             )
-        else:
-            self._display_standard_hud(
-                screen, target_letter, overall_destroyed, total_letters, mode, text_color
-            )
+        return self._display_standard_hud(
+            screen, target_letter, overall_destroyed, total_letters, mode, text_color
+        )
 
     def _display_colors_hud(
         self, screen, target_letter, overall_destroyed, total_letters, text_color, **kwargs
     ):
         """Display HUD for colors mode with special layout (Score and Ability removed)."""
+        drawn = []
+
         # Target color at top left
-        target_color_text = self.small_font.render(
-            f"Target Color: {target_letter}", True, text_color
+        target_color_text = self.text_cache.render(
+            self.small_font, f"Target Color: {target_letter}", True, text_color
         )
-        screen.blit(target_color_text, (self.margin, self.margin))
+        drawn.append(screen.blit(target_color_text, (self.margin, self.margin)))
 
         # Target dots remaining below target color
         target_dots_left = kwargs.get("target_dots_left", 0)
         if target_dots_left is not None:
-            dots_left_text = self.small_font.render(
-                f"Remaining: {target_dots_left}", True, text_color
+            dots_left_text = self.text_cache.render(
+                self.small_font, f"Remaining: {target_dots_left}", True, text_color
+            )
+            drawn.append(
+                screen.blit(dots_left_text, (self.margin, self.margin + self.line_height))
             )
-            screen.blit(dots_left_text, (self.margin, self.margin + self.line_height))
 
         # Next color progress below remaining dots
         current_color_dots_destroyed = kwargs.get("current_color_dots_destroyed", 0)
         if current_color_dots_destroyed is not None:
-            next_color_text = self.small_font.render(
-                f"Next color in: {5 - current_color_dots_destroyed} dots", True, text_color
+            next_color_text = self.text_cache.render(
+                self.small_font,
+                f"Next color in: {5 - current_color_dots_destroyed} dots",
+                True,
+                text_color,
+            )
+            drawn.append(
+                screen.blit(next_color_text, (self.margin, self.margin + self.line_height * 2))
             )
-            screen.blit(next_color_text, (self.margin, self.margin + self.line_height * 2))
 
         # Progress on top right
-        progress_text = self.small_font.render(
-            f"Destroyed: {overall_destroyed}/{total_letters}", True, text_color
+        progress_text = self.text_cache.render(
+            self.small_font, f"Destroyed: {overall_destroyed}/{total_letters}", True, text_color
         )
         progress_rect = progress_text.get_rect(topright=(self.width - self.margin, self.margin))
-        screen.blit(progress_text, progress_rect)
+        drawn.append(screen.blit(progress_text, progress_rect))
+        return _union_rects(drawn)
 
     def _display_standard_hud(
         self, screen, target_letter, overall_destroyed, total_letters, mode, text_color
@@ -540,17 +783,19 @@ class HUDManager:
         # Right-aligned elements only
         display_target = self._format_target_display(target_letter, mode)
 
-        target_text = self.small_font.render(f"Target: {display_target}", True, text_color)
+        target_text = self.text_cache.render(
+            self.small_font, f"Target: {display_target}", True, text_color
+        )
         target_rect = target_text.get_rect(topright=(self.width - self.margin, self.margin))
-        screen.blit(target_text, target_rect)
+        target_drawn = screen.blit(target_text, target_rect)
 
-        progress_text = self.small_font.render(
-            f"Destroyed: {overall_destroyed}/{total_letters}", True, text_color
+        progress_text = self.text_cache.render(
+            self.small_font, f"Destroyed: {overall_destroyed}/{total_letters}", True, text_color
         )
         progress_rect = progress_text.get_rect(
             topright=(self.width - self.margin, self.margin + self.line_height)
         )
-        screen.blit(progress_text, progress_rect)
+        return target_drawn.union(screen.blit(progress_text, progress_rect))
 
     def _format_target_display(self, target_letter, mode):
         """Format the target letter for display based on mode."""
@@ -574,6 +819,9 @@ class HUDManager:
             collision_enabled (bool): Whether collisions are enabled
             collision_delay_counter (int): Current delay counter
             collision_delay_frames (int): Total delay frames
+
+        Returns:
+            pygame.Rect: Area drawn, or None when collisions are enabled
         """
         if not collision_enabled:
             text_color = (
@@ -582,8 +830,11 @@ class HUDManager:
             countdown_text = (
                 f"Collisions in: {(collision_delay_frames - collision_delay_counter) // 50}s"
             )
-            countdown_surface = self.small_font.render(countdown_text, True, text_color)
-            screen.blit(countdown_surface, (10, self.height - 30))
+            countdown_surface = self.text_cache.render(
+                self.small_font, countdown_text, True, text_color
+            )
+            return screen.blit(countdown_surface, (10, self.height - 30))
+        return None
 
     def display_sample_target(self, screen, target_color, target_radius=24):
         """
@@ -593,13 +844,18 @@ class HUDManager:
             screen: Pygame surface to draw on
             target_color: RGB color tuple for the target
             target_radius (int): Radius of the sample dot
+
+        Returns:
+            pygame.Rect: Area drawn
         """
         # Show sample target dot reference at top right
         sample_x = self.width - 60
         sample_y = 60
 
-        pygame.draw.circle(screen, target_color, (sample_x, sample_y), target_radius)
-        pygame.draw.rect(screen, WHITE, (sample_x - 30, sample_y - 30, 60, 60), 2)
+        dot_rect = pygame.draw.circle(screen, target_color, (sample_x, sample_y), target_radius)
+        return dot_rect.union(
+            pygame.draw.rect(screen, WHITE, (sample_x - 30, sample_y - 30, 60, 60), 2)
+        )
 
     def display_screen_refresh_timer(self, screen):
         """
@@ -607,6 +863,9 @@ class HUDManager:
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            pygame.Rect: Area drawn
         """
         text_color = BLACK if self.glass_shatter_manager.get_background_color() == WHITE else WHITE
         refresh_frames = self.glass_shatter_manager.get_refresh_time_remaining()
@@ -614,9 +873,11 @@ class HUDManager:
 
         # Display refresh timer at bottom center
         refresh_text = f"Screen refresh in: {refresh_seconds}s"
-        refresh_surface = self.small_font.render(refresh_text, True, text_color)
+        refresh_surface = self.text_cache.render(
+            self.small_font, refresh_text, True, text_color
+        )
         refresh_rect = refresh_surface.get_rect(center=(self.width // 2, self.height - 30))
-        screen.blit(refresh_surface, refresh_rect)
+        return screen.blit(refresh_surface, refresh_rect)
 
 
 class CheckpointManager:
@@ -639,6 +900,8 @@ class CheckpointManager:
         self.height = height
         self.fonts = fonts
         self.small_font = small_font
+        self.batcher = get_sprite_batcher()
+        self.text_cache = text_cache
 
         # Button configuration
         self.button_width = 300
@@ -655,6 +918,9 @@ class CheckpointManager:
             (self.center_x + 20, self.center_y + 50), (self.button_width, self.button_height)
         )
 
+        # Levels watch this to redraw fully after a checkpoint screen
+        self.screens_shown = 0
+
     def show_checkpoint_screen(self, screen, mode=None, **kwargs):
         """
         Display the checkpoint screen and handle user interaction.
@@ -667,6 +933,8 @@ class CheckpointManager:
         Returns:
             bool: True if Continue was selected, False if Menu was selected
         """
+        self.screens_shown += 1
+
         # Store original state for colors mode
         original_state = self._store_colors_state(mode, **kwargs)
 
@@ -679,6 +947,13 @@ class CheckpointManager:
         # Create swirling particles for visual effect
         swirling_particles = self._create_swirling_particles()
 
+        # The heading color changes every frame, so render it once in white and
+        # tint a reused copy instead of re-rendering the text
+        checkpoint_font = self.fonts[2]
+        heading_base = self.text_cache.render(checkpoint_font, "Checkpoint!", True, WHITE)
+        checkpoint_text = heading_base.copy()
+        checkpoint_rect = checkpoint_text.get_rect(center=(self.center_x, self.center_y - 150))
+
         while running:
             screen.fill(BLACK)
 
@@ -717,13 +992,15 @@ class CheckpointManager:
             heading_color = (r, g, b)
 
             # Draw heading
-            checkpoint_font = self.fonts[2]
-            checkpoint_text = checkpoint_font.render("Checkpoint!", True, heading_color)
-            checkpoint_rect = checkpoint_text.get_rect(center=(self.center_x, self.center_y - 150))
+            checkpoint_text.fill((0, 0, 0, 0))
+            checkpoint_text.blit(heading_base, (0, 0))
+            checkpoint_text.fill(heading_color, special_flags=pygame.BLEND_RGB_MULT)
             screen.blit(checkpoint_text, checkpoint_rect)
 
             # Additional message
-            subtext = self.small_font.render("Well done! You've completed this task!", True, WHITE)
+            subtext = self.text_cache.render(
+                self.small_font, "Well done! You've completed this task!", True, WHITE
+            )
             subtext_rect = subtext.get_rect(center=(self.center_x, self.center_y - 100))
             screen.blit(subtext, subtext_rect)
 
@@ -733,10 +1010,10 @@ class CheckpointManager:
 
             # Change button text based on mode
             if mode == "shapes":
-                cont_text = self.small_font.render("Replay Level", True, WHITE)
+                cont_text = self.text_cache.render(self.small_font, "Replay Level", True, WHITE)
             else:
-                cont_text = self.small_font.render("Continue", True, WHITE)
-            menu_text = self.small_font.render("Level Select", True, WHITE)
+                cont_text = self.text_cache.render(self.small_font, "Continue", True, WHITE)
+            menu_text = self.text_cache.render(self.small_font, "Level Select", True, WHITE)
 
             screen.blit(cont_text, cont_text.get_rect(center=self.continue_rect.center))
             screen.blit(menu_text, menu_text.get_rect(center=self.menu_rect.center))
@@ -830,11 +1107,12 @@ class CheckpointManager:
             particle["angle"] += particle["angular_speed"]
             x = self.center_x + particle["distance"] * math.cos(particle["angle"])
             y = self.center_y + particle["distance"] * math.sin(particle["angle"])
-            pygame.draw.circle(screen, particle["color"], (int(x), int(y)), particle["radius"])
+            self.batcher.draw_circle(particle["color"], particle["radius"], (int(x), int(y)))
 
             # Keep particles within reasonable boundary
             if particle["distance"] > max(self.width, self.height) * 0.8:
                 particle["distance"] = random.uniform(50, 200)
+        self.batcher.flush(screen)
 
     def _draw_neon_button(self, screen, rect, color):
         """Draw a neon-style button with glow effect."""
@@ -864,7 +1142,8 @@ class FlamethrowerManager:
     def __init__(self):
         """Initialize the flamethrower manager."""
         self.flamethrowers = []
-        self.glow_cache = {}
+        self.renderer = FlameRenderer()
+        self.renderer.get_palette(FLAME_COLORS, DEFAULT_FLAME_WIDTHS)  # Pre-render default puffs
 
     def create_flamethrower(
         self, start_x, start_y, end_x, end_y, colors=None, widths=None, duration=10
@@ -884,7 +1163,7 @@ class FlamethrowerManager:
         if colors is None:
             colors = FLAME_COLORS
         if widths is None:
-            widths = [20, 30, 40]
+            widths = DEFAULT_FLAME_WIDTHS
 
         self.flamethrowers.append(
             {
@@ -918,13 +1197,20 @@ class FlamethrowerManager:
             screen: Pygame surface to draw on
             offset_x (int): X offset for screen shake
             offset_y (int): Y offset for screen shake
+
+        Returns:
+            list: Bounding box of each drawn flamethrower
         """
+        drawn = []
         for flamethrower in self.flamethrowers:
-            self._draw_flamethrower(screen, flamethrower, offset_x, offset_y)
+            rect = self._draw_flamethrower(screen, flamethrower, offset_x, offset_y)
+            if rect is not None:
+                drawn.append(rect)
+        return drawn
 
     def _draw_flamethrower(self, screen, flamethrower, offset_x=0, offset_y=0):
         """
-        Draw a single flamethrower effect using circles along a line.
+        Draw a single flamethrower effect as jittered flame puffs along a line.
 
         Args:
             screen: Pygame surface to draw on
@@ -932,65 +1218,15 @@ class FlamethrowerManager:
             offset_x (int): X offset for screen shake
             offset_y (int): Y offset for screen shake
         """
-        start_x = flamethrower["start_pos"][0] + offset_x
-        start_y = flamethrower["start_pos"][1] + offset_y
-        end_x = flamethrower["end_pos"][0] + offset_x
-        end_y = flamethrower["end_pos"][1] + offset_y
-
-        # Calculate line properties
-        dx = end_x - start_x
-        dy = end_y - start_y
-        distance = math.hypot(dx, dy)
-
-        if distance == 0:
-            return
-
-        # Draw flame circles along the line
-        num_circles = max(1, int(distance // 15))  # Circle every 15 pixels, minimum 1
-        for i in range(num_circles):
-            if num_circles == 1:
-                t = 0.5  # Center the single circle
-            else:
-                t = i / (num_circles - 1)  # Interpolation factor
-            circle_x = int(start_x + t * dx)
-            circle_y = int(start_y + t * dy)
-
-            # Vary circle size and color
-            base_radius = random.choice(flamethrower.get("widths", [20, 30, 40])) // 4
-            radius = max(1, base_radius + random.randint(-5, 5))  # Ensure minimum radius of 1
-            color = random.choice(flamethrower.get("colors", FLAME_COLORS))
-
-            # Add some randomness to position for flame effect
-            jitter_x = random.randint(-8, 8)
-            jitter_y = random.randint(-8, 8)
-
-            # Calculate glow radius and ensure it's valid
-            glow_radius = max(1, int(radius * 1.5))
-
-            # Draw glow effect
-            if glow_radius > 0:
-                # Optimized: Cache and reuse glow surfaces
-                cache_key = (color, glow_radius)
-                glow_surface = self.glow_cache.get(cache_key)
-
-                if glow_surface is None:
-                    size = glow_radius * 2
-                    glow_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-                    pygame.draw.circle(
-                        glow_surface, (*color, 100), (glow_radius, glow_radius), glow_radius
-                    )
-                    self.glow_cache[cache_key] = glow_surface
-
-                screen.blit(
-                    glow_surface,
-                    (circle_x + jitter_x - glow_radius, circle_y + jitter_y - glow_radius),
-                )
-
-            # Draw main flame circle
-            if radius > 0:
-                pygame.draw.circle(
-                    screen, color, (circle_x + jitter_x, circle_y + jitter_y), radius
-                )
+        start_x, start_y = flamethrower["start_pos"]
+        end_x, end_y = flamethrower["end_pos"]
+        return self.renderer.draw_beam(
+            screen,
+            (start_x + offset_x, start_y + offset_y),
+            (end_x + offset_x, end_y + offset_y),
+            flamethrower.get("colors", FLAME_COLORS),
+            flamethrower.get("widths", DEFAULT_FLAME_WIDTHS),
+        )
 
     def clear(self):
         """Clear all flamethrowers."""
@@ -1036,7 +1272,7 @@ class CenterPieceManager:
 
         # Player font for center piece - cached for performance
         self.player_font = pygame.font.Font(None, 900)
-        self.glow_cache = {}
+        self.batcher = get_sprite_batcher()
 
         # Center position
         self.player_x = width // 2
@@ -1079,15 +1315,19 @@ class CenterPieceManager:
             mode (str): Game mode ("alphabet", "numbers", "shapes", "clcase")
             offset_x (int): X offset for screen shake
             offset_y (int): Y offset for screen shake
+
+        Returns:
+            pygame.Rect: Bounding box of the drawn center piece, or None
         """
         # Update swirl particles
         self._update_swirl_particles()
 
         # Draw swirl particles
-        self._draw_swirl_particles(screen, offset_x, offset_y)
+        swirl_rect = self._draw_swirl_particles(screen, offset_x, offset_y)
 
         # Draw center target
-        self._draw_center_target(screen, target_letter, mode, offset_x, offset_y)
+        target_rect = self._draw_center_target(screen, target_letter, mode, offset_x, offset_y)
+        return _union_rects([swirl_rect, target_rect])
 
     def trigger_convergence(self, target_x, target_y):
         """
@@ -1220,6 +1460,7 @@ class CenterPieceManager:
         """Draw swirling particles around the center."""
         # PERFORMANCE: Simplify glow effects for QBoard
         use_glow = self.display_mode == "DEFAULT"
+        drawn = []
 
         for particle in self.swirl_particles:
             # Calculate particle position
@@ -1230,36 +1471,32 @@ class CenterPieceManager:
             draw_x = int(x + offset_x)
             draw_y = int(y + offset_y)
 
-            # Draw particle with optional glow effect
+            # Draw particle with optional glow effect, batched through the particle atlas
             if use_glow:
                 glow_radius = int(particle["radius"] * 1.5)
                 if glow_radius <= 0:
                     continue
-
-                # Optimized: Cache and reuse glow surfaces
-                cache_key = (particle["color"], glow_radius)
-                glow_surface = self.glow_cache.get(cache_key)
-
-                if glow_surface is None:
-                    size = glow_radius * 2
-                    glow_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-                    pygame.draw.circle(
-                        glow_surface,
-                        (*particle["color"], 60),
-                        (glow_radius, glow_radius),
-                        glow_radius,
+                drawn.append(
+                    self.batcher.draw_circle(
+                        particle["color"], glow_radius, (draw_x, draw_y), alpha=60
                     )
-                    self.glow_cache[cache_key] = glow_surface
-
-                screen.blit(glow_surface, (draw_x - glow_radius, draw_y - glow_radius))
+                )
 
             # Draw main particle
-            pygame.draw.circle(screen, particle["color"], (draw_x, draw_y), particle["radius"])
+            if particle["radius"] > 0:
+                drawn.append(
+                    self.batcher.draw_circle(
+                        particle["color"], particle["radius"], (draw_x, draw_y)
+                    )
+                )
+
+        self.batcher.flush(screen)
+        return _union_rects(drawn)
 
     def _draw_center_target(self, screen, target_letter, mode, offset_x=0, offset_y=0):
         """Draw the center target display using cached fonts for performance."""
         if not target_letter:
-            return
+            return None
 
         # Update color transition
         self._update_color_transition()
@@ -1270,10 +1507,9 @@ class CenterPieceManager:
 
         if mode == "shapes":
             # Draw the center target display as a shape outline
-            self._draw_shape_target(screen, target_letter, center_x, center_y)
-        else:
-            # Draw text target for Alphabet, Numbers, C/L Case using cached fonts
-            self._draw_text_target_cached(screen, target_letter, mode, center_x, center_y)
+            return self._draw_shape_target(screen, target_letter, center_x, center_y)
+        # Draw text target for Alphabet, Numbers, C/L Case using cached fonts
+        return self._draw_text_target_cached(screen, target_letter, mode, center_x, center_y)
 
     def _update_color_transition(self):
         """Update smooth color transition for the center target."""
@@ -1314,13 +1550,12 @@ class CenterPieceManager:
                     mode, target_letter, center_target_color
                 )
                 surface_rect = cached_surface.get_rect(center=(center_x, center_y))
-                screen.blit(cached_surface, surface_rect)
-                return
+                return screen.blit(cached_surface, surface_rect)
             except:
                 pass  # Fall back to original rendering if cache fails
 
         # Fallback: Original rendering method
-        self._draw_text_target_fallback(
+        return self._draw_text_target_fallback(
             screen, target_letter, mode, center_x, center_y, center_target_color
         )
 
@@ -1337,7 +1572,7 @@ class CenterPieceManager:
 
         player_text = self.player_font.render(display_char, True, center_target_color)
         player_rect = player_text.get_rect(center=(center_x, center_y))
-        screen.blit(player_text, player_rect)
+        return screen.blit(player_text, player_rect)
 
     def _draw_shape_target(self, screen, target_letter, center_x, center_y):
         """Draw shape-based center target."""
@@ -1351,19 +1586,19 @@ class CenterPieceManager:
             rect = pygame.Rect(
                 pos[0] - int(size * 1.5) // 2, pos[1] - size // 2, int(size * 1.5), size
             )
-            pygame.draw.rect(screen, center_target_color, rect, 8)
+            return pygame.draw.rect(screen, center_target_color, rect, 8)
         elif value == "Square":
             square_rect = pygame.Rect(pos[0] - size // 2, pos[1] - size // 2, size, size)
-            pygame.draw.rect(screen, center_target_color, square_rect, 8)
+            return pygame.draw.rect(screen, center_target_color, square_rect, 8)
         elif value == "Circle":
-            pygame.draw.circle(screen, center_target_color, pos, size // 2, 8)
+            return pygame.draw.circle(screen, center_target_color, pos, size // 2, 8)
         elif value == "Triangle":
             points = [
                 (pos[0], pos[1] - size // 2),
                 (pos[0] - size // 2, pos[1] + size // 2),
                 (pos[0] + size // 2, pos[1] + size // 2),
             ]
-            pygame.draw.polygon(screen, center_target_color, points, 8)
+            return pygame.draw.polygon(screen, center_target_color, points, 8)
         elif value == "Pentagon":
             points = []
             r_size = size // 2
@@ -1372,7 +1607,212 @@ class CenterPieceManager:
                 points.append(
                     (pos[0] + r_size * math.cos(angle), pos[1] + r_size * math.sin(angle))
                 )
-            pygame.draw.polygon(screen, center_target_color, points, 8)
+            return pygame.draw.polygon(screen, center_target_color, points, 8)
+        return None
+
+
+class DirtyRectManager:
+    """
+    Universal class to manage dirty-rectangle display updates.
+    Collects the regions drawn each frame and pushes only those (plus last
+    frame's, to erase what moved) to the display, falling back to a full flip
+    when too much of the screen changed. Frames with more than max_rects
+    regions (stars, particles) have nearby rects merged rather than flipping.
+    """
+
+    def __init__(
+        self,
+        width,
+        height,
+        enabled=False,
+        full_update_threshold=0.4,
+        max_rects=256,
+        merge_margin=8,
+        merge_slack=4096,
+    ):
+        """
+        Initialize the dirty rect manager.
+
+        Args:
+            width (int): Screen width
+            height (int): Screen height
+            enabled (bool): Use partial updates; when False every frame is flipped
+            full_update_threshold (float): Dirty fraction of the screen above which to flip
+            max_rects (int): Rect count above which rects are merged before updating
+            merge_margin (int): Rects closer than this many pixels may be merged
+            merge_slack (int): Most pixels a merge may add beyond the two rects' areas
+        """
+        self.width = width
+        self.height = height
+        self.enabled = enabled
+        self.full_update_threshold = full_update_threshold
+        self.max_rects = max_rects
+        self.merge_margin = merge_margin
+        self.merge_slack = merge_slack
+        self.screen_rect = pygame.Rect(0, 0, width, height)
+
+        self.rects = []  # Regions drawn this frame
+        self.previous_rects = []  # Regions drawn last frame
+        self.watched = {}  # Name -> last value for full-redraw triggers
+        self.full_update = True  # First frame always goes out in full
+
+        # Metrics
+        self.full_updates = 0
+        self.partial_updates = 0
+        self.last_dirty_fraction = 1.0
+        self.last_rect_count = 0  # Rects sent in the last update
+
+    @classmethod
+    def from_settings(cls, width, height, settings):
+        """Create a manager configured from a PERFORMANCE_SETTINGS entry."""
+        return cls(
+            width,
+            height,
+            enabled=settings.get("dirty_rect_rendering", False),
+            full_update_threshold=settings.get("dirty_rect_threshold", 0.4),
+        )
+
+    def mark(self, rect):
+        """
+        Record a region drawn this frame.
+
+        Args:
+            rect: pygame.Rect, (x, y, w, h) tuple or list of rects; None is ignored
+
+        Returns:
+            The rect, so draw calls can be wrapped inline
+        """
+        if not self.enabled:
+            return rect
+        if isinstance(rect, list):
+            self.rects.extend(pygame.Rect(r) for r in rect)
+        elif rect is not None:
+            self.rects.append(pygame.Rect(rect))
+        return rect
+
+    def invalidate(self):
+        """Force a full flip on the next present."""
+        self.full_update = True
+
+    def watch(self, name, value):
+        """Force a full flip whenever a whole-screen value (background, shake) changes."""
+        if name not in self.watched or self.watched[name] != value:
+            self.full_update = True
+        self.watched[name] = value
+
+    def merge(self, rects):
+        """
+        Coalesce rects that overlap or lie within merge_margin of each other.
+
+        Two rects are only joined when their union adds at most merge_slack
+        pixels over their combined area, so an object's old and new position
+        or a cluster of stars collapse into one rect while distant large
+        regions stay separate.
+
+        Args:
+            rects (list): pygame.Rect objects
+
+        Returns:
+            list: Merged rects covering every input rect
+        """
+        margin = self.merge_margin * 2
+        slack = self.merge_slack
+        merged = []
+        for rect in sorted(rects, key=lambda r: (r.y, r.x)):
+            area = rect.width * rect.height
+            for index in reversed(rect.inflate(margin, margin).collidelistall(merged)):
+                other = merged[index]
+                union = rect.union(other)
+                if union.width * union.height <= area + other.width * other.height + slack:
+                    del merged[index]
+                    rect = union
+                    area = union.width * union.height
+            merged.append(rect)
+        return merged
+
+    def bin(self, rects):
+        """
+        Union rects per cell of a coarse screen grid, at most max_rects cells.
+
+        Used when merging still leaves too many scattered regions; the dirty
+        area grows, and present() flips if it passes the threshold.
+        """
+        cells = max(1, int(math.sqrt(self.max_rects)))
+        cell_width = self.width / cells
+        cell_height = self.height / cells
+        bins = {}
+        for rect in rects:
+            key = (
+                min(cells - 1, int(rect.centerx / cell_width)),
+                min(cells - 1, int(rect.centery / cell_height)),
+            )
+            bins[key] = bins[key].union(rect) if key in bins else rect
+        return list(bins.values())
+
+    @staticmethod
+    def covered_area(rects):
+        """
+        Pixels covered by the union of rects, counting overlaps once.
+
+        An object's previous and current rects mostly overlap, so summing
+        their areas would overstate the dirty fraction about twofold.
+        """
+        if not rects:
+            return 0
+        edges = np.array([(rect.left, rect.right, rect.top, rect.bottom) for rect in rects])
+        xs = np.unique(edges[:, :2])
+        ys = np.unique(edges[:, 2:])
+        columns = np.searchsorted(xs, edges[:, :2]).tolist()
+        rows = np.searchsorted(ys, edges[:, 2:]).tolist()
+        covered = np.zeros((len(ys) - 1, len(xs) - 1), dtype=bool)
+        for (left, right), (top, bottom) in zip(columns, rows):
+            covered[top:bottom, left:right] = True
+        return int(np.diff(ys) @ covered.astype(np.float64) @ np.diff(xs))
+
+    def present(self):
+        """Push this frame to the display and start collecting the next one."""
+        if not self.enabled:
+            # Plain flip: no rects were collected, so skip clipping and area work
+            pygame.display.flip()
+            self.full_updates += 1
+            self.full_update = True  # Enabling later starts from a full frame
+            return
+
+        rects = [
+            rect.clip(self.screen_rect)
+            for rect in self.previous_rects + self.rects
+            if rect.colliderect(self.screen_rect)
+        ]
+        # Too many regions for one update call: coalesce instead of flipping
+        if len(rects) > self.max_rects:
+            rects = self.merge(rects)
+        if len(rects) > self.max_rects:
+            rects = self.bin(rects)
+        self.last_rect_count = len(rects)
+        self.last_dirty_fraction = self.covered_area(rects) / (self.width * self.height)
+
+        if self.full_update or self.last_dirty_fraction > self.full_update_threshold:
+            pygame.display.flip()
+            self.full_updates += 1
+        else:
+            pygame.display.update(rects)
+            self.partial_updates += 1
+
+        self.previous_rects = self.rects
+        self.rects = []
+        self.full_update = False
+
+    def get_stats(self):
+        """Get update statistics."""
+        frames = self.full_updates + self.partial_updates
+        return {
+            "enabled": self.enabled,
+            "full_updates": self.full_updates,
+            "partial_updates": self.partial_updates,
+            "partial_ratio": self.partial_updates / frames if frames else 0.0,
+            "last_dirty_fraction": self.last_dirty_fraction,
+            "last_rect_count": self.last_rect_count,
+        }
 
 
 class SoundManager:
@@ -0,0 +1,168 @@
+"""
+Dot Renderer for SS6 Super Student Game
+Pre-renders the shaded, shimmering dots of the colors level so each dot is one blit.
+"""
+
+import math
+from collections import OrderedDict
+
+import pygame
+
+GRADIENT_LAYERS = 3  # Circles in the center-to-edge depth gradient
+TARGET_GLOW_PADDING = 8  # Extra radius of the glow around target dots
+
+# Both target pulses (center boost at 0.1 rad/frame and glow at 0.15 rad/frame)
+# are harmonics of 0.05 rad/frame, so one phase step describes them together.
+GLOW_PHASE_RATE = 0.05
+GLOW_STEPS = 24
+
+
+def glow_step(frame_counter, steps=GLOW_STEPS):
+    """Quantized phase of the target glow pulse for a frame."""
+    phase = (frame_counter * GLOW_PHASE_RATE) % (2 * math.pi)
+    return int(phase / (2 * math.pi) * steps) % steps
+
+
+def dot_shading(base_color, step=None, steps=GLOW_STEPS):
+    """
+    Gradient colors for a dot.
+
+    Args:
+        base_color: Dot RGB color
+        step: Glow step for target dots, None for ordinary dots
+        steps: Number of glow steps per pulse period
+
+    Returns:
+        Tuple of (center_color, edge_color)
+    """
+    # Create gradient from lighter center to darker edge
+    center_color = tuple(min(255, int(c * 1.3)) for c in base_color)
+    edge_color = tuple(max(0, int(c * 0.7)) for c in base_color)
+
+    # Brighten the center of target dots with the pulse
+    if step is not None:
+        phase = step * 2 * math.pi / steps
+        glow_intensity = 0.2 + 0.1 * math.sin(phase * 2)
+        center_color = tuple(min(255, int(c * (1.0 + glow_intensity))) for c in center_color)
+
+    return center_color, edge_color
+
+
+def target_glow_alpha(step, steps=GLOW_STEPS):
+    """Alpha of the halo drawn over target dots at a glow step."""
+    return int(50 + 30 * math.sin(step * 2 * math.pi / steps * 3))
+
+
+class DotSpriteCache:
+    """
+    LRU cache of fully shaded dot sprites.
+
+    Sprites are keyed on (color, quantized radius, shimmer step, target flag,
+    glow step) and bake the gradient stack, shimmer alpha and target halo into
+    one per-pixel alpha surface.
+    """
+
+    def __init__(self, max_sprites=512, radius_step=2, alpha_step=16, glow_steps=GLOW_STEPS):
+        self.max_sprites = max_sprites
+        self.radius_step = radius_step
+        self.alpha_step = alpha_step
+        self.glow_steps = glow_steps
+        self.sprites = OrderedDict()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.frame_allocations = 0  # Surfaces created since begin_frame()
+
+    def begin_frame(self):
+        """Start counting surface allocations for a new frame."""
+        self.frame_allocations = 0
+
+    def _key(self, color, radius, shimmer_alpha, is_target, frame_counter):
+        """Quantize a dot's look for one frame to its cache key."""
+        radius = max(1, int(round(radius / self.radius_step)) * self.radius_step)
+        shimmer = min(255, int(round(shimmer_alpha / self.alpha_step)) * self.alpha_step)
+        step = glow_step(frame_counter, self.glow_steps) if is_target else None
+        return tuple(color[:3]), radius, shimmer, bool(is_target), step
+
+    def get(self, color, radius, shimmer_alpha, is_target, frame_counter):
+        """
+        Get the sprite for a dot, rendering it on a miss.
+
+        Args:
+            color: Dot RGB color
+            radius: Radius after shimmer scaling
+            shimmer_alpha: Alpha of the outer gradient ring
+            is_target: Whether the dot carries the target glow
+            frame_counter: Level frame counter driving the glow pulse
+
+        Returns:
+            Tuple of (surface, half_size) where half_size centers the sprite
+        """
+        key = self._key(color, radius, shimmer_alpha, is_target, frame_counter)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return sprite
+
+        self.misses += 1
+        sprite = self._render(*key)
+        self.frame_allocations += 1
+
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)
+            self.evictions += 1
+        return sprite
+
+    def _render(self, color, radius, shimmer_alpha, is_target, step):
+        """Draw the gradient stack, and the halo for targets, onto one surface."""
+        half = radius + TARGET_GLOW_PADDING if is_target else radius
+        surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        center_color, edge_color = dot_shading(color, step, self.glow_steps)
+
+        for i in range(GRADIENT_LAYERS):
+            gradient_radius = radius - (i * radius // 4)
+            if gradient_radius <= 0:
+                continue
+            blend_factor = i / GRADIENT_LAYERS
+            blended_color = tuple(
+                int(center_color[j] * (1 - blend_factor) + edge_color[j] * blend_factor)
+                for j in range(3)
+            )
+            # Outermost circle gets the shimmer alpha, inner circles are opaque
+            alpha = shimmer_alpha if i == 0 else 255
+            pygame.draw.circle(surface, (*blended_color, alpha), (half, half), gradient_radius)
+
+        if is_target:
+            glow = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            pygame.draw.circle(
+                glow, (*color, target_glow_alpha(step, self.glow_steps)), (half, half), half
+            )
+            surface.blit(glow, (0, 0))
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()  # Match the display format for faster blits
+        return surface, half
+
+    def clear(self):
+        """Drop every cached sprite."""
+        self.sprites.clear()
+
+    def get_stats(self):
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "sprites": len(self.sprites),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "frame_allocations": self.frame_allocations,
+            "cached_bytes": sum(
+                surface.get_width() * surface.get_height() * surface.get_bytesize()
+                for surface, _ in self.sprites.values()
+            ),
+        }
@@ -1,177 +1,556 @@
 """
 Enhanced Particle System for SS6 Super Student Game
-Uses object pooling and texture atlasing for better performance.
+Stores particles in pooled NumPy columns and uses texture atlasing for better performance.
 """
 
 import math
 import random
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pygame
 
-from utils.object_pooling import get_pool_manager
+from Display_settings import DEFAULT_MODE, MAX_PARTICLES
+from utils.particle_rasterizer import SplatRasterizer
 from utils.texture_atlas import get_atlas_manager
 
 
-class EnhancedParticle:
-    """Enhanced particle with more features and better performance."""
-
-    def __init__(self):
-        self.reset()
-
-    def reset(self):
-        """Reset particle to default state."""
-        self.x = 0.0
-        self.y = 0.0
-        self.vx = 0.0
-        self.vy = 0.0
-        self.ax = 0.0  # Acceleration
-        self.ay = 0.0
-        self.life = 1.0
-        self.max_life = 1.0
-        self.color = (255, 255, 255, 255)
-        self.size = 3.0
-        self.scale = 1.0
-        self.rotation = 0.0
-        self.angular_velocity = 0.0
-        self.active = False
-        self.texture_name = None
+def transform_texture(
+    texture: pygame.Surface, scale: float, rotation: float, tint: Tuple[int, ...]
+) -> pygame.Surface:
+    """Scaled, rotated and tinted copy of an atlas texture."""
+    # Scale and rotate texture if needed
+    if scale != 1.0 or rotation != 0:
+        scaled_size = (int(texture.get_width() * scale), int(texture.get_height() * scale))
+        if scaled_size[0] > 0 and scaled_size[1] > 0:
+            texture = pygame.transform.scale(texture, scaled_size)
+
+        if rotation != 0:
+            texture = pygame.transform.rotate(texture, rotation)
+
+    # Apply color tint
+    texture = texture.copy()
+    texture.fill(tint[:3], special_flags=pygame.BLEND_MULT)
+    return texture
+
+
+class TransformedTextureCache:
+    """
+    LRU cache of scaled, rotated and tinted particle textures.
+
+    Surfaces are keyed on (texture_name, quantized scale, quantized rotation,
+    quantized tint). The least recently used are evicted once the cached
+    pixels exceed memory_budget bytes. prebake() renders every rotation
+    step of a texture up front, so misses only have to scale and tint.
+    """
+
+    def __init__(
+        self,
+        memory_budget: int = 16 * 1024 * 1024,
+        scale_step: float = 0.05,
+        rotation_steps: int = 36,
+        tint_step: int = 16,
+    ):
+        self.memory_budget = memory_budget
+        self.scale_step = scale_step
+        self.rotation_steps = rotation_steps
+        self.tint_step = tint_step
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.rotation_frames: Dict[str, List[pygame.Surface]] = {}
+        self.cached_bytes = 0
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.frame_allocations = 0  # Surfaces created since begin_frame()
+
+    def begin_frame(self):
+        """Start counting surface allocations for a new frame."""
+        self.frame_allocations = 0
+
+    def _key(self, texture_name: str, scale: float, rotation: float, tint: Tuple[int, ...]):
+        """Quantize a draw request to its cache key."""
+        step = self.tint_step
+        rgb = tuple(min(255, int(round(channel / step)) * step) for channel in tint[:3])
+        scale_index = int(round(scale / self.scale_step))
+        rotation_index = int(round(rotation * self.rotation_steps / 360)) % self.rotation_steps
+        return texture_name, scale_index, rotation_index, rgb
+
+    def quantize(self, scales: np.ndarray, rotations: np.ndarray, tints: np.ndarray):
+        """
+        Quantize many draw requests at once, matching _key.
+
+        Returns:
+            Lists of scale indices, rotation indices and tint tuples
+        """
+        step = self.tint_step
+        rgb = np.minimum(255, np.round(tints[:, :3] / step).astype(int) * step)
+        scale_indices = np.round(scales / self.scale_step).astype(int)
+        rotation_indices = np.round(rotations * self.rotation_steps / 360).astype(int)
+        rotation_indices %= self.rotation_steps
+        return (
+            scale_indices.tolist(),
+            rotation_indices.tolist(),
+            list(map(tuple, rgb.tolist())),
+        )
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def prebake(self, texture_name: str, texture: pygame.Surface):
+        """Render every rotation step of a texture at full scale."""
+        self.rotation_frames[texture_name] = [texture] + [
+            pygame.transform.rotate(texture, index * 360 / self.rotation_steps)
+            for index in range(1, self.rotation_steps)
+        ]
+
+    def get(
+        self,
+        texture_name: str,
+        texture: pygame.Surface,
+        scale: float,
+        rotation: float,
+        tint: Tuple[int, ...],
+    ) -> pygame.Surface:
+        """Get a transformed texture, rendering it on a miss."""
+        return self.get_by_key(self._key(texture_name, scale, rotation, tint), texture)
+
+    def get_by_key(self, key: tuple, texture: pygame.Surface) -> pygame.Surface:
+        """Get a transformed texture for an already quantized key."""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        texture_name, scale_index, rotation_index, rgb = key
+        scale = scale_index * self.scale_step
+        frames = self.rotation_frames.get(texture_name)
+        if frames is not None:
+            # Start from the pre-rotated frame, leaving only the scale and tint
+            surface = transform_texture(frames[rotation_index], scale, 0, rgb)
+        else:
+            rotation = rotation_index * 360 / self.rotation_steps
+            surface = transform_texture(texture, scale, rotation, rgb)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()  # Match the display format for faster blits
+        self.frame_allocations += 1
+
+        self.surfaces[key] = surface
+        self.cached_bytes += self._surface_bytes(surface)
+        while self.cached_bytes > self.memory_budget and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.cached_bytes -= self._surface_bytes(evicted)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drop every cached surface and pre-baked frame."""
+        self.surfaces.clear()
+        self.rotation_frames.clear()
+        self.cached_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "surfaces": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "frame_allocations": self.frame_allocations,
+            "cached_bytes": self.cached_bytes,
+            "prebaked_textures": len(self.rotation_frames),
+            "prebaked_bytes": sum(
+                self._surface_bytes(frame)
+                for frames in self.rotation_frames.values()
+                for frame in frames
+            ),
+        }
+
+
+def draw_particle(
+    screen: pygame.Surface,
+    texture: Optional[pygame.Surface],
+    x: float,
+    y: float,
+    color: Tuple[int, ...],
+    alpha: int,
+    final_size: int,
+    scale: float,
+    rotation: float,
+    blend_mode: int,
+):
+    """Draw one particle from an atlas texture, or as a circle without one."""
+    if texture:
+        texture = transform_texture(texture, scale, rotation, color)
+        if alpha < 255:
+            texture.set_alpha(alpha)
+
+        # Draw texture
+        rect = texture.get_rect(center=(int(x), int(y)))
+        screen.blit(texture, rect, special_flags=blend_mode)
+        return
+
+    # Fallback to circle drawing
+    if final_size > 0:
+        # Create surface with alpha
+        current_color = (*color[:3], alpha)
+        particle_surf = pygame.Surface((final_size * 2, final_size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(particle_surf, current_color, (final_size, final_size), final_size)
+
+        # Draw to screen
+        screen.blit(
+            particle_surf,
+            (int(x - final_size), int(y - final_size)),
+            special_flags=blend_mode,
+        )
+
+
+class ParticleStore:
+    """
+    Structure-of-arrays store for every particle of a system.
+
+    Live particles are packed into slots [0, count) of preallocated NumPy
+    columns, so bursts are spawned, integrated and culled with whole-array
+    operations instead of per-particle objects. Textures are interned and
+    stored per particle as an index, -1 meaning no texture. Particles
+    flagged as rasterized are splatted as points instead of blitted.
+
+    Columns start at a warm-up capacity and double when a burst does not
+    fit, up to max_capacity, so steady-state play allocates nothing once
+    the high-water mark is reached. shrink() returns an idle store to its
+    warm-up capacity.
+    """
+
+    COLUMNS = (
+        "x",
+        "y",
+        "vx",
+        "vy",
+        "ax",
+        "ay",
+        "life",
+        "max_life",
+        "size",
+        "scale",
+        "rotation",
+        "angular_velocity",
+    )
+
+    def __init__(self, capacity: int, max_capacity: Optional[int] = None):
+        self.warmup_capacity = capacity
+        self.max_capacity = max(capacity, max_capacity or capacity)
+        self.capacity = 0
+        self.count = 0
+        self.texture_names: List[str] = []
         self.blend_mode = pygame.BLEND_ALPHA_SDL2
-        self.fade_out = True
-        self.physics_enabled = True
 
-    def initialize(
+        # Metrics
+        self.high_water_mark = 0
+        self.allocations = 0  # Times the columns were (re)allocated
+
+        self._allocate(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _allocate(self, capacity: int):
+        """Reallocate every column at a new capacity, keeping live particles."""
+        count = self.count
+        for name in self.COLUMNS:
+            column = np.zeros(capacity)
+            if count:
+                column[:count] = getattr(self, name)[:count]
+            setattr(self, name, column)
+        colors = np.zeros((capacity, 4), dtype=np.int32)
+        texture_ids = np.full(capacity, -1, dtype=np.int32)
+        rasterized = np.zeros(capacity, dtype=bool)
+        if count:
+            colors[:count] = self.colors[:count]
+            texture_ids[:count] = self.texture_ids[:count]
+            rasterized[:count] = self.rasterized[:count]
+        self.colors = colors
+        self.texture_ids = texture_ids
+        self.rasterized = rasterized
+        self.capacity = capacity
+        self.allocations += 1
+
+    def reserve(self, count: int) -> int:
+        """
+        Make room for count more particles, growing up to max_capacity.
+
+        Returns:
+            Number of particles that fit
+        """
+        needed = self.count + count
+        if needed > self.capacity and self.capacity < self.max_capacity:
+            self._allocate(min(self.max_capacity, max(needed, self.capacity * 2)))
+        return min(count, self.capacity - self.count)
+
+    def shrink(self):
+        """Return to the warm-up capacity if the live particles fit in it."""
+        if self.capacity > self.warmup_capacity and self.count <= self.warmup_capacity:
+            self._allocate(self.warmup_capacity)
+
+    def _texture_id(self, texture_name: Optional[str]) -> int:
+        """Intern a texture name and return its index."""
+        if not texture_name:
+            return -1
+        if texture_name not in self.texture_names:
+            self.texture_names.append(texture_name)
+        return self.texture_names.index(texture_name)
+
+    def spawn(
         self,
+        rng: np.random.Generator,
         x: float,
         y: float,
-        vx: float,
-        vy: float,
-        life: float,
-        color: Tuple[int, int, int, int] = (255, 255, 255, 255),
-        size: float = 3.0,
+        count: int,
+        color: Tuple[int, int, int, int],
+        speed_range: Tuple[float, float],
+        life_range: Tuple[float, float],
+        size_range: Tuple[float, float],
         texture_name: str = None,
-    ):
-        """Initialize particle with given parameters."""
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.life = life
-        self.max_life = life
-        self.color = color
-        self.size = size
-        self.texture_name = texture_name
-        self.active = True
-        self.scale = 1.0
-        self.rotation = 0.0
-        self.angular_velocity = random.uniform(-180, 180)  # degrees per second
+        rasterize: bool = False,
+    ) -> int:
+        """
+        Add up to count particles bursting out from (x, y).
+
+        Returns:
+            Number of particles added
+        """
+        start = self.count
+        count = self.reserve(count)
+        if count <= 0:
+            return 0
+        end = start + count
+
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(*speed_range, count)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = np.cos(angle) * speed
+        self.vy[start:end] = np.sin(angle) * speed
+        life = rng.uniform(*life_range, count)
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.size[start:end] = rng.uniform(*size_range, count)
+        self.scale[start:end] = 1.0
+        self.rotation[start:end] = 0.0
+        self.angular_velocity[start:end] = rng.uniform(-180, 180, count)  # degrees per second
 
         # Add some randomness to acceleration for organic movement
-        self.ax = random.uniform(-10, 10)
-        self.ay = random.uniform(20, 50)  # Slight downward gravity
+        self.ax[start:end] = rng.uniform(-10, 10, count)
+        self.ay[start:end] = rng.uniform(20, 50, count)  # Slight downward gravity
+
+        # Add some color variation
+        variation = rng.integers(-30, 31, size=(count, 3))
+        self.colors[start:end, :3] = np.clip(np.array(color[:3]) + variation, 0, 255)
+        self.colors[start:end, 3] = color[3]
+        self.texture_ids[start:end] = self._texture_id(texture_name)
+        self.rasterized[start:end] = rasterize
 
-    def update(self, dt: float) -> bool:
+        self.count = end
+        self.high_water_mark = max(self.high_water_mark, end)
+        return count
+
+    def step(self, dt: float, bounds: Optional[Tuple[float, float, float, float]]):
         """
-        Update particle state.
+        Integrate every particle by dt and drop the dead ones.
 
         Args:
             dt: Delta time in seconds
+            bounds: (left, top, right, bottom) culling area, or None to skip culling
 
         Returns:
-            True if particle is still active
+            Tuple of (expired, culled) particle counts
         """
-        if not self.active:
-            return False
+        count = self.count
+        if count == 0:
+            return 0, 0
 
         # Update physics
-        if self.physics_enabled:
-            self.vx += self.ax * dt
-            self.vy += self.ay * dt
-            self.x += self.vx * dt
-            self.y += self.vy * dt
-
-        # Update rotation
-        self.rotation += self.angular_velocity * dt
-        if self.rotation > 360:
-            self.rotation -= 360
-        elif self.rotation < 0:
-            self.rotation += 360
-
-        # Update life
-        self.life -= dt
-
-        # Update scale based on life (for fade effects)
-        if self.fade_out:
-            self.scale = self.life / self.max_life
-
-        # Check if particle should die
-        if self.life <= 0:
-            self.active = False
-            return False
-
-        return True
-
-    def draw(self, screen: pygame.Surface, atlas_manager=None):
-        """Draw the particle."""
-        if not self.active:
-            return
-
-        # Calculate alpha based on life
-        alpha = int(255 * (self.life / self.max_life)) if self.fade_out else self.color[3]
-        current_color = (*self.color[:3], alpha)
-
-        # Calculate final size
-        final_size = max(1, int(self.size * self.scale))
-
-        if self.texture_name and atlas_manager:
-            # Use texture from atlas
-            texture = atlas_manager.get_texture("particles", self.texture_name)
-            if texture:
-                # Scale and rotate texture if needed
-                if self.scale != 1.0 or self.rotation != 0:
-                    scaled_size = (
-                        int(texture.get_width() * self.scale),
-                        int(texture.get_height() * self.scale),
-                    )
-                    if scaled_size[0] > 0 and scaled_size[1] > 0:
-                        texture = pygame.transform.scale(texture, scaled_size)
-
-                    if self.rotation != 0:
-                        texture = pygame.transform.rotate(texture, self.rotation)
-
-                # Apply color tint
-                texture = texture.copy()
-                texture.fill(current_color[:3], special_flags=pygame.BLEND_MULT)
-                if alpha < 255:
-                    texture.set_alpha(alpha)
-
-                # Draw texture
-                rect = texture.get_rect(center=(int(self.x), int(self.y)))
-                screen.blit(texture, rect, special_flags=self.blend_mode)
-                return
-
-        # Fallback to circle drawing
-        if final_size > 0:
-            # Create surface with alpha
-            particle_surf = pygame.Surface((final_size * 2, final_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, current_color, (final_size, final_size), final_size)
-
-            # Draw to screen
-            screen.blit(
-                particle_surf,
-                (int(self.x - final_size), int(self.y - final_size)),
-                special_flags=self.blend_mode,
+        vx = self.vx[:count]
+        vy = self.vy[:count]
+        vx += self.ax[:count] * dt
+        vy += self.ay[:count] * dt
+        x = self.x[:count]
+        y = self.y[:count]
+        x += vx * dt
+        y += vy * dt
+
+        # Update rotation, wrapped back into [0, 360]
+        rotation = self.rotation[:count]
+        rotation += self.angular_velocity[:count] * dt
+        rotation -= np.where(rotation > 360, 360, np.where(rotation < 0, -360, 0))
+
+        # Update life and the fade-out scale
+        life = self.life[:count]
+        life -= dt
+        np.divide(life, self.max_life[:count], out=self.scale[:count])
+
+        expired = life <= 0
+        dead = expired
+        culled = 0
+        if bounds is not None:
+            left, top, right, bottom = bounds
+            outside = (x < left) | (x > right) | (y < top) | (y > bottom)
+            culled = int(np.count_nonzero(outside & ~expired))
+            dead = expired | outside
+
+        expired_count = int(np.count_nonzero(expired))
+        if expired_count or culled:
+            # Stable compaction keeps the drawing order of the survivors
+            keep = ~dead
+            survivors = count - expired_count - culled
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                column[:survivors] = column[:count][keep]
+            self.colors[:survivors] = self.colors[:count][keep]
+            self.texture_ids[:survivors] = self.texture_ids[:count][keep]
+            self.rasterized[:survivors] = self.rasterized[:count][keep]
+            self.count = survivors
+        return expired_count, culled
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        atlas_manager=None,
+        texture_cache: Optional[TransformedTextureCache] = None,
+        rasterizer: Optional[SplatRasterizer] = None,
+    ) -> int:
+        """Draw every particle and return how many were drawn."""
+        count = self.count
+        if count == 0:
+            return 0
+
+        # Look each texture up once per frame; index -1 picks the trailing None
+        names = self.texture_names + [None]
+        textures = [None] * len(names)
+        if atlas_manager:
+            for index, name in enumerate(self.texture_names):
+                textures[index] = atlas_manager.get_texture("particles", name)
+
+        # Calculate alpha and final size from life
+        xs = self.x[:count]
+        ys = self.y[:count]
+        texture_ids = self.texture_ids[:count]
+        scale = self.scale[:count]
+        rotation = self.rotation[:count]
+        colors = self.colors[:count]
+        alphas = (255 * (self.life[:count] / self.max_life[:count])).astype(int)
+        sizes = np.maximum(1, (self.size[:count] * scale).astype(int))
+
+        # Rasterized particles go out in one additive splat, the rest as sprites
+        if rasterizer is not None:
+            splat = self.rasterized[:count]
+            if splat.any():
+                rasterizer.draw(
+                    screen, xs[splat], ys[splat], sizes[splat], colors[splat], alphas[splat]
+                )
+                sprites = ~splat
+                xs, ys, texture_ids, scale, rotation, colors, alphas, sizes = (
+                    column[sprites]
+                    for column in (xs, ys, texture_ids, scale, rotation, colors, alphas, sizes)
+                )
+
+        if texture_cache is not None:
+            scale_keys, rotation_keys, tint_keys = texture_cache.quantize(scale, rotation, colors)
+        else:
+            scale_keys = rotation_keys = tint_keys = [None] * len(xs)
+
+        blend_mode = self.blend_mode
+        for (
+            texture_id,
+            x,
+            y,
+            color,
+            alpha,
+            final_size,
+            particle_scale,
+            particle_rotation,
+            scale_key,
+            rotation_key,
+            tint_key,
+        ) in zip(
+            texture_ids.tolist(),
+            xs.tolist(),
+            ys.tolist(),
+            colors.tolist(),
+            alphas.tolist(),
+            sizes.tolist(),
+            scale.tolist(),
+            rotation.tolist(),
+            scale_keys,
+            rotation_keys,
+            tint_keys,
+        ):
+            texture = textures[texture_id]
+            if texture and texture_cache is not None:
+                # Shared cached surface, so its alpha is set on every draw
+                key = (names[texture_id], scale_key, rotation_key, tint_key)
+                sprite = texture_cache.get_by_key(key, texture)
+                sprite.set_alpha(alpha)
+                rect = sprite.get_rect(center=(int(x), int(y)))
+                screen.blit(sprite, rect, special_flags=blend_mode)
+                continue
+
+            draw_particle(
+                screen,
+                texture,
+                x,
+                y,
+                color,
+                alpha,
+                final_size,
+                particle_scale,
+                particle_rotation,
+                blend_mode,
             )
+        return count
 
+    def clear(self):
+        """Remove every particle."""
+        self.count = 0
 
-class EnhancedParticleSystem:
-    """Enhanced particle system with better performance and features."""
 
-    def __init__(self, max_particles: int = 500):
+class EnhancedParticleSystem:
+    """
+    Enhanced particle system with better performance and features.
+
+    Particles live in a ParticleStore, so spawning, integration and culling
+    are NumPy array operations rather than per-particle objects. The store
+    is warmed up to the display mode's particle budget and shrinks back to
+    it after idle_shrink_delay seconds without particles. Transformed atlas
+    textures are drawn from a cache rather than rendered per draw, and
+    effects created with rasterize=True are splatted additively, tile by tile.
+    """
+
+    def __init__(
+        self,
+        max_particles: int = 500,
+        display_mode: str = DEFAULT_MODE,
+        prebake_rotations: bool = False,
+    ):
         self.max_particles = max_particles
-        self.particles: List[EnhancedParticle] = []
-        self.pool_manager = get_pool_manager()
+        warmup = min(max_particles, MAX_PARTICLES.get(display_mode, MAX_PARTICLES[DEFAULT_MODE]))
+        self.store = ParticleStore(warmup, max_capacity=max_particles)
+        self.rng = np.random.default_rng()
         self.atlas_manager = get_atlas_manager()
+        self.texture_cache = TransformedTextureCache()
+        self.rasterizer = SplatRasterizer()
+        if prebake_rotations:
+            self.prebake_textures()
+
+        # Idle shrinking
+        self.idle_shrink_delay = 5.0  # Seconds
+        self.idle_time = 0.0
 
         # Performance settings
         self.culling_enabled = True
@@ -192,6 +571,20 @@ class EnhancedParticleSystem:
         self.screen_width = width
         self.screen_height = height
 
+    def prebake_textures(self) -> int:
+        """
+        Pre-render the rotation frames of every particle atlas texture.
+
+        Returns:
+            Number of textures pre-baked
+        """
+        atlas = self.atlas_manager.get_atlas("particles")
+        if atlas is None:
+            return 0
+        for name in atlas.regions:
+            self.texture_cache.prebake(name, atlas.get_subsurface(name))
+        return len(atlas.regions)
+
     def create_particle_burst(
         self,
         x: float,
@@ -202,7 +595,8 @@ class EnhancedParticleSystem:
         life_range: Tuple[float, float] = (0.5, 2.0),
         size_range: Tuple[float, float] = (2, 8),
         texture_name: str = None,
-    ) -> List[EnhancedParticle]:
+        rasterize: bool = False,
+    ) -> int:
         """
         Create a burst of particles.
 
@@ -214,44 +608,35 @@ class EnhancedParticleSystem:
             life_range: Min/max particle lifetime
             size_range: Min/max particle size
             texture_name: Optional texture name from atlas
+            rasterize: Splat the particles additively as points instead of blitting each one
 
         Returns:
-            List of created particles
+            Number of particles created
         """
-        created_particles = []
-
-        for _ in range(count):
-            if len(self.particles) >= self.max_particles:
-                break
-
-            # Get particle from pool
-            particle = EnhancedParticle()
-
-            # Random properties
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(*speed_range)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            life = random.uniform(*life_range)
-            size = random.uniform(*size_range)
-
-            # Add some color variation
-            color_variation = (
-                max(0, min(255, color[0] + random.randint(-30, 30))),
-                max(0, min(255, color[1] + random.randint(-30, 30))),
-                max(0, min(255, color[2] + random.randint(-30, 30))),
-                color[3],
-            )
-
-            particle.initialize(x, y, vx, vy, life, color_variation, size, texture_name)
-            self.particles.append(particle)
-            created_particles.append(particle)
-            self.stats["particles_created"] += 1
+        created = self.store.spawn(
+            self.rng,
+            x,
+            y,
+            count,
+            color,
+            speed_range,
+            life_range,
+            size_range,
+            texture_name,
+            rasterize,
+        )
+        self.stats["particles_created"] += created
+        return created
 
-        return created_particles
+    def create_explosion(
+        self, x: float, y: float, intensity: float = 1.0, rasterize: bool = False
+    ):
+        """
+        Create an explosion effect.
 
-    def create_explosion(self, x: float, y: float, intensity: float = 1.0):
-        """Create an explosion effect."""
+        With rasterize, the fire and spark particles are splatted, which keeps
+        high-intensity explosions cheap; the larger smoke particles stay sprites.
+        """
         base_count = int(30 * intensity)
         base_speed = 150 * intensity
 
@@ -265,6 +650,7 @@ class EnhancedParticleSystem:
             life_range=(0.8, 1.5),
             size_range=(4, 12),
             texture_name="particle_8_0",  # Red particle
+            rasterize=rasterize,
         )
 
         # Smoke particles
@@ -289,10 +675,11 @@ class EnhancedParticleSystem:
             life_range=(0.3, 0.8),
             size_range=(1, 4),
             texture_name="particle_4_3",  # Yellow spark particle
+            rasterize=rasterize,
         )
 
-    def create_success_effect(self, x: float, y: float):
-        """Create a success/celebration effect."""
+    def create_success_effect(self, x: float, y: float, rasterize: bool = False):
+        """Create a success/celebration effect, optionally splatted as points."""
         colors = [
             (100, 255, 100, 255),  # Green
             (255, 255, 100, 255),  # Yellow
@@ -309,56 +696,58 @@ class EnhancedParticleSystem:
                 speed_range=(80, 150),
                 life_range=(1.0, 2.0),
                 size_range=(3, 8),
+                rasterize=rasterize,
             )
 
     def update(self, dt: float):
         """Update all particles."""
-        particles_to_remove = []
+        bounds = None
+        if self.culling_enabled:
+            bounds = (
+                -self.culling_margin,
+                -self.culling_margin,
+                self.screen_width + self.culling_margin,
+                self.screen_height + self.culling_margin,
+            )
 
-        for particle in self.particles:
-            if not particle.update(dt):
-                particles_to_remove.append(particle)
-                self.stats["particles_expired"] += 1
-                continue
+        expired, culled = self.store.step(dt, bounds)
+        self.stats["particles_expired"] += expired
+        self.stats["particles_culled"] += culled
 
-            # Culling
-            if self.culling_enabled:
-                if (
-                    particle.x < -self.culling_margin
-                    or particle.x > self.screen_width + self.culling_margin
-                    or particle.y < -self.culling_margin
-                    or particle.y > self.screen_height + self.culling_margin
-                ):
-                    particles_to_remove.append(particle)
-                    self.stats["particles_culled"] += 1
-
-        # Remove inactive particles
-        for particle in particles_to_remove:
-            if particle in self.particles:
-                self.particles.remove(particle)
+        # Give back memory from a past peak once the system has been idle a while
+        if self.store.count:
+            self.idle_time = 0.0
+        else:
+            self.idle_time += dt
+            if self.idle_time >= self.idle_shrink_delay:
+                self.store.shrink()
 
     def draw(self, screen: pygame.Surface):
         """Draw all particles."""
-        self.stats["draw_calls"] = 0
-
-        for particle in self.particles:
-            particle.draw(screen, self.atlas_manager)
-            self.stats["draw_calls"] += 1
+        self.texture_cache.begin_frame()
+        self.stats["draw_calls"] = self.store.draw(
+            screen, self.atlas_manager, self.texture_cache, self.rasterizer
+        )
 
     def clear(self):
         """Clear all particles."""
-        self.particles.clear()
+        self.store.clear()
 
     def get_particle_count(self) -> int:
         """Get current number of active particles."""
-        return len(self.particles)
+        return self.store.count
 
     def get_stats(self) -> Dict[str, Any]:
         """Get particle system statistics."""
         return {
             **self.stats,
-            "active_particles": len(self.particles),
+            "active_particles": self.get_particle_count(),
             "max_particles": self.max_particles,
+            "capacity": self.store.capacity,
+            "high_water_mark": self.store.high_water_mark,
+            "allocations": self.store.allocations,
+            "texture_cache": self.texture_cache.get_stats(),
+            "rasterizer": self.rasterizer.get_stats(),
         }
 
     def reset_stats(self):
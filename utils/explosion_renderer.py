@@ -0,0 +1,158 @@
+"""
+Explosion Renderer for SS6 Super Student Game
+Pre-renders the expansion discs of each flame color once and blits them faded by age.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+START_RADIUS = 10  # Radius every explosion starts from
+EXPANSION_RATE = 0.1  # Fraction of the remaining distance covered each frame
+RADIUS_STEPS = 16  # Discs are shared by radii within 1/RADIUS_STEPS of each other
+MEMORY_BUDGET = 32 * 1024 * 1024  # Bytes of cached discs, enough for every flame color
+
+
+def expansion_radii(max_radius, duration, start_radius=START_RADIUS):
+    """Radius for every frame of an explosion, matching the per-frame easing."""
+    radii = []
+    radius = start_radius
+    for _ in range(duration):
+        radius += (max_radius - radius) * EXPANSION_RATE
+        radii.append(int(radius))
+    return radii
+
+
+def disc_radius(radius):
+    """Radius of the cached disc drawn for an explosion radius."""
+    step = max(1, radius // RADIUS_STEPS)
+    return max(1, radius // step * step)
+
+
+class ExplosionSpriteSheet:
+    """
+    Expansion and fade schedule for one flame color, maximum radius and duration.
+
+    Holds the radius, disc radius and alpha for every age. The discs
+    themselves are opaque and shared through the renderer's cache, and the
+    fade is applied as surface alpha at blit time, so explosions of one
+    color reuse each other's discs and the fade needs no extra surfaces.
+    """
+
+    def __init__(self, color, max_radius, duration):
+        self.color = tuple(color[:3])
+        self.max_radius = max_radius
+        self.duration = duration
+        self.radii = expansion_radii(max_radius, duration)
+        self.disc_radii = [disc_radius(radius) for radius in self.radii]
+        self.alphas = [int(255 * (duration - age) / duration) for age in range(duration)]
+
+    def age_index(self, age):
+        """Clamp an explosion's age to the schedule."""
+        return min(max(age, 0), self.duration - 1)
+
+
+class ExplosionRenderer:
+    """
+    Draws explosion dicts from cached discs instead of per-frame surfaces.
+
+    Discs are kept in an LRU bounded by memory_budget bytes rather than by
+    count, since one large disc can outweigh dozens of small ones.
+    """
+
+    def __init__(self, memory_budget=MEMORY_BUDGET):
+        self.memory_budget = memory_budget
+        self.sheets = {}
+        self.discs = OrderedDict()
+        self.cached_bytes = 0
+
+        # Metrics
+        self.sheets_built = 0
+        self.discs_built = 0
+        self.evictions = 0
+        self.frames_drawn = 0
+
+    def get_sheet(self, color, max_radius, duration):
+        """Get the schedule for an explosion type, building it on first use."""
+        key = (tuple(color[:3]), int(max_radius), int(duration))
+        sheet = self.sheets.get(key)
+        if sheet is None:
+            sheet = self.sheets[key] = ExplosionSpriteSheet(*key)
+            self.sheets_built += 1
+        return sheet
+
+    def get_disc(self, color, radius):
+        """Get the opaque disc for a color and radius, rendering it on a miss."""
+        key = (color, radius)
+        disc = self.discs.get(key)
+        if disc is not None:
+            self.discs.move_to_end(key)
+            return disc
+
+        disc = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(disc, (*color, 255), (radius, radius), radius)
+        if pygame.display.get_surface() is not None:
+            disc = disc.convert_alpha()  # Match the display format for faster blits
+        self.discs[key] = disc
+        self.discs_built += 1
+        self.cached_bytes += self._surface_bytes(disc)
+
+        # Keep the newest disc even if it alone exceeds the budget
+        while self.cached_bytes > self.memory_budget and len(self.discs) > 1:
+            _, evicted = self.discs.popitem(last=False)
+            self.cached_bytes -= self._surface_bytes(evicted)
+            self.evictions += 1
+        return disc
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def prewarm(self, colors, max_radius=270, duration=30):
+        """Render every disc for each color ahead of the first explosion."""
+        for color in colors:
+            sheet = self.get_sheet(color, max_radius, duration)
+            for radius in sorted(set(sheet.disc_radii)):
+                self.get_disc(sheet.color, radius)
+
+    def draw(self, surface, explosion, offset_x=0, offset_y=0):
+        """
+        Draw one explosion at its current age.
+
+        Args:
+            surface: Target surface
+            explosion: Explosion dict from create_explosion
+            offset_x: Screen shake x offset
+            offset_y: Screen shake y offset
+
+        Returns:
+            pygame.Rect: Area drawn
+        """
+        start_duration = explosion["start_duration"]
+        sheet = self.get_sheet(explosion["color"], explosion["max_radius"], start_duration)
+        age = sheet.age_index(start_duration - explosion["duration"])
+        explosion["radius"] = sheet.radii[age]
+        radius = sheet.disc_radii[age]
+        disc = self.get_disc(sheet.color, radius)
+        disc.set_alpha(sheet.alphas[age])
+        draw_x = int(explosion["x"] + offset_x)
+        draw_y = int(explosion["y"] + offset_y)
+        self.frames_drawn += 1
+        return surface.blit(disc, (draw_x - radius, draw_y - radius))
+
+    def clear(self):
+        """Drop every cached disc."""
+        self.discs.clear()
+        self.cached_bytes = 0
+
+    def get_stats(self):
+        """Get renderer statistics."""
+        return {
+            "sheets": len(self.sheets),
+            "sheets_built": self.sheets_built,
+            "discs": len(self.discs),
+            "discs_built": self.discs_built,
+            "evictions": self.evictions,
+            "frames_drawn": self.frames_drawn,
+            "cached_bytes": self.cached_bytes,
+        }
@@ -0,0 +1,135 @@
+"""
+Flame Renderer for SS6 Super Student Game
+Pre-renders flame puffs once and draws each flamethrower beam as one blits() batch.
+"""
+
+import math
+
+import numpy as np
+import pygame
+
+PUFF_SPACING = 15  # Pixels between puffs along a beam
+RADIUS_JITTER = 5  # Puff radius varies by up to this much either way
+POSITION_JITTER = 8  # Puff centers wander by up to this much on each axis
+GLOW_SCALE = 1.5  # Glow radius relative to the puff radius
+GLOW_ALPHA = 100
+
+
+class FlamePalette:
+    """
+    Pre-rendered puffs for one set of flame colors and widths.
+
+    Each puff bakes the translucent glow and the solid flame circle into one
+    per-pixel alpha surface, indexed by color and radius, so any jittered
+    puff a beam can draw already exists.
+    """
+
+    def __init__(self, colors, widths):
+        self.colors = [tuple(color[:3]) for color in colors]
+        self.base_radii = np.array([width // 4 for width in widths])
+        self.max_radius = int(self.base_radii.max()) + RADIUS_JITTER
+        self.puffs = [
+            [None] + [self._render(color, radius) for radius in range(1, self.max_radius + 1)]
+            for color in self.colors
+        ]
+
+    @staticmethod
+    def _render(color, radius):
+        """Draw the glow with the flame circle on top, centred on the surface."""
+        half = max(1, int(radius * GLOW_SCALE))
+        surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, GLOW_ALPHA), (half, half), half)
+        pygame.draw.circle(surface, (*color, 255), (half, half), radius)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()  # Match the display format for faster blits
+        return surface, half
+
+    def memory_bytes(self):
+        """Bytes held by rendered puffs."""
+        return sum(
+            surface.get_width() * surface.get_height() * surface.get_bytesize()
+            for row in self.puffs
+            for surface, _ in row[1:]
+        )
+
+
+class FlameRenderer:
+    """Draws flamethrower beams from pre-rendered puffs with vectorized jitter."""
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.palettes = {}
+
+        # Metrics
+        self.beams_drawn = 0
+        self.puffs_drawn = 0
+
+    def get_palette(self, colors, widths):
+        """Get the puffs for a set of colors and widths, rendering them on first use."""
+        key = (tuple(tuple(color[:3]) for color in colors), tuple(widths))
+        palette = self.palettes.get(key)
+        if palette is None:
+            palette = self.palettes[key] = FlamePalette(colors, widths)
+        return palette
+
+    def draw_beam(self, surface, start, end, colors, widths):
+        """
+        Draw one jittered flame beam.
+
+        Args:
+            surface: Target surface
+            start: Beam start (x, y) including any shake offset
+            end: Beam end (x, y) including any shake offset
+            colors: Flame colors to pick from
+            widths: Flame widths to pick from
+
+        Returns:
+            pygame.Rect: Area drawn, or None for a zero-length beam
+        """
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        distance = math.hypot(dx, dy)
+        if distance == 0:
+            return None
+
+        palette = self.get_palette(colors, widths)
+        count = max(1, int(distance // PUFF_SPACING))
+        rng = self.rng
+
+        # Puffs are evenly spaced from start to end, or centred for a single puff
+        t = np.linspace(0.0, 1.0, count) if count > 1 else np.array([0.5])
+        jitter = rng.integers(-POSITION_JITTER, POSITION_JITTER + 1, size=(2, count))
+        xs = (start[0] + t * dx).astype(int) + jitter[0]
+        ys = (start[1] + t * dy).astype(int) + jitter[1]
+
+        bases = palette.base_radii[rng.integers(len(palette.base_radii), size=count)]
+        radii = np.maximum(1, bases + rng.integers(-RADIUS_JITTER, RADIUS_JITTER + 1, size=count))
+        shades = rng.integers(len(palette.colors), size=count)
+
+        puffs = palette.puffs
+        batch = []
+        for x, y, shade, radius in zip(xs.tolist(), ys.tolist(), shades.tolist(), radii.tolist()):
+            puff, half = puffs[shade][radius]
+            batch.append((puff, (x - half, y - half)))
+        surface.blits(batch, doreturn=False)
+
+        self.beams_drawn += 1
+        self.puffs_drawn += count
+        reach = max(1, int(int(radii.max()) * GLOW_SCALE))
+        left = int(xs.min()) - reach
+        top = int(ys.min()) - reach
+        bounds = pygame.Rect(left, top, int(xs.max()) + reach - left, int(ys.max()) + reach - top)
+        return bounds.clip(surface.get_clip())
+
+    def clear(self):
+        """Drop every rendered palette."""
+        self.palettes.clear()
+
+    def get_stats(self):
+        """Get renderer statistics."""
+        return {
+            "palettes": len(self.palettes),
+            "beams_drawn": self.beams_drawn,
+            "puffs_drawn": self.puffs_drawn,
+            "cached_bytes": sum(palette.memory_bytes() for palette in self.palettes.values()),
+        }
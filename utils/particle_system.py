@@ -1,137 +1,226 @@
-import math
-import random
-
+import numpy as np
 import pygame
 
+from utils.texture_atlas import get_sprite_batcher
+
+
+class CircleSpriteRenderer:
+    """
+    Quantized alpha-circle sprites for particle drawing.
+
+    Draw requests are quantized to (color, radius, alpha bucket) keys so
+    nearby particles share one sprite. The sprites themselves are cached in
+    the sprite batcher's "particles" atlas under its byte budget.
+    """
+
+    def __init__(self, radius_step=4, alpha_buckets=4, color_step=4):
+        self.radius_step = radius_step
+        self.alpha_buckets = alpha_buckets
+        self.color_step = color_step
+        self.frame_allocations = 0  # Surfaces created since begin_frame()
+
+    def begin_frame(self):
+        """Start counting surface allocations for a new frame."""
+        self.frame_allocations = 0
+
+    def key(self, color, radius, alpha):
+        """Quantize a draw request to its sprite key."""
+        step = self.color_step
+        rgb = tuple(min(255, int(round(channel / step)) * step) for channel in color[:3])
+        radius = max(1, int(round(radius / self.radius_step)) * self.radius_step)
+        bucket = min(self.alpha_buckets - 1, alpha * self.alpha_buckets // 256)
+        return rgb, radius, bucket
+
+    def render(self, key):
+        """Render the sprite for a key."""
+        rgb, radius, bucket = key
+        # Render at the top of the alpha bucket so opaque particles stay opaque
+        bucket_alpha = min(255, (bucket + 1) * 256 // self.alpha_buckets)
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*rgb, bucket_alpha), (radius, radius), radius)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()  # Match the display format for faster blits
+        self.frame_allocations += 1
+        return sprite
+
 
 class ParticleManager:
-    """Manages particle effects with object pooling for performance."""
+    """
+    Manages particle effects in a preallocated structure-of-arrays store.
+
+    Live particles are packed into slots [0, count) of NumPy columns, so
+    creation appends in O(1) and each update moves, ages and culls every
+    particle with whole-array operations. Expired particles are dropped by
+    stable compaction, which keeps the drawing order of the survivors.
+    Single releases swap the last particle into the freed slot, and a full
+    store drops only its oldest particle, shifting the later ones down so
+    the drawing order holds.
+    """
 
     def __init__(self, max_particles=100):
         self.max_particles = max_particles
-        self.particles = []
-        self.particle_pool = []
+        self.count = 0
         self.culling_distance = 1920  # Default culling distance
-
-        # Pre-create particle pool for object reuse
-        for _ in range(max_particles):
-            self.particle_pool.append(
-                {
-                    "x": 0,
-                    "y": 0,
-                    "color": (0, 0, 0),
-                    "size": 0,
-                    "dx": 0,
-                    "dy": 0,
-                    "duration": 0,
-                    "start_duration": 0,
-                    "active": False,
-                }
-            )
+        self.sprite_renderer = CircleSpriteRenderer()
+        self.batcher = get_sprite_batcher()
+
+        # Preallocated particle columns
+        self.x = np.zeros(max_particles)
+        self.y = np.zeros(max_particles)
+        self.dx = np.zeros(max_particles)
+        self.dy = np.zeros(max_particles)
+        self.size = np.zeros(max_particles)
+        self.duration = np.zeros(max_particles)
+        self.start_duration = np.zeros(max_particles)
+        self.colors = np.empty(max_particles, dtype=object)
+        self._columns = (
+            self.x,
+            self.y,
+            self.dx,
+            self.dy,
+            self.size,
+            self.duration,
+            self.start_duration,
+            self.colors,
+        )
 
     def set_culling_distance(self, distance):
         """Set the distance at which to cull offscreen particles."""
         self.culling_distance = distance
 
     def get_particle(self):
-        """Get a particle from the pool."""
-        for particle in self.particle_pool:
-            if not particle["active"]:
-                particle["active"] = True
-                return particle
-        return None  # Pool exhausted
-
-    def release_particle(self, particle):
-        """Return a particle to the pool."""
-        if particle in self.particles:
-            self.particles.remove(particle)
-        particle["active"] = False
+        """
+        Reserve the next free slot.
+
+        Returns:
+            int: Slot index, valid until the next update or release, or None if full
+        """
+        if self.count >= self.max_particles:
+            return None  # Pool exhausted
+        slot = self.count
+        self.count += 1
+        return slot
+
+    def release_particle(self, slot):
+        """Remove the particle in a slot, moving the last particle into it."""
+        last = self.count - 1
+        if not 0 <= slot <= last:
+            return
+        if slot != last:
+            for column in self._columns:
+                column[slot] = column[last]
+        self.colors[last] = None
+        self.count = last
+
+    def evict_oldest(self):
+        """Remove the particle with the least remaining duration."""
+        count = self.count
+        if count == 0:
+            return
+        oldest = int(np.argmin(self.duration[:count]))
+        for column in self._columns:
+            column[oldest : count - 1] = column[oldest + 1 : count]
+        self.colors[count - 1] = None
+        self.count = count - 1
+
+    def _compact(self, keep):
+        """Pack the particles flagged in keep into the leading slots, in order."""
+        count = self.count
+        survivors = int(np.count_nonzero(keep))
+        for column in self._columns:
+            column[:survivors] = column[:count][keep]
+        self.colors[survivors:count] = None
+        self.count = survivors
 
     def create_particle(self, x, y, color, size, dx, dy, duration):
-        """Create a new particle effect."""
-        if len(self.particles) >= self.max_particles:
+        """Create a new particle effect and return its slot."""
+        if self.count >= self.max_particles:
             # Remove oldest particle if at limit
-            oldest = min(self.particles, key=lambda p: p["duration"])
-            self.release_particle(oldest)
-
-        particle = self.get_particle()
-        if particle:
-            particle.update(
-                {
-                    "x": x,
-                    "y": y,
-                    "color": color,
-                    "size": size,
-                    "dx": dx,
-                    "dy": dy,
-                    "duration": duration,
-                    "start_duration": duration,
-                    "active": True,
-                }
-            )
-            self.particles.append(particle)
-            return particle
-        return None
+            self.evict_oldest()
+
+        slot = self.get_particle()
+        if slot is None:
+            return None
+        self.x[slot] = x
+        self.y[slot] = y
+        self.colors[slot] = color
+        self.size[slot] = size
+        self.dx[slot] = dx
+        self.dy[slot] = dy
+        self.duration[slot] = duration
+        self.start_duration[slot] = duration
+        return slot
 
     def update(self):
         """Update all active particles."""
-        particles_to_remove = []
-
-        for particle in self.particles:
-            if not particle["active"]:
-                continue
-
-            # Update position
-            particle["x"] += particle["dx"]
-            particle["y"] += particle["dy"]
-
-            # Update duration
-            particle["duration"] -= 1
-
-            # Check if particle should be removed
-            if particle["duration"] <= 0:
-                particles_to_remove.append(particle)
-                continue
-
-            # Cull particles that are too far offscreen
-            if (
-                particle["x"] < -self.culling_distance
-                or particle["x"] > self.culling_distance * 2
-                or particle["y"] < -self.culling_distance
-                or particle["y"] > self.culling_distance * 2
-            ):
-                particles_to_remove.append(particle)
-
-        # Remove expired/culled particles
-        for particle in particles_to_remove:
-            self.release_particle(particle)
+        count = self.count
+        if count == 0:
+            return
+
+        x = self.x[:count]
+        y = self.y[:count]
+        x += self.dx[:count]
+        y += self.dy[:count]
+        duration = self.duration[:count]
+        duration -= 1
+
+        # Keep particles that are still alive and not too far offscreen
+        cull = self.culling_distance
+        keep = (duration > 0) & (x >= -cull) & (x <= cull * 2) & (y >= -cull) & (y <= cull * 2)
+        if not keep.all():
+            self._compact(keep)
 
     def draw(self, screen, offset_x=0, offset_y=0):
-        """Draw all active particles."""
-        for particle in self.particles:
-            if not particle["active"]:
+        """Draw all active particles in one atlas batch and return the rects they cover."""
+        sprite_renderer = self.sprite_renderer
+        sprite_renderer.begin_frame()
+        count = self.count
+        if count == 0:
+            return []
+
+        # Alpha fades with remaining duration
+        duration = self.duration[:count]
+        start_duration = self.start_duration[:count]
+        ratio = np.divide(duration, start_duration, out=np.ones(count), where=start_duration > 0)
+        alphas = np.clip((255 * ratio).astype(int), 0, 255).tolist()
+
+        draw_xs = (self.x[:count] + offset_x).astype(int).tolist()
+        draw_ys = (self.y[:count] + offset_y).astype(int).tolist()
+        sizes = self.size[:count].astype(int).tolist()
+
+        batcher = self.batcher
+        drawn = []
+        for color, size, alpha, draw_x, draw_y in zip(
+            self.colors[:count], sizes, alphas, draw_xs, draw_ys
+        ):
+            if size <= 0:
                 continue
 
-            # Calculate alpha based on remaining duration
-            if particle["start_duration"] > 0:
-                alpha_ratio = particle["duration"] / particle["start_duration"]
-                alpha = max(0, min(255, int(255 * alpha_ratio)))
-            else:
-                alpha = 255
-
-            # Create color with alpha
-            if len(particle["color"]) == 3:
-                color_with_alpha = (*particle["color"], alpha)
-            else:
-                color_with_alpha = particle["color"]
-
-            # Calculate draw position with offset
-            draw_x = int(particle["x"] + offset_x)
-            draw_y = int(particle["y"] + offset_y)
-            size = int(particle["size"])
-
-            if size > 0:
-                # Create surface with alpha for transparency
-                particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surface, color_with_alpha, (size, size), size)
-                screen.blit(particle_surface, (draw_x - size, draw_y - size))
+            # Colors that carry their own alpha keep it
+            if len(color) == 4:
+                alpha = color[3]
+
+            # Pre-rendered alpha circle from the particle atlas, centred on the particle
+            key = sprite_renderer.key(color, size, alpha)
+            drawn.append(
+                batcher.draw(
+                    "particles",
+                    ("particle", *key),
+                    lambda: sprite_renderer.render(key),
+                    center=(draw_x, draw_y),
+                )
+            )
+        batcher.flush(screen)
+        return drawn
+
+    def clear(self):
+        """Remove every particle."""
+        self.colors[: self.count] = None
+        self.count = 0
+
+    def get_stats(self):
+        """Get particle and sprite statistics; sprites are cached in the particle atlas."""
+        stats = self.batcher.atlas_stats("particles")
+        stats["surface_allocations_per_frame"] = self.sprite_renderer.frame_allocations
+        stats["particles"] = self.count
+        return stats
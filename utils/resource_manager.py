@@ -5,6 +5,16 @@ import pygame
 
 from Display_settings import FONT_SIZES
 from settings import BLACK, FLAME_COLORS, SEQUENCES, WHITE
+from utils.texture_atlas import GlyphAtlas, atlas_cache_key, get_atlas_manager
+
+FALLING_FONT_SIZE = 240  # Font size of falling letters and numbers
+FALLING_COLORS = [BLACK, (150, 150, 150)]  # Target and non-target colors
+FALLING_TEXT_MODES = ("alphabet", "numbers", "clcase")  # Modes whose objects fall as text
+
+
+def glyph_text(value):
+    """Text drawn for a sequence item; lowercase a is shown as alpha."""
+    return "α" if value == "a" else value
 
 
 class ResourceManager:
@@ -20,7 +30,7 @@ class ResourceManager:
 
         # Font caches for performance optimization
         self.center_target_cache = {}  # Cache for center target (size 900)
-        self.falling_object_cache = {}  # Cache for falling objects (size 240)
+        self.glyph_atlases = {}  # GlyphAtlas per (font size, color) for falling objects
         self.center_font = None  # Font for center target (size 900)
         self.falling_font = None  # Font for falling objects (size 240)
 
@@ -57,7 +67,7 @@ class ResourceManager:
 
         # Initialize performance-critical fonts
         self.center_font = pygame.font.Font(None, 900)  # Center target font
-        self.falling_font = pygame.font.Font(None, 240)  # Falling objects font
+        self.falling_font = pygame.font.Font(None, FALLING_FONT_SIZE)  # Falling objects font
 
         # Pre-cache commonly used text surfaces
         self._initialize_font_caches()
@@ -81,16 +91,18 @@ class ResourceManager:
 
         # Clear existing caches
         self.center_target_cache.clear()
-        self.falling_object_cache.clear()
+        self.glyph_atlases.clear()
 
         # Cache center target surfaces (size 900) for all game modes
         self._cache_center_targets()
 
-        # Cache falling object surfaces (size 240) for all game modes
-        self._cache_falling_objects()
+        # Glyph atlases for falling objects (size 240), one per color
+        for color in FALLING_COLORS:
+            self.get_glyph_atlas(FALLING_FONT_SIZE, color)
 
         print(
-            f"Font cache initialized: {len(self.center_target_cache)} center targets, {len(self.falling_object_cache)} falling objects"
+            f"Font cache initialized: {len(self.center_target_cache)} center targets, "
+            f"{self._glyph_count()} falling glyphs"
         )
 
     def _cache_center_targets(self):
@@ -117,27 +129,45 @@ class ResourceManager:
                         surface = self.center_font.render(display_char, True, color)
                         self.center_target_cache[cache_key] = surface
 
-    def _cache_falling_objects(self):
-        """Pre-render falling object text surfaces."""
-        # Colors for falling objects
-        falling_colors = [BLACK, (150, 150, 150)]  # Target and non-target colors
+    def get_glyph_atlas(self, size, color):
+        """
+        Get the glyph atlas for a font size and color, loading or building it once.
 
-        # Cache all sequences for falling objects
-        for mode, sequence in SEQUENCES.items():
-            if mode == "shapes":
-                continue  # Shapes don't use text for falling objects
+        The atlas covers every falling-object sequence, so modes that share a
+        character (alphabet and clcase) draw the same glyph.
+        """
+        key = (size, tuple(color))
+        glyph_atlas = self.glyph_atlases.get(key)
+        if glyph_atlas is not None:
+            return glyph_atlas
 
-            for item in sequence:
-                for color in falling_colors:
-                    # Handle special cases
-                    display_char = item
-                    if mode == "clcase" and item == "a":
-                        display_char = "α"
+        if size == FALLING_FONT_SIZE and self.falling_font is not None:
+            font = self.falling_font
+        else:
+            font = pygame.font.Font(None, size)
+        texts = sorted(
+            {glyph_text(item) for mode in FALLING_TEXT_MODES for item in SEQUENCES.get(mode, [])}
+        )
 
-                    cache_key = (mode, item, color)
-                    if cache_key not in self.falling_object_cache:
-                        surface = self.falling_font.render(display_char, True, color)
-                        self.falling_object_cache[cache_key] = surface
+        def build(atlas):
+            for text in texts:
+                atlas.add_texture(text, font.render(text, True, color))
+
+        name = f"glyphs_{size}_{'_'.join(str(channel) for channel in color)}"
+        render_params = {"size": size, "color": color, "texts": texts}
+        cache_key = atlas_cache_key([], self.display_mode, render_params)
+        atlas = get_atlas_manager().load_cached_atlas(name, cache_key, build)
+        glyph_atlas = GlyphAtlas(font, color, atlas)
+        self.glyph_atlases[key] = glyph_atlas
+        return glyph_atlas
+
+    def get_falling_glyph(self, item_value, color):
+        """Get the falling object glyph for a sequence item from the glyph atlas."""
+        return self.get_glyph_atlas(FALLING_FONT_SIZE, color).get(glyph_text(item_value))
+
+    def _glyph_count(self):
+        """Number of glyphs held across glyph atlases."""
+        return sum(len(glyph_atlas.glyphs) for glyph_atlas in self.glyph_atlases.values())
 
     def get_center_target_surface(self, mode, target_letter, color):
         """Get cached center target surface or render if not cached."""
@@ -157,36 +187,21 @@ class ResourceManager:
         self.center_target_cache[cache_key] = surface
         return surface
 
-    def get_falling_object_surface(self, mode, item_value, color):
-        """Get cached falling object surface or render if not cached."""
-        cache_key = (mode, item_value, color)
-
-        if cache_key in self.falling_object_cache:
-            return self.falling_object_cache[cache_key]
-
-        # Fallback: render on demand and cache
-        display_char = item_value
-        if mode == "clcase" and item_value == "a":
-            display_char = "α"
-
-        surface = self.falling_font.render(display_char, True, color)
-        self.falling_object_cache[cache_key] = surface
-        return surface
-
     def clear_caches(self):
         """Clear all font caches to free memory."""
         self.center_target_cache.clear()
-        self.falling_object_cache.clear()
+        self.glyph_atlases.clear()
         self.emoji_cache.clear()
 
     def get_cache_stats(self):
         """Get statistics about cache usage."""
         return {
             "center_targets": len(self.center_target_cache),
-            "falling_objects": len(self.falling_object_cache),
+            "falling_objects": self._glyph_count(),
+            "glyph_atlases": len(self.glyph_atlases),
             "emojis": len(self.emoji_cache),
             "total_cached_surfaces": len(self.center_target_cache)
-            + len(self.falling_object_cache)
+            + self._glyph_count()
             + len(self.emoji_cache),
         }
 
@@ -222,40 +237,47 @@ class ResourceManager:
         }
 
     def _initialize_emoji_caches(self):
-        """Pre-load and cache emoji surfaces for performance."""
+        """Pre-load emoji surfaces from the cached emoji atlas, building it on first launch."""
         if not self.assets_dir.exists():
             print(f"Warning: Emoji assets directory not found: {self.assets_dir}")
             return
 
         print("Loading emoji assets...")
-        loaded_count = 0
 
         # Calculate emoji size based on display mode
         emoji_size = self._get_emoji_size()
 
+        emoji_files = {}
         for letter, emojis in self.emoji_associations.items():
             for i, emoji_name in enumerate(emojis, 1):
                 filename = f"{letter}_{emoji_name}_{i}.png"
                 filepath = self.assets_dir / filename
-
                 if filepath.exists():
-                    try:
-                        # Load and scale emoji surface
-                        original_surface = pygame.image.load(str(filepath)).convert_alpha()
-                        # pygame.transform.smoothscale provides high-quality image scaling
-                        scaled_surface = pygame.transform.smoothscale(original_surface, emoji_size)
-
-                        # Cache the scaled surface
-                        cache_key = (letter, i)
-                        self.emoji_cache[cache_key] = scaled_surface
-                        loaded_count += 1
-
-                    except Exception as e:
-                        print(f"Warning: Failed to load emoji {filename}: {e}")
+                    emoji_files[(letter, i)] = filepath
                 else:
                     print(f"Warning: Emoji file not found: {filename}")
 
-        print(f"Loaded {loaded_count} emoji assets")
+        def build(atlas):
+            for (letter, i), filepath in emoji_files.items():
+                try:
+                    # Load and scale emoji surface
+                    original_surface = pygame.image.load(str(filepath)).convert_alpha()
+                    # pygame.transform.smoothscale provides high-quality image scaling
+                    scaled_surface = pygame.transform.smoothscale(original_surface, emoji_size)
+                    atlas.add_texture(f"{letter}_{i}", scaled_surface)
+                except Exception as e:
+                    print(f"Warning: Failed to load emoji {filepath.name}: {e}")
+
+        cache_key = atlas_cache_key(emoji_files.values(), self.display_mode, emoji_size)
+        atlas = get_atlas_manager().load_cached_atlas("emojis", cache_key, build)
+
+        # Cache emoji surfaces as views into the atlas
+        for letter, i in emoji_files:
+            surface = atlas.get_subsurface(f"{letter}_{i}")
+            if surface is not None:
+                self.emoji_cache[(letter, i)] = surface
+
+        print(f"Loaded {len(self.emoji_cache)} emoji assets")
 
     def _get_emoji_size(self):
         """Get emoji size based on display mode."""
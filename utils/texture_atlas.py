@@ -3,40 +3,142 @@ Texture Atlas System for SS6 Super Student Game
 Combines multiple textures into single surfaces for faster rendering.
 """
 
+import hashlib
 import json
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 
 import pygame
 
+# Built atlases are cached here, keyed by a hash of everything that went into them
+ATLAS_CACHE_DIR = Path(__file__).parent.parent / ".atlas_cache"
+ATLAS_CACHE_VERSION = 1  # Bump when the packer or image layout changes
+
+
+def atlas_cache_key(asset_paths: Iterable, display_mode: str, font_sizes: Any = None) -> str:
+    """
+    Hash the inputs of an atlas build.
+
+    Args:
+        asset_paths: Source image files; their names and contents are hashed
+        display_mode: Display mode the atlas was built for
+        font_sizes: Font sizes or other render parameters baked into the atlas
+
+    Returns:
+        Short hex digest naming the cached atlas files
+    """
+    digest = hashlib.sha1()
+    header = [ATLAS_CACHE_VERSION, pygame.version.ver, display_mode, font_sizes]
+    digest.update(json.dumps(header, sort_keys=True, default=str).encode())
+    for path in sorted(Path(path) for path in asset_paths):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes() if path.exists() else b"missing")
+    return digest.hexdigest()[:16]
+
 
 class TextureAtlas:
     """
     Texture atlas for combining multiple small textures into one large texture.
+
+    Textures are placed with a skyline bottom-left packer. When no page has
+    room the atlas grows by another page of the same size, up to max_pages.
+    Removed textures leave free rects that later textures of the same size
+    or smaller are packed into first.
     """
 
-    def __init__(self, width: int = 1024, height: int = 1024):
+    def __init__(self, width: int = 1024, height: int = 1024, max_pages: int = 8):
         """
         Initialize texture atlas.
 
         Args:
-            width: Atlas width in pixels
-            height: Atlas height in pixels
+            width: Page width in pixels
+            height: Page height in pixels
+            max_pages: Most pages the atlas may grow to
         """
         self.width = width
         self.height = height
-        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.surface = self.surface.convert_alpha()
-
-        self.regions: Dict[str, pygame.Rect] = {}
-        self.current_x = 0
-        self.current_y = 0
-        self.row_height = 0
+        self.max_pages = max_pages
+
+        self.pages: List[pygame.Surface] = []
+        self.skylines: List[List[List[int]]] = []  # Per page: [x, y, width] segments
+        self.free_rects: List[List[pygame.Rect]] = []  # Per page: space left by removals
+        self.page_counts: List[int] = []  # Per page: textures placed on it
+        self.regions: Dict[Hashable, pygame.Rect] = {}
+        self.region_pages: Dict[Hashable, int] = {}
+        self._add_page()
+
+    @property
+    def surface(self) -> pygame.Surface:
+        """The first page, for callers that predate multi-page atlases."""
+        return self.pages[0]
+
+    def _add_page(self) -> int:
+        """Append an empty page and return its index."""
+        page = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        self.pages.append(page)
+        self.skylines.append([[0, 0, self.width]])
+        self.free_rects.append([])
+        self.page_counts.append(0)
+        return len(self.pages) - 1
+
+    def _find_position(
+        self, skyline: List[List[int]], width: int, height: int
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Lowest (then leftmost) spot on a skyline that fits a texture.
 
-    def add_texture(self, name: str, texture: pygame.Surface) -> bool:
+        Returns:
+            Tuple of (y, x, segment index) or None if the page is full
+        """
+        best = None
+        for index, (x, _, _) in enumerate(skyline):
+            if x + width > self.width:
+                break
+            # Rest on the highest segment the texture spans
+            top = 0
+            remaining = width
+            span = index
+            while remaining > 0:
+                top = max(top, skyline[span][1])
+                remaining -= skyline[span][2]
+                span += 1
+            if top + height > self.height:
+                continue
+            if best is None or (top, x) < best[:2]:
+                best = (top, x, index)
+        return best
+
+    def _place(
+        self, skyline: List[List[int]], index: int, x: int, top: int, width: int, height: int
+    ):
+        """Raise the skyline over a placed texture and merge level segments."""
+        skyline.insert(index, [x, top + height, width])
+        right = x + width
+        span = index + 1
+        while span < len(skyline) and skyline[span][0] < right:
+            segment = skyline[span]
+            segment_right = segment[0] + segment[2]
+            if segment_right <= right:
+                del skyline[span]
+            else:
+                segment[0], segment[2] = right, segment_right - right
+                break
+
+        span = 0
+        while span < len(skyline) - 1:
+            if skyline[span][1] == skyline[span + 1][1]:
+                skyline[span][2] += skyline[span + 1][2]
+                del skyline[span + 1]
+            else:
+                span += 1
+
+    def add_texture(self, name: Hashable, texture: pygame.Surface) -> bool:
         """
-        Add a texture to the atlas.
+        Add a texture to the atlas, growing a page if none has room.
 
         Args:
             name: Unique name for the texture
@@ -48,56 +150,135 @@ class TextureAtlas:
         tex_width = texture.get_width()
         tex_height = texture.get_height()
 
-        # Check if texture fits in current row
-        if self.current_x + tex_width > self.width:
-            # Move to next row
-            self.current_x = 0
-            self.current_y += self.row_height
-            self.row_height = 0
-
-        # Check if texture fits in atlas at all
-        if self.current_x + tex_width > self.width or self.current_y + tex_height > self.height:
+        # Check if texture fits in a page at all
+        if tex_width > self.width or tex_height > self.height:
             return False
 
+        if self._add_to_free_rect(name, texture):
+            return True
+
+        for page_index, skyline in enumerate(self.skylines):
+            spot = self._find_position(skyline, tex_width, tex_height)
+            if spot is not None:
+                break
+        else:
+            if len(self.pages) >= self.max_pages:
+                return False
+            page_index = self._add_page()
+            spot = self._find_position(self.skylines[page_index], tex_width, tex_height)
+
+        top, x, index = spot
+        self._place(self.skylines[page_index], index, x, top, tex_width, tex_height)
+
         # Add texture to atlas
-        rect = pygame.Rect(self.current_x, self.current_y, tex_width, tex_height)
-        self.surface.blit(texture, rect)
+        rect = pygame.Rect(x, top, tex_width, tex_height)
+        self.pages[page_index].blit(texture, rect)
+        self.regions[name] = rect
+        self.region_pages[name] = page_index
+        self.page_counts[page_index] += 1
+
+        return True
+
+    def _add_to_free_rect(self, name: Hashable, texture: pygame.Surface) -> bool:
+        """Place a texture in the smallest free rect it fits, splitting off the rest."""
+        width, height = texture.get_size()
+        best = None
+        for page_index, free in enumerate(self.free_rects):
+            for index, rect in enumerate(free):
+                if rect.width >= width and rect.height >= height:
+                    if best is None or rect.width * rect.height < best[2].width * best[2].height:
+                        best = (page_index, index, rect)
+        if best is None:
+            return False
+
+        page_index, index, free_rect = best
+        free = self.free_rects[page_index]
+        del free[index]
+        rect = pygame.Rect(free_rect.topleft, (width, height))
+        # Guillotine split: the strip right of the texture, then everything below it
+        if free_rect.width > width:
+            free.append(pygame.Rect(rect.right, rect.top, free_rect.width - width, height))
+        if free_rect.height > height:
+            free.append(
+                pygame.Rect(free_rect.left, rect.bottom, free_rect.width, free_rect.height - height)
+            )
+
+        page = self.pages[page_index]
+        page.fill((0, 0, 0, 0), rect)
+        page.blit(texture, rect)
         self.regions[name] = rect
+        self.region_pages[name] = page_index
+        self.page_counts[page_index] += 1
+        return True
 
-        # Update position tracking
-        self.current_x += tex_width
-        self.row_height = max(self.row_height, tex_height)
+    def remove_texture(self, name: Hashable) -> bool:
+        """
+        Remove a texture, leaving its rect free for later textures.
 
+        Returns:
+            True if the texture was in the atlas
+        """
+        rect = self.regions.pop(name, None)
+        if rect is None:
+            return False
+        page_index = self.region_pages.pop(name)
+        self.page_counts[page_index] -= 1
+        if self.page_counts[page_index]:
+            self.free_rects[page_index].append(rect)
+        else:
+            # An emptied page is packed from scratch rather than from fragments
+            self.free_rects[page_index] = []
+            self.skylines[page_index] = [[0, 0, self.width]]
+            self.pages[page_index].fill((0, 0, 0, 0))
         return True
 
-    def get_texture_rect(self, name: str) -> Optional[pygame.Rect]:
-        """Get the rectangle for a named texture in the atlas."""
+    def get_texture_rect(self, name: Hashable) -> Optional[pygame.Rect]:
+        """Get the rectangle for a named texture in its page."""
         return self.regions.get(name)
 
-    def get_subsurface(self, name: str) -> Optional[pygame.Surface]:
-        """Get a subsurface for a named texture."""
+    def get_region(self, name: Hashable) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """Get the page surface and rectangle for a named texture."""
         rect = self.regions.get(name)
-        if rect:
-            return self.surface.subsurface(rect)
+        if rect is None:
+            return None
+        return self.pages[self.region_pages[name]], rect
+
+    def get_subsurface(self, name: Hashable) -> Optional[pygame.Surface]:
+        """Get a subsurface for a named texture."""
+        region = self.get_region(name)
+        if region:
+            page, rect = region
+            return page.subsurface(rect)
         return None
 
+    def used_fraction(self) -> float:
+        """Fraction of page area covered by textures."""
+        used = sum(rect.width * rect.height for rect in self.regions.values())
+        return used / (self.width * self.height * len(self.pages))
+
     def save_atlas(self, image_path: str, data_path: str):
         """
         Save atlas image and metadata.
 
+        Pages are stacked vertically in one image so loading is a single read.
+
         Args:
             image_path: Path to save atlas image
             data_path: Path to save atlas metadata JSON
         """
         # Save image
-        pygame.image.save(self.surface, image_path)
+        image = pygame.Surface((self.width, self.height * len(self.pages)), pygame.SRCALPHA)
+        for page_index, page in enumerate(self.pages):
+            image.blit(page, (0, page_index * self.height))
+        pygame.image.save(image, image_path)
 
         # Save metadata
         metadata = {
             "width": self.width,
             "height": self.height,
+            "pages": len(self.pages),
             "regions": {
-                name: [rect.x, rect.y, rect.width, rect.height]
+                name: [self.region_pages[name], rect.x, rect.y, rect.width, rect.height]
                 for name, rect in self.regions.items()
             },
         }
@@ -118,7 +299,9 @@ class TextureAtlas:
         """
         try:
             # Load image
-            self.surface = pygame.image.load(image_path).convert_alpha()
+            image = pygame.image.load(image_path)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
 
             # Load metadata
             with open(data_path, "r") as f:
@@ -126,11 +309,26 @@ class TextureAtlas:
 
             self.width = metadata["width"]
             self.height = metadata["height"]
+            page_count = metadata.get("pages", 1)
 
-            # Reconstruct regions
+            # Pages are views into the one loaded image; they count as full
+            self.pages = [
+                image.subsurface((0, page_index * self.height, self.width, self.height))
+                for page_index in range(page_count)
+            ]
+            self.skylines = [[[0, self.height, self.width]] for _ in range(page_count)]
+            self.free_rects = [[] for _ in range(page_count)]
+
+            # Reconstruct regions (single-page atlases stored [x, y, w, h])
             self.regions = {}
+            self.region_pages = {}
             for name, rect_data in metadata["regions"].items():
-                self.regions[name] = pygame.Rect(*rect_data)
+                page_index = rect_data[0] if len(rect_data) == 5 else 0
+                self.regions[name] = pygame.Rect(*rect_data[-4:])
+                self.region_pages[name] = page_index
+            self.page_counts = [0] * page_count
+            for page_index in self.region_pages.values():
+                self.page_counts[page_index] += 1
 
             return True
 
@@ -139,14 +337,63 @@ class TextureAtlas:
             return False
 
 
+class GlyphAtlas:
+    """
+    Glyphs of one font size and color in a texture atlas, looked up by text.
+
+    Glyphs already in the atlas (for example loaded from the disk cache) are
+    used as is; anything else is rendered and packed on first use.
+    """
+
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        color: Tuple[int, int, int],
+        atlas: Optional[TextureAtlas] = None,
+    ):
+        """
+        Initialize glyph atlas.
+
+        Args:
+            font: Font the glyphs are rendered with
+            color: Glyph color
+            atlas: Atlas holding pre-rendered glyphs, a new one if None
+        """
+        self.font = font
+        self.color = tuple(color)
+        self.atlas = atlas or TextureAtlas()
+        self.glyphs: Dict[str, pygame.Surface] = {
+            text: self.atlas.get_subsurface(text) for text in self.atlas.regions
+        }
+
+        # Metrics
+        self.misses = 0
+
+    def get(self, text: str) -> pygame.Surface:
+        """Get the glyph surface for text, rendering it on a miss."""
+        glyph = self.glyphs.get(text)
+        if glyph is None:
+            self.misses += 1
+            glyph = self.font.render(text, True, self.color)
+            if self.atlas.add_texture(text, glyph):
+                glyph = self.atlas.get_subsurface(text)
+            self.glyphs[text] = glyph
+        return glyph
+
+
 class AtlasManager:
     """
     Manages multiple texture atlases for the game.
     """
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None):
         self.atlases: Dict[str, TextureAtlas] = {}
         self.texture_cache: Dict[str, pygame.Surface] = {}
+        self.cache_dir = Path(cache_dir) if cache_dir else ATLAS_CACHE_DIR
+
+        # Metrics
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def create_atlas(self, name: str, width: int = 1024, height: int = 1024) -> TextureAtlas:
         """Create a new texture atlas."""
@@ -154,6 +401,52 @@ class AtlasManager:
         self.atlases[name] = atlas
         return atlas
 
+    def load_cached_atlas(
+        self,
+        name: str,
+        cache_key: str,
+        build: Callable[[TextureAtlas], None],
+        width: int = 1024,
+        height: int = 1024,
+    ) -> TextureAtlas:
+        """
+        Load an atlas from the disk cache, building and caching it on a miss.
+
+        Args:
+            name: Atlas name
+            cache_key: Digest of the atlas inputs, see atlas_cache_key
+            build: Fills an empty atlas; texture names must be strings
+            width: Page width for a fresh build
+            height: Page height for a fresh build
+
+        Returns:
+            The loaded or freshly built atlas
+        """
+        image_path = self.cache_dir / f"{name}_{cache_key}_atlas.png"
+        data_path = self.cache_dir / f"{name}_{cache_key}_atlas.json"
+
+        atlas = TextureAtlas(width, height)
+        if image_path.exists() and data_path.exists() and atlas.load_atlas(
+            str(image_path), str(data_path)
+        ):
+            self.cache_hits += 1
+        else:
+            atlas = TextureAtlas(width, height)
+            build(atlas)
+            self.cache_misses += 1
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                # Drop builds of this atlas made from older inputs
+                for stale in self.cache_dir.glob(f"{name}_*_atlas.*"):
+                    stale.unlink()
+                atlas.save_atlas(str(image_path), str(data_path))
+            except (OSError, pygame.error) as e:
+                print(f"Warning: Could not cache atlas {name}: {e}")
+
+        self.atlases[name] = atlas
+        self.texture_cache[f"{name}_atlas"] = atlas.surface
+        return atlas
+
     def get_atlas(self, name: str) -> Optional[TextureAtlas]:
         """Get an atlas by name."""
         return self.atlases.get(name)
@@ -338,10 +631,306 @@ class AtlasManager:
                     self.texture_cache[f"{atlas_name}_atlas"] = atlas.surface
 
 
+# Page size of each batched atlas; sprites larger than a page are blitted on their own
+BATCH_ATLAS_SIZES = {"particles": 1024, "glyphs": 2048, "emojis": 2048}
+DEFAULT_BATCH_ATLAS_SIZE = 1024
+BATCH_ATLAS_MAX_PAGES = 4  # Default page cap of a batched atlas
+# Sprite bytes a batched atlas may hold before its least recently drawn sprites are
+# evicted; hit bursts alone keep about 8 MB of particle sprites in use
+BATCH_ATLAS_BUDGETS = {"particles": 24 * 1024 * 1024}
+
+
+def render_circle(color: Tuple[int, int, int], radius: int, alpha: int = 255) -> pygame.Surface:
+    """Render a filled circle with baked alpha, centred on a 2r x 2r surface."""
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius)
+    return surface
+
+
+def fade_surface(surface: pygame.Surface, alpha: int) -> pygame.Surface:
+    """Copy of a per-pixel alpha surface with its alpha scaled by alpha / 255."""
+    faded = surface.convert_alpha() if pygame.display.get_surface() else surface.copy()
+    faded.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    return faded
+
+
+class SpriteBatcher:
+    """
+    Batches sprite draws into one Surface.blits() call per atlas page.
+
+    Sprites are rendered into a named atlas on first use. Draws queue
+    (page, dest, area) entries and flush() submits each page's queue in a
+    single call, pages in the order they were first drawn from this batch.
+    Callers flush at layer boundaries so later layers still draw on top.
+
+    Each atlas holds at most its byte budget of sprites; when a new sprite
+    does not fit, the least recently drawn sprites not queued for the next
+    flush are evicted and their space reused. Sprites too large for a page
+    are kept beside the atlas and count against the same budget.
+    """
+
+    def __init__(
+        self,
+        atlas_sizes: Optional[Dict[str, int]] = None,
+        atlas_budgets: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the sprite batcher.
+
+        Args:
+            atlas_sizes: Page size overrides by atlas name
+            atlas_budgets: Sprite byte budget overrides by atlas name; the
+                default is BATCH_ATLAS_MAX_PAGES full pages
+        """
+        self.atlas_sizes = dict(BATCH_ATLAS_SIZES, **(atlas_sizes or {}))
+        self.atlas_budgets = dict(BATCH_ATLAS_BUDGETS, **(atlas_budgets or {}))
+        self.atlases: Dict[str, TextureAtlas] = {}
+        self.oversized: Dict[str, Dict[Hashable, pygame.Surface]] = {}  # Atlas -> key -> sprite
+        self.queue: Dict[pygame.Surface, List[Tuple]] = {}
+        self.recent: Dict[str, OrderedDict] = {}  # Atlas -> sprite key -> bytes, oldest first
+        self.cached_bytes: Dict[str, int] = {}
+        self.queued_keys = set()  # (atlas, key) drawn since the last flush; never evicted
+        self.counters: Dict[str, Dict[str, int]] = {}  # Atlas -> hits, misses, evictions
+
+        # Metrics
+        self.sprites_rendered = 0
+        self.atlas_resets = 0
+        self.frames = 0
+        self.frame_batches = 0
+        self.frame_blits = 0
+        self.last_frame_batches = 0
+        self.last_frame_blits = 0
+        self.total_batches = 0
+        self.total_blits = 0
+
+    def _budget(self, atlas_name: str) -> int:
+        """Sprite byte budget of an atlas."""
+        size = self.atlas_sizes.get(atlas_name, DEFAULT_BATCH_ATLAS_SIZE)
+        return self.atlas_budgets.get(atlas_name, size * size * 4 * BATCH_ATLAS_MAX_PAGES)
+
+    def _new_atlas(self, atlas_name: str) -> TextureAtlas:
+        """Start an empty atlas with enough pages for its budget."""
+        size = self.atlas_sizes.get(atlas_name, DEFAULT_BATCH_ATLAS_SIZE)
+        # One page beyond the budget absorbs packing waste
+        max_pages = -(-self._budget(atlas_name) // (size * size * 4)) + 1
+        atlas = TextureAtlas(size, size, max_pages=max_pages)
+        self.atlases[atlas_name] = atlas
+        self.oversized[atlas_name] = {}
+        self.recent[atlas_name] = OrderedDict()
+        self.cached_bytes[atlas_name] = 0
+        self.counters.setdefault(atlas_name, {"hits": 0, "misses": 0, "evictions": 0})
+        return atlas
+
+    def _evict(self, atlas_name: str) -> bool:
+        """Drop the least recently drawn sprite that is not queued for the next flush."""
+        recent = self.recent[atlas_name]
+        for key in recent:
+            if (atlas_name, key) not in self.queued_keys:
+                if self.oversized[atlas_name].pop(key, None) is None:
+                    self.atlases[atlas_name].remove_texture(key)
+                self.cached_bytes[atlas_name] -= recent.pop(key)
+                self.counters[atlas_name]["evictions"] += 1
+                return True
+        return False
+
+    def _region(
+        self, atlas_name: str, key: Hashable, render: Callable[[], pygame.Surface]
+    ) -> Tuple[pygame.Surface, Optional[pygame.Rect]]:
+        """Find a sprite's atlas surface and region, rendering it on first use."""
+        atlas = self.atlases.get(atlas_name) or self._new_atlas(atlas_name)
+        counters = self.counters[atlas_name]
+        region = atlas.get_region(key)
+        if region is not None:
+            counters["hits"] += 1
+            self.recent[atlas_name].move_to_end(key)
+            self.queued_keys.add((atlas_name, key))
+            return region
+        texture = self.oversized[atlas_name].get(key)
+        if texture is not None:
+            counters["hits"] += 1
+            self.recent[atlas_name].move_to_end(key)
+            self.queued_keys.add((atlas_name, key))
+            return texture, None
+
+        texture = render()
+        self.sprites_rendered += 1
+        counters["misses"] += 1
+        size = texture.get_width() * texture.get_height() * 4
+        budget = self._budget(atlas_name)
+        if texture.get_width() > atlas.width or texture.get_height() > atlas.height:
+            # Never fits a page; keep it beside the atlas and blit it on its own
+            if size > budget:
+                return texture, None  # Larger than the whole budget: draw it uncached
+            while self.cached_bytes[atlas_name] + size > budget:
+                if not self._evict(atlas_name):
+                    return texture, None  # The rest is queued this frame: draw it uncached
+            self.oversized[atlas_name][key] = texture
+            self.recent[atlas_name][key] = size
+            self.cached_bytes[atlas_name] += size
+            self.queued_keys.add((atlas_name, key))
+            return texture, None
+
+        while not (
+            self.cached_bytes[atlas_name] + size <= budget and atlas.add_texture(key, texture)
+        ):
+            if not self._evict(atlas_name):
+                # Only sprites queued this frame are left: start over, they keep the old pages
+                counters["evictions"] += len(self.recent[atlas_name])
+                self.atlas_resets += 1
+                atlas = self._new_atlas(atlas_name)
+                atlas.add_texture(key, texture)
+                break
+        self.recent[atlas_name][key] = size
+        self.cached_bytes[atlas_name] += size
+        self.queued_keys.add((atlas_name, key))
+        return atlas.get_region(key)
+
+    def draw(
+        self,
+        atlas_name: str,
+        key: Hashable,
+        render: Callable[[], pygame.Surface],
+        dest: Tuple[int, int] = (0, 0),
+        center: Optional[Tuple[int, int]] = None,
+    ) -> pygame.Rect:
+        """
+        Queue a sprite for the next flush.
+
+        Args:
+            atlas_name: Atlas the sprite lives in
+            key: Unique sprite key within the atlas
+            render: Called once to render the sprite when the key is new
+            dest: Top-left destination
+            center: Destination centre, overrides dest
+
+        Returns:
+            pygame.Rect: Area the sprite will cover
+        """
+        source, area = self._region(atlas_name, key, render)
+        return self._enqueue(source, area, dest, center)
+
+    def _enqueue(self, source, area, dest, center) -> pygame.Rect:
+        """Queue one blit from a page (or whole surface when area is None)."""
+        rect = pygame.Rect((0, 0), area.size if area else source.get_size())
+        if center is not None:
+            rect.center = center
+        else:
+            rect.topleft = dest
+        self.queue.setdefault(source, []).append((source, rect.topleft, area))
+        return rect
+
+    def draw_circle(
+        self,
+        color: Tuple[int, ...],
+        radius: int,
+        center: Tuple[int, int],
+        alpha: int = 255,
+        atlas_name: str = "particles",
+    ) -> pygame.Rect:
+        """Queue a filled circle with baked alpha, centred on center."""
+        rgb = tuple(color[:3])
+        return self.draw(
+            atlas_name,
+            ("circle", rgb, radius, alpha),
+            lambda: render_circle(rgb, radius, alpha),
+            center=center,
+        )
+
+    def draw_surface(
+        self,
+        atlas_name: str,
+        surface: pygame.Surface,
+        dest: Tuple[int, int] = (0, 0),
+        center: Optional[Tuple[int, int]] = None,
+        alpha: int = 255,
+    ) -> pygame.Rect:
+        """
+        Queue an existing surface, copied into the atlas on first use.
+
+        Subsurfaces of an atlas page, such as the cached emoji atlas, are drawn
+        straight from their page without a copy.
+        """
+        page = surface.get_abs_parent()
+        if page is not surface and alpha == 255:
+            area = pygame.Rect(surface.get_abs_offset(), surface.get_size())
+            return self._enqueue(page, area, dest, center)
+
+        render = (lambda: surface) if alpha == 255 else (lambda: fade_surface(surface, alpha))
+        return self.draw(atlas_name, ("surface", surface, alpha), render, dest, center)
+
+    def flush(self, target: pygame.Surface):
+        """Submit every queued draw, one blits() call per atlas."""
+        for batch in self.queue.values():
+            target.blits(batch, doreturn=False)
+            self.frame_batches += 1
+            self.frame_blits += len(batch)
+        self.queue.clear()
+        self.queued_keys.clear()
+
+    def end_frame(self):
+        """Record this frame's batch and blit counts and start the next frame."""
+        self.frames += 1
+        self.last_frame_batches = self.frame_batches
+        self.last_frame_blits = self.frame_blits
+        self.total_batches += self.frame_batches
+        self.total_blits += self.frame_blits
+        self.frame_batches = 0
+        self.frame_blits = 0
+
+    def clear(self):
+        """Drop every atlas page and pending draw."""
+        self.atlases.clear()
+        self.oversized.clear()
+        self.queue.clear()
+        self.recent.clear()
+        self.cached_bytes.clear()
+        self.queued_keys.clear()
+        self.counters.clear()
+
+    def atlas_stats(self, atlas_name: str) -> Dict:
+        """Sprite cache statistics of one atlas."""
+        counters = self.counters.get(atlas_name, {"hits": 0, "misses": 0, "evictions": 0})
+        lookups = counters["hits"] + counters["misses"]
+        atlas = self.atlases.get(atlas_name)
+        return {
+            "sprites": len(atlas.regions) if atlas else 0,
+            "pages": len(atlas.pages) if atlas else 0,
+            "oversized": len(self.oversized.get(atlas_name, ())),
+            "cached_bytes": self.cached_bytes.get(atlas_name, 0),
+            "budget_bytes": self._budget(atlas_name),
+            **counters,
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+        }
+
+    def get_stats(self) -> Dict:
+        """Get batching statistics."""
+        frames = max(1, self.frames)
+        return {
+            "atlases": len(self.atlases),
+            "pages": sum(len(atlas.pages) for atlas in self.atlases.values()),
+            "sprites": sum(len(atlas.regions) for atlas in self.atlases.values()),
+            "sprites_rendered": self.sprites_rendered,
+            "evictions": sum(counters["evictions"] for counters in self.counters.values()),
+            "atlas_resets": self.atlas_resets,
+            "batches_per_frame": self.last_frame_batches,
+            "blits_per_frame": self.last_frame_blits,
+            "avg_batches_per_frame": self.total_batches / frames,
+            "avg_blits_per_frame": self.total_blits / frames,
+        }
+
+
 # Global atlas manager instance
 atlas_manager = AtlasManager()
 
+# Global sprite batcher shared by the managers and levels
+sprite_batcher = SpriteBatcher()
+
 
 def get_atlas_manager() -> AtlasManager:
     """Get the global atlas manager instance."""
     return atlas_manager
+
+
+def get_sprite_batcher() -> SpriteBatcher:
+    """Get the global sprite batcher instance."""
+    return sprite_batcher